@@ -30,7 +30,7 @@ import logging
 import sys
 import time
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from tqdm import tqdm
 
@@ -57,7 +57,7 @@ ENRICHER_LANGUAGE_MAP = {
 }
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     """Parse command-line arguments."""
     parser = argparse.ArgumentParser(
         description="Enrich vocabulary items with LLM-generated content",
@@ -183,7 +183,7 @@ Examples:
         help="Skip translation service (examples will have no translations)",
     )
 
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 def get_enricher_class(enricher_name: str) -> BaseEnricher:
@@ -289,9 +289,14 @@ def enrich_single_item(
         return None
 
 
-def main() -> int:
-    """Main CLI entry point."""
-    args = parse_args()
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main CLI entry point.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:]), so the CLI
+            can also be run in-process
+    """
+    args = parse_args(argv)
 
     # Setup logging
     configure_logging(
@@ -68,11 +68,12 @@ import logging
 import os
 import sys
 from pathlib import Path
+from typing import Union
 
 from havachat.generators.content_generator import ContentGenerator
 from havachat.utils.llm_client import LLMClient
 from havachat.utils.usage_tracker import UsageTracker
-from havachat.validators.schema import LevelSystem
+from havachat.validators.schema import ContentUnit, LevelSystem
 from src.pipeline.validators.llm_judge import LLMJudge
 from src.pipeline.utils.notion_client import NotionClient, NotionSchemaError
 from src.pipeline.utils.notion_mapping_manager import NotionMappingManager
@@ -377,77 +378,38 @@ def main():
                     notion_client.validate_database_schema()
                     mapping_manager = NotionMappingManager()
                     
-                    # Push conversations
-                    for conversation in batch.conversations:
-                        try:
-                            # Skip if already pushed
-                            if mapping_manager.get_notion_page_id(conversation.id):
-                                logger.info(f"Already in Notion: {conversation.title}")
-                                continue
-                                
-                            notion_page_id = notion_client.push_conversation(
-                                content_id=conversation.id,
-                                content_type="conversation",
-                                title=conversation.title,
-                                description=conversation.description or "",
-                                topic=conversation.topic_name,
-                                scenario=conversation.scenario_name,
-                                segments=[seg.model_dump() for seg in conversation.segments],
-                                llm_evaluation=conversation.llm_judge_evaluation,
-                                language=args.language,
-                                level=args.level
-                            )
-                            
-                            # Add mapping
-                            mapping_manager.add_mapping(
-                                content_id=conversation.id,
-                                notion_page_id=notion_page_id,
-                                language=args.language,
-                                level=args.level,
-                                content_type="conversation",
-                                title=conversation.title
-                            )
-                            
-                            logger.info(f"Pushed to Notion: {conversation.title}")
-                            
-                        except Exception as e:
-                            logger.error(f"Failed to push {conversation.title}: {e}")
+                    # Push conversations and stories not already in Notion
+                    # concurrently; each mapping is saved as soon as its push
+                    # finishes, so an interrupted run does not push duplicates
+                    to_push = []
+                    for content_unit in batch.conversations + batch.stories:
+                        if mapping_manager.get_notion_page_id(content_unit.id):
+                            logger.info(f"Already in Notion: {content_unit.title}")
+                        else:
+                            to_push.append(content_unit)
                     
-                    # Push stories
-                    for story in batch.stories:
+                    def record_push(content_unit: ContentUnit, result: Union[str, Exception]) -> None:
+                        if isinstance(result, Exception):
+                            logger.error(f"Failed to push {content_unit.title}: {result}")
+                            return
+                        
                         try:
-                            # Skip if already pushed
-                            if mapping_manager.get_notion_page_id(story.id):
-                                logger.info(f"Already in Notion: {story.title}")
-                                continue
-                                
-                            notion_page_id = notion_client.push_conversation(
-                                content_id=story.id,
-                                content_type="story",
-                                title=story.title,
-                                description=story.description or "",
-                                topic=story.topic_name,
-                                scenario=story.scenario_name,
-                                segments=[seg.model_dump() for seg in story.segments],
-                                llm_evaluation=story.llm_judge_evaluation,
-                                language=args.language,
-                                level=args.level
-                            )
-                            
                             # Add mapping
                             mapping_manager.add_mapping(
-                                content_id=story.id,
-                                notion_page_id=notion_page_id,
+                                content_id=content_unit.id,
+                                notion_page_id=result,
                                 language=args.language,
                                 level=args.level,
-                                content_type="story",
-                                title=story.title
+                                content_type=content_unit.type.value,
+                                title=content_unit.title
                             )
-                            
-                            logger.info(f"Pushed to Notion: {story.title}")
-                            
                         except Exception as e:
-                            logger.error(f"Failed to push {story.title}: {e}")
+                            logger.error(f"Pushed {content_unit.title} but failed to save mapping: {e}")
+                            return
+                        
+                        logger.info(f"Pushed to Notion: {content_unit.title}")
+                    
+                    notion_client.push_conversations(to_push, on_result=record_push)
                             
                     logger.info("Notion push completed")
                     
@@ -103,10 +103,9 @@ def load_learning_items_from_dir(source_dir: Path) -> List[LearningItem]:
     
     for json_file in json_files:
         try:
-            with open(json_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                item = LearningItem(**data)
-                items.append(item)
+            # Parse and validate in pydantic-core, no intermediate dict
+            item = LearningItem.model_validate_json(json_file.read_bytes())
+            items.append(item)
         except Exception as e:
             logger.warning(f"Failed to load {json_file}: {e}")
             continue
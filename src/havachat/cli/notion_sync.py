@@ -14,15 +14,24 @@ import json
 import logging
 import os
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Collection, Dict, List, Optional, Set, Tuple
 
+from havachat.utils.file_io import read_json_mmap, write_bytes_atomic
 from havachat.utils.llm_client import LLMClient
 from src.pipeline.utils.notion_client import NotionClient, NotionSchemaError
 from src.pipeline.utils.notion_mapping_manager import NotionMappingManager
 from src.models.notion_mapping import NotionMapping
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -31,6 +40,15 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _write_json(data: List[Dict], file_path: Path) -> None:
+    """Write content/usage JSON with 2-space indent, keeping non-ASCII text as-is."""
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    write_bytes_atomic(payload, file_path)
+
+
 class NotionSyncCLI:
     """CLI for synchronizing Notion database with local content."""
     
@@ -89,16 +107,35 @@ class NotionSyncCLI:
                     
             logger.info(f"Ready for Audio: {len(ready_for_audio)}, Rejected: {len(rejected)}")
             
-            # Process each group
-            if ready_for_audio:
-                logger.info("Processing 'Ready for Audio' items...")
-                for page in ready_for_audio:
-                    self._process_ready_for_audio(page)
-                    
-            if rejected:
-                logger.info("Processing 'Rejected' items...")
-                for page in rejected:
-                    self._process_rejected(page)
+            # Process each group, writing the mapping file once at the end
+            with self.mapping_manager.batch():
+                if ready_for_audio:
+                    logger.info("Processing 'Ready for Audio' items...")
+                    for page in ready_for_audio:
+                        self._process_ready_for_audio(page)
+                        
+                if rejected:
+                    logger.info("Processing 'Rejected' items...")
+                    usage_decrements: Dict[Tuple[str, str], Counter] = {}
+                    rejected_ids: Dict[Tuple[str, str, str], Set[str]] = {}
+                    for page in rejected:
+                        self._process_rejected(page, usage_decrements, rejected_ids)
+                        
+                    # Rewrite each content and usage_stats.json file once; the
+                    # files are independent, so write them concurrently
+                    with ThreadPoolExecutor(max_workers=4) as pool:
+                        writes = [
+                            pool.submit(
+                                self._update_local_statuses,
+                                language, level, content_type, content_ids, "rejected"
+                            )
+                            for (language, level, content_type), content_ids in rejected_ids.items()
+                        ] + [
+                            pool.submit(self._apply_usage_decrements, language, level, decrements)
+                            for (language, level), decrements in usage_decrements.items()
+                        ]
+                        for write in writes:
+                            write.result()
                     
             logger.info("Notion sync completed")
             
@@ -168,12 +205,21 @@ class NotionSyncCLI:
         else:
             logger.error(f"Failed to generate audio for: {title}")
             
-    def _process_rejected(self, page: Dict) -> None:
+    def _process_rejected(
+        self,
+        page: Dict,
+        usage_decrements: Optional[Dict[Tuple[str, str], Counter]] = None,
+        rejected_ids: Optional[Dict[Tuple[str, str, str], Set[str]]] = None
+    ) -> None:
         """
         Process page marked "Rejected".
         
         Args:
             page: Page data from Notion
+            usage_decrements: If given, collect usage stat decrements here per
+                (language, level) instead of rewriting usage_stats.json now
+            rejected_ids: If given, collect content IDs here per (language,
+                level, type) instead of rewriting the content file now
         """
         notion_page_id = page["notion_page_id"]
         title = page["title"]
@@ -193,20 +239,28 @@ class NotionSyncCLI:
             return
             
         # Update local content status
-        self._update_local_status(
-            language=mapping.language,
-            level=mapping.level,
-            content_type=mapping.type,
-            content_id=content_id,
-            new_status="rejected"
-        )
+        if rejected_ids is None:
+            self._update_local_status(
+                language=mapping.language,
+                level=mapping.level,
+                content_type=mapping.type,
+                content_id=content_id,
+                new_status="rejected"
+            )
+        else:
+            rejected_ids.setdefault((mapping.language, mapping.level, mapping.type), set()).add(content_id)
         
         # Decrement usage stats for learning items
-        self._decrement_usage_stats(
-            language=mapping.language,
-            level=mapping.level,
-            content_id=content_id
-        )
+        if usage_decrements is None:
+            self._decrement_usage_stats(
+                language=mapping.language,
+                level=mapping.level,
+                content_id=content_id
+            )
+        else:
+            usage_decrements.setdefault((mapping.language, mapping.level), Counter()).update(
+                set(self._find_learning_item_ids(mapping.language, mapping.level, content_id))
+            )
         
         # Update mapping
         self.mapping_manager.update_sync_status(
@@ -245,8 +299,7 @@ class NotionSyncCLI:
             return None
             
         try:
-            with open(file_path, "r") as f:
-                content_units = json.load(f)
+            content_units = read_json_mmap(file_path)
                 
             # Find content unit by ID
             for unit in content_units:
@@ -278,6 +331,26 @@ class NotionSyncCLI:
             content_id: Content UUID
             new_status: New status value
         """
+        self._update_local_statuses(language, level, content_type, {content_id}, new_status)
+        
+    def _update_local_statuses(
+        self,
+        language: str,
+        level: str,
+        content_type: str,
+        content_ids: Collection[str],
+        new_status: str
+    ) -> None:
+        """
+        Update the status field of several content units with one file write.
+        
+        Args:
+            language: Language code
+            level: Level code
+            content_type: "conversation" or "story"
+            content_ids: Content UUIDs
+            new_status: New status value
+        """
         filename = f"{content_type}s.json"
         file_path = self.data_root / language / level / filename
         
@@ -287,24 +360,24 @@ class NotionSyncCLI:
             
         try:
             # Load current data
-            with open(file_path, "r") as f:
-                content_units = json.load(f)
+            content_units = read_json_mmap(file_path)
                 
             # Update status
-            updated = False
+            updated_at = datetime.now().isoformat()
+            updated = set()
             for unit in content_units:
-                if unit.get("id") == content_id:
+                content_id = unit.get("id")
+                if content_id in content_ids and content_id not in updated:
                     unit["status"] = new_status
-                    unit["updated_at"] = datetime.now().isoformat()
-                    updated = True
-                    break
+                    unit["updated_at"] = updated_at
+                    updated.add(content_id)
                     
             if updated:
                 # Save back to file
-                with open(file_path, "w") as f:
-                    json.dump(content_units, f, indent=2, ensure_ascii=False)
-                logger.info(f"Updated local status to '{new_status}' for {content_id}")
-            else:
+                _write_json(content_units, file_path)
+                for content_id in updated:
+                    logger.info(f"Updated local status to '{new_status}' for {content_id}")
+            for content_id in set(content_ids) - updated:
                 logger.warning(f"Content unit not found: {content_id}")
                 
         except Exception as e:
@@ -324,6 +397,27 @@ class NotionSyncCLI:
             level: Level code
             content_id: Content UUID
         """
+        learning_item_ids = self._find_learning_item_ids(language, level, content_id)
+        if learning_item_ids:
+            self._apply_usage_decrements(language, level, Counter(set(learning_item_ids)))
+            
+    def _find_learning_item_ids(
+        self,
+        language: str,
+        level: str,
+        content_id: str
+    ) -> List[str]:
+        """
+        Find the learning item IDs used by a conversation or story.
+        
+        Args:
+            language: Language code
+            level: Level code
+            content_id: Content UUID
+            
+        Returns:
+            Learning item IDs, or an empty list if the content isn't found
+        """
         # Load content to get learning item IDs
         content_units_file = self.data_root / language / level / "conversations.json"
         stories_file = self.data_root / language / level / "stories.json"
@@ -333,8 +427,7 @@ class NotionSyncCLI:
         # Try conversations first
         if content_units_file.exists():
             try:
-                with open(content_units_file, "r") as f:
-                    content_units = json.load(f)
+                content_units = read_json_mmap(content_units_file)
                 for unit in content_units:
                     if unit.get("id") == content_id:
                         learning_item_ids = unit.get("learning_item_ids", [])
@@ -345,8 +438,7 @@ class NotionSyncCLI:
         # Try stories if not found
         if not learning_item_ids and stories_file.exists():
             try:
-                with open(stories_file, "r") as f:
-                    stories = json.load(f)
+                stories = read_json_mmap(stories_file)
                 for story in stories:
                     if story.get("id") == content_id:
                         learning_item_ids = story.get("learning_item_ids", [])
@@ -356,6 +448,24 @@ class NotionSyncCLI:
                 
         if not learning_item_ids:
             logger.warning(f"No learning items found for content: {content_id}")
+            
+        return learning_item_ids
+        
+    def _apply_usage_decrements(
+        self,
+        language: str,
+        level: str,
+        decrements: Counter
+    ) -> None:
+        """
+        Lower appearance counts in usage_stats.json, never below zero.
+        
+        Args:
+            language: Language code
+            level: Level code
+            decrements: Amount to subtract per learning item ID
+        """
+        if not decrements:
             return
             
         # Load and update usage stats
@@ -366,21 +476,20 @@ class NotionSyncCLI:
             return
             
         try:
-            with open(usage_stats_file, "r") as f:
-                usage_stats = json.load(f)
+            usage_stats = read_json_mmap(usage_stats_file)
                 
-            # Decrement counts
+            # Decrement counts (dict lookup keeps this one pass over the stats)
             updated_count = 0
             for stat in usage_stats:
-                if stat.get("learning_item_id") in learning_item_ids:
+                decrement = decrements.get(stat.get("learning_item_id"))
+                if decrement:
                     current_count = stat.get("appearances_count", 0)
-                    stat["appearances_count"] = max(0, current_count - 1)
+                    stat["appearances_count"] = max(0, current_count - decrement)
                     updated_count += 1
                     
             # Save back
             if updated_count > 0:
-                with open(usage_stats_file, "w") as f:
-                    json.dump(usage_stats, f, indent=2, ensure_ascii=False)
+                _write_json(usage_stats, usage_stats_file)
                 logger.info(f"Decremented usage stats for {updated_count} learning items")
                 
         except Exception as e:
@@ -510,33 +619,34 @@ class NotionSyncCLI:
         successful = []
         still_failed = []
         
-        for entry in failed_entries:
-            content_id = entry["content_id"]
-            payload = entry["payload"]
-            
-            try:
-                response = self.notion_client.client.pages.create(
-                    parent={"database_id": self.notion_client.database_id},
-                    properties=payload
-                )
-                notion_page_id = response["id"]
+        with self.mapping_manager.batch():
+            for entry in failed_entries:
+                content_id = entry["content_id"]
+                payload = entry["payload"]
+            
+                try:
+                    response = self.notion_client.client.pages.create(
+                        parent={"database_id": self.notion_client.database_id},
+                        properties=payload
+                    )
+                    notion_page_id = response["id"]
                 
-                # Update mapping
-                self.mapping_manager.add_mapping(
-                    content_id=content_id,
-                    notion_page_id=notion_page_id,
-                    language=entry["language"],
-                    level=entry["level"],
-                    content_type=entry["type"],
-                    title=entry["title"]
-                )
+                    # Update mapping
+                    self.mapping_manager.add_mapping(
+                        content_id=content_id,
+                        notion_page_id=notion_page_id,
+                        language=entry["language"],
+                        level=entry["level"],
+                        content_type=entry["type"],
+                        title=entry["title"]
+                    )
                 
-                successful.append(content_id)
-                logger.info(f"Successfully pushed: {entry['title']}")
+                    successful.append(content_id)
+                    logger.info(f"Successfully pushed: {entry['title']}")
                 
-            except Exception as e:
-                logger.warning(f"Still failing: {entry['title']} - {str(e)}")
-                still_failed.append(entry)
+                except Exception as e:
+                    logger.warning(f"Still failing: {entry['title']} - {str(e)}")
+                    still_failed.append(entry)
                 
         # Rewrite queue with still-failed entries
         if still_failed:
@@ -22,6 +22,13 @@ Usage:
         --language zh --level HSK1 \\
         --judge-only
 
+    # Evaluate at batch pricing: the first run submits a batch, rerun the
+    # same command once it completes to collect results and continue
+    python -m havachat.cli.rerun_judge_notion \\
+        --content-dir output/content/food/ \\
+        --language zh --level HSK1 \\
+        --use-batch-api
+
 Args:
     --content-dir: Directory containing content JSON files (conversation/ and story/ subdirs)
     --language: ISO 639-1 code (zh, ja, fr, en, es)
@@ -29,6 +36,8 @@ Args:
     --skip-judge: Skip LLM judge evaluation (only push to Notion)
     --judge-only: Only run LLM judge, don't push to Notion
     --force-judge: Re-evaluate even if evaluation already exists
+    --use-batch-api: Evaluate through the OpenAI Batch API (run twice: submit, then collect)
+    --semantic-cache: Reuse evaluations of near-identical scripts (uses OpenAI embeddings)
     --dry-run: Print what would be done without processing
 """
 
@@ -39,12 +48,17 @@ import logging
 import os
 import sys
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Optional, Set, Union
 
 from havachat.utils.llm_client import LLMClient
 from havachat.validators.schema import ContentUnit
 from src.models.llm_judge_evaluation import LLMJudgeEvaluation
 from src.pipeline.validators.llm_judge import LLMJudge
+from src.pipeline.validators.llm_judge_cache import (
+    ExactMatchCache,
+    SemanticCache,
+    openai_embedding_fn,
+)
 from src.pipeline.utils.notion_client import NotionClient, NotionSchemaError
 from src.pipeline.utils.notion_mapping_manager import NotionMappingManager
 
@@ -84,11 +98,10 @@ def load_content_files(content_dir: Path) -> List[ContentUnit]:
                 continue
             
             try:
-                with open(json_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    content_unit = ContentUnit.model_validate(data)
-                    content_units.append(content_unit)
-                    logger.debug(f"Loaded: {json_file.name}")
+                # Parse and validate in pydantic-core, no intermediate dict
+                content_unit = ContentUnit.model_validate_json(json_file.read_bytes())
+                content_units.append(content_unit)
+                logger.debug(f"Loaded: {json_file.name}")
             except Exception as e:
                 logger.error(f"Failed to load {json_file.name}: {e}")
     
@@ -120,6 +133,100 @@ def save_content_unit(content_unit: ContentUnit, content_dir: Path) -> None:
     logger.debug(f"Saved: {filename}")
 
 
+def format_content_text(content_unit: ContentUnit) -> str:
+    """Format content segments as the text shown to the LLM judge.
+    
+    Args:
+        content_unit: Conversation or story to format
+        
+    Returns:
+        One line per segment, prefixed with the speaker for conversations
+    """
+    if content_unit.type.value == "conversation":
+        return "\n".join([
+            f"{seg.speaker}: {seg.text}"
+            for seg in content_unit.segments
+        ])
+    # story
+    return "\n".join([seg.text for seg in content_unit.segments])
+
+
+def judge_item(content_unit: ContentUnit, args: argparse.Namespace) -> Dict[str, Any]:
+    """Build the LLM judge keyword arguments for one content unit.
+    
+    Args:
+        content_unit: Conversation or story to evaluate
+        args: Parsed CLI arguments
+        
+    Returns:
+        Keyword arguments for LLMJudge.evaluate_conversation()
+    """
+    return {
+        "content_id": content_unit.id,
+        "text": format_content_text(content_unit),
+        "language": args.language,
+        "level": args.level,
+        "content_type": content_unit.type.value,
+    }
+
+
+def run_batch_judge(
+    llm_judge: LLMJudge,
+    content_units: List[ContentUnit],
+    args: argparse.Namespace
+) -> Optional[Set[str]]:
+    """Submit or collect an OpenAI Batch API judge run for the content directory.
+    
+    The pending batch ID is kept in llm_judge_batch.json in the content
+    directory between the submitting run and the collecting run.
+    
+    Args:
+        llm_judge: Judge used to build and parse batch requests
+        content_units: Loaded content units
+        args: Parsed CLI arguments
+        
+    Returns:
+        IDs of the content units evaluated by the batch once results are
+        collected, or None if a batch is still pending (or was just submitted)
+    """
+    state_file = args.content_dir / "llm_judge_batch.json"
+    
+    if state_file.exists():
+        batch_id = json.loads(state_file.read_text(encoding="utf-8"))["batch_id"]
+        results = llm_judge.poll_batch(batch_id)
+        if results is None:
+            logger.info(f"Batch {batch_id} is still running; rerun this command later")
+            return None
+        
+        evaluated_ids = set()
+        for content_unit in content_units:
+            evaluation = results.get(content_unit.id)
+            if isinstance(evaluation, LLMJudgeEvaluation):
+                content_unit.llm_judge_evaluation = evaluation
+                save_content_unit(content_unit, args.content_dir)
+                evaluated_ids.add(content_unit.id)
+        
+        state_file.unlink()
+        logger.info(f"Applied {len(evaluated_ids)} batch evaluations from {batch_id}")
+        return evaluated_ids
+    
+    items = [
+        judge_item(content_unit, args)
+        for content_unit in content_units
+        if args.force_judge or content_unit.llm_judge_evaluation is None
+    ]
+    if not items:
+        return set()
+    
+    batch_id = llm_judge.submit_batch(items)
+    state_file.write_text(json.dumps({"batch_id": batch_id}), encoding="utf-8")
+    logger.info(
+        f"Submitted {len(items)} evaluations as batch {batch_id}; "
+        f"rerun this command after it completes to collect results"
+    )
+    return None
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Rerun LLM Judge + Notion sync on existing content"
@@ -157,6 +264,16 @@ def main():
         action="store_true",
         help="Re-evaluate even if evaluation already exists",
     )
+    parser.add_argument(
+        "--use-batch-api",
+        action="store_true",
+        help="Evaluate through the OpenAI Batch API (submit, then rerun to collect)",
+    )
+    parser.add_argument(
+        "--semantic-cache",
+        action="store_true",
+        help="Reuse evaluations of near-identical scripts (uses OpenAI embeddings)",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -197,9 +314,26 @@ def main():
     if not args.skip_judge:
         llm_judge_model = os.getenv("LLM_JUDGE_MODEL", "gpt-4")
         llm_judge_client = LLMClient(model=llm_judge_model)
-        llm_judge = LLMJudge(llm_client=llm_judge_client)
+        # --force-judge asks for fresh evaluations, so bypass the cache
+        use_cache = not args.force_judge
+        llm_judge = LLMJudge(
+            llm_client=llm_judge_client,
+            model=llm_judge_model,
+            cache=ExactMatchCache() if use_cache else None,
+            semantic_cache=(
+                SemanticCache(openai_embedding_fn())
+                if use_cache and args.semantic_cache else None
+            )
+        )
         logger.info(f"Using LLM Judge model: {llm_judge_model}")
     
+    # Batch API runs evaluate up front; stop here until the batch has completed
+    batch_evaluated_ids: Set[str] = set()
+    if llm_judge and args.use_batch_api and not args.dry_run:
+        batch_evaluated_ids = run_batch_judge(llm_judge, content_units, args)
+        if batch_evaluated_ids is None:
+            sys.exit(0)
+    
     # Initialize Notion client if needed
     notion_client = None
     notion_mapping_manager = None
@@ -249,14 +383,37 @@ def main():
         "skipped": 0
     }
     
+    # Content units that still need an LLM judge evaluation
+    judge_units = [
+        content_unit
+        for content_unit in content_units
+        if not args.skip_judge
+        and content_unit.id not in batch_evaluated_ids
+        and (args.force_judge or content_unit.llm_judge_evaluation is None)
+    ]
+    judge_ids = {content_unit.id for content_unit in judge_units}
+    
+    # Evaluations are independent LLM round trips, so run them concurrently
+    # up front; results are applied in the per-unit loop below
+    evaluations: Dict[str, Union[LLMJudgeEvaluation, Exception]] = {}
+    if judge_units and not args.dry_run:
+        logger.info(f"Running LLM judge evaluation for {len(judge_units)} content units...")
+        results = llm_judge.evaluate_batch(
+            [judge_item(content_unit, args) for content_unit in judge_units]
+        )
+        evaluations = {
+            content_unit.id: result
+            for content_unit, result in zip(judge_units, results)
+        }
+    
+    # Content units to push to Notion after the per-unit loop
+    push_units: List[ContentUnit] = []
+    
     for i, content_unit in enumerate(content_units, 1):
         logger.info(f"\n[{i}/{len(content_units)}] Processing: {content_unit.title} ({content_unit.type.value})")
         
         # Check if LLM judge evaluation needed
-        needs_evaluation = (
-            not args.skip_judge and
-            (args.force_judge or content_unit.llm_judge_evaluation is None)
-        )
+        needs_evaluation = content_unit.id in judge_ids
         
         if needs_evaluation:
             stats["judge_needed"] += 1
@@ -265,24 +422,9 @@ def main():
                 logger.info(f"  [DRY RUN] Would evaluate with LLM judge")
             else:
                 try:
-                    logger.info(f"  Running LLM judge evaluation...")
-                    
-                    # Format segments as text
-                    if content_unit.type.value == "conversation":
-                        text = "\n".join([
-                            f"{seg.speaker}: {seg.text}"
-                            for seg in content_unit.segments
-                        ])
-                    else:  # story
-                        text = "\n".join([seg.text for seg in content_unit.segments])
-                    
-                    evaluation = llm_judge.evaluate_conversation(
-                        content_id=content_unit.id,
-                        text=text,
-                        language=args.language,
-                        level=args.level,
-                        content_type=content_unit.type.value
-                    )
+                    evaluation = evaluations[content_unit.id]
+                    if isinstance(evaluation, Exception):
+                        raise evaluation
                     
                     # Store evaluation
                     content_unit.llm_judge_evaluation = evaluation
@@ -313,31 +455,43 @@ def main():
             if args.dry_run:
                 logger.info(f"  [DRY RUN] Would push to Notion")
             else:
-                try:
-                    logger.info(f"  Pushing to Notion...")
-                    
-                    page_id = notion_client.push_conversation(content_unit=content_unit)
-                    
-                    # Save mapping
-                    notion_mapping_manager.add_mapping(
-                        content_id=content_unit.id,
-                        notion_page_id=page_id,
-                        title=content_unit.title,
-                        content_type=content_unit.type.value,
-                        language=args.language,
-                        level=args.level
-                    )
-                    
-                    logger.info(f"  ✓ Pushed to Notion: {page_id}")
-                    stats["notion_success"] += 1
-                    
-                except Exception as e:
-                    logger.error(f"  ✗ Notion push failed: {e}")
-                    stats["notion_failed"] += 1
+                logger.info("  Queued for Notion push")
+                push_units.append(content_unit)
         else:
             if args.judge_only:
                 logger.info(f"  • Skipping Notion push (--judge-only)")
     
+    # Pushes are independent API calls, so run them concurrently once every
+    # unit has been judged; each mapping is saved as soon as its push
+    # finishes, so an interrupted run does not push duplicates next time
+    def record_push(content_unit: ContentUnit, result: Union[str, Exception]) -> None:
+        if isinstance(result, Exception):
+            logger.error(f"  ✗ Notion push failed for {content_unit.title}: {result}")
+            stats["notion_failed"] += 1
+            return
+        
+        try:
+            # Save mapping
+            notion_mapping_manager.add_mapping(
+                content_id=content_unit.id,
+                notion_page_id=result,
+                title=content_unit.title,
+                content_type=content_unit.type.value,
+                language=args.language,
+                level=args.level
+            )
+        except Exception as e:
+            logger.error(f"  ✗ Pushed {content_unit.title} ({result}) but failed to save mapping: {e}")
+            stats["notion_failed"] += 1
+            return
+        
+        logger.info(f"  ✓ Pushed to Notion: {content_unit.title} ({result})")
+        stats["notion_success"] += 1
+    
+    if push_units:
+        logger.info(f"\nPushing {len(push_units)} content units to Notion...")
+        notion_client.push_conversations(push_units, on_result=record_push)
+    
     # Print summary
     logger.info("\n" + "=" * 80)
     logger.info("SUMMARY")
@@ -301,7 +301,7 @@ Provide your response in the format:
                 lemma=pattern,
                 pos=None,
                 aliases=[],
-                media_urls=[],
+                media_urls=(),
                 level_system=level_system,
                 level_min=level,
                 level_max=level,
@@ -363,7 +363,7 @@ Provide your response in the format:
                         Example(
                             text=example_text,
                             translation=translation if translation else "[Translation unavailable]",
-                            media_urls=[],
+                            media_urls=(),
                         )
                     )
                 
@@ -383,7 +383,7 @@ Provide your response in the format:
                     lemma=pattern,
                     pos=None,
                     aliases=[],
-                    media_urls=[],
+                    media_urls=(),
                     level_system=level_system,
                     level_min=level,
                     level_max=level,
@@ -19,14 +19,13 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 from uuid import uuid4
 
-import opencc
 from pydantic import BaseModel, Field
-from pypinyin import Style, pinyin
 
 from havachat.enrichers.base import BaseEnricher
 from havachat.parsers.source_parsers import parse_chinese_vocab_tsv
 from havachat.utils.azure_translation import AzureTranslationHelper
 from havachat.utils.dictionary import DictionaryFactory
+from havachat.utils.item_processing import get_numeric_pinyin, get_traditional_chinese
 from havachat.utils.llm_client import LLMClient
 from havachat.utils.romanization import get_chinese_pinyin
 from havachat.utils.translation import translate_texts
@@ -380,12 +379,7 @@ Remember: We will add pinyin and English translations automatically later.
         Returns:
             Pinyin with numeric tones (e.g., "ai4", "ba4 ba5")
         """
-        try:
-            result = pinyin(text, style=Style.TONE3, heteronym=False)
-            return " ".join([item[0] for item in result])
-        except Exception as e:
-            logger.error(f"Failed to generate numeric pinyin for '{text}': {e}")
-            return ""
+        return get_numeric_pinyin(text)
 
     def _get_traditional(self, text: str) -> str:
         """Convert simplified Chinese to traditional Chinese using OpenCC.
@@ -398,13 +392,7 @@ Remember: We will add pinyin and English translations automatically later.
         Returns:
             Traditional Chinese text
         """
-        try:
-            converter = opencc.OpenCC('s2t.json')
-            traditional = converter.convert(text)
-            return traditional
-        except Exception as e:
-            logger.error(f"Failed to convert to traditional for '{text}': {e}")
-            return ""
+        return get_traditional_chinese(text)
 
     def _format_examples(
         self, 
@@ -426,7 +414,7 @@ Remember: We will add pinyin and English translations automatically later.
             example = Example(
                 text=chinese,
                 translation=translation if translation else "",
-                media_urls=[]
+                media_urls=()
             )
             formatted.append(example)
         
@@ -349,7 +349,7 @@ Remember: We will add English translations automatically later.
             example = Example(
                 text=french,
                 translation=translation if translation else "",
-                media_urls=[]
+                media_urls=()
             )
             formatted.append(example)
         
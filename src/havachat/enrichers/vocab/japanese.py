@@ -354,7 +354,7 @@ Remember: We will add romaji and English translations automatically later.
             example = Example(
                 text=japanese,
                 translation=translation if translation else "",
-                media_urls=[]
+                media_urls=()
             )
             formatted.append(example)
         
@@ -18,7 +18,11 @@ from havachat.models.audio_progress import (
     AudioProgressItem,
 )
 from havachat.utils.elevenlabs_client import ElevenLabsClient
-from havachat.validators.schema import ContentUnit, LearningItem
+from havachat.validators.schema import (
+    LIST_LEARNING_ITEM_ADAPTER,
+    ContentUnit,
+    LearningItem,
+)
 from havachat.validators.voice_validator import VoiceConfigValidator
 
 logger = logging.getLogger(__name__)
@@ -51,7 +55,8 @@ class AudioGenerator:
         self,
         language: str,
         level: str,
-        category: str | None = None
+        category: str | None = None,
+        trusted: bool = True
     ) -> List[LearningItem]:
         """Load learning items from consolidated JSON files.
         
@@ -59,6 +64,8 @@ class AudioGenerator:
             language: Full language name (e.g., "Chinese", "French", "Japanese")
             level: Level (e.g., "HSK1", "A1", "N5")
             category: Optional category filter (vocab, grammar, idiom, etc.)
+            trusted: Skip re-validation of items the pipeline already
+                validated when writing them (default: True)
             
         Returns:
             List of LearningItem objects
@@ -71,21 +78,26 @@ class AudioGenerator:
             # Load specific category file
             file_path = base_path / f"{category}_enriched.json"
             if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    items.extend([LearningItem(**item) for item in data])
-                    logger.info(f"Loaded {len(data)} items from {file_path}")
+                items.extend(self._read_learning_item_file(file_path, trusted))
         else:
             # Load all category files
             for cat_file in base_path.glob("*_enriched.json"):
-                with open(cat_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    items.extend([LearningItem(**item) for item in data])
-                    logger.info(f"Loaded {len(data)} items from {cat_file}")
+                items.extend(self._read_learning_item_file(cat_file, trusted))
         
         logger.info(f"Total learning items loaded: {len(items)}")
         return items
     
+    def _read_learning_item_file(self, file_path: Path, trusted: bool) -> List[LearningItem]:
+        """Load one consolidated learning item file (a JSON array of items)."""
+        if trusted:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                items = [LearningItem.from_trusted(item) for item in json.load(f)]
+        else:
+            # Validate the whole array in one pydantic-core call
+            items = LIST_LEARNING_ITEM_ADAPTER.validate_json(file_path.read_bytes())
+        logger.info(f"Loaded {len(items)} items from {file_path}")
+        return items
+    
     def load_content_units(
         self,
         language: str,
@@ -116,10 +128,9 @@ class AudioGenerator:
             
             for content_file in type_dir.glob(f"{ctype}_*.json"):
                 try:
-                    with open(content_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        unit = ContentUnit(**data)
-                        units.append(unit)
+                    # Parse and validate in pydantic-core, no intermediate dict
+                    unit = ContentUnit.model_validate_json(content_file.read_bytes())
+                    units.append(unit)
                 except Exception as e:
                     logger.error(f"Error loading {content_file}: {e}")
         
@@ -41,6 +41,8 @@ from havachat.validators.schema import (
     Segment,
     SegmentType,
     Speaker,
+    batch_timestamp,
+    load_learning_items,
 )
 
 logger = logging.getLogger(__name__)
@@ -356,7 +358,7 @@ class ContentGenerator:
         # Save scenarios
         if self.scenarios:
             with open(self.scenarios_file, "w", encoding="utf-8") as f:
-                scenarios_list = [scenario.model_dump() for scenario in self.scenarios.values()]
+                scenarios_list = [scenario.model_dump(mode="json") for scenario in self.scenarios.values()]
                 json.dump(scenarios_list, f, ensure_ascii=False, indent=2)
             logger.info(f"Saved {len(self.scenarios)} scenarios to {self.scenarios_file}")
     
@@ -580,50 +582,50 @@ class ContentGenerator:
         parsed_items = load_source_file(source_path, self.language, content_type)
         
         # Convert to LearningItem and SimplifiedLearningItem
-        for item_data in parsed_items:
-            # Create full LearningItem with required fields
-            item = LearningItem(
-                id=str(uuid4()),
-                language=self.language,
-                category=Category.VOCAB if content_type == "vocab" else Category.GRAMMAR,
-                target_item=item_data.get("target_item", ""),
-                definition=item_data.get("meaning", ""),  # Use meaning as definition
-                examples=[],  # Original sources don't have examples yet
-                meaning=item_data.get("meaning", ""),
-                part_of_speech=item_data.get("part_of_speech"),
-                rule=item_data.get("rule"),
-                romanization=item_data.get("romanization"),
-                level_system=self.level_system,
-                level_min=item_data.get("level_min", self.level),
-                level_max=item_data.get("level_max", self.level),
-            )
-            
-            # Store full item
-            self.all_learning_items[item.id] = item
-            
-            # Map short UUID (first 8 chars) to full UUID
-            short_id = item.id[:8]
-            self.short_to_full_uuid[short_id] = item.id
-            
-            # Create simplified version with minimal fields and short ID
-            if content_type == "vocab":
-                # Vocab: word + part_of_speech
-                simplified = SimplifiedLearningItem(
-                    id=short_id,
-                    category=item.category,
-                    target_item=item.target_item,
-                    part_of_speech=item.part_of_speech,
-                )
-            else:
-                # Grammar: rule
-                simplified = SimplifiedLearningItem(
-                    id=short_id,
-                    category=item.category,
-                    target_item=item.target_item,
-                    rule=item.rule,
+        # (sharing one created_at across the batch)
+        with batch_timestamp():
+            for item_data in parsed_items:
+                # Create full LearningItem with required fields
+                item = LearningItem(
+                    id=str(uuid4()),
+                    language=self.language,
+                    category=Category.VOCAB if content_type == "vocab" else Category.GRAMMAR,
+                    target_item=item_data.get("target_item", ""),
+                    definition=item_data.get("meaning", ""),  # Use meaning as definition
+                    examples=[],  # Original sources don't have examples yet
+                    pos=item_data.get("part_of_speech"),
+                    romanization=item_data.get("romanization"),
+                    level_system=self.level_system,
+                    level_min=item_data.get("level_min", self.level),
+                    level_max=item_data.get("level_max", self.level),
                 )
-            
-            self.simplified_items.append(simplified)
+                
+                # Store full item
+                self.all_learning_items[item.id] = item
+                
+                # Map short UUID (first 8 chars) to full UUID
+                short_id = item.id[:8]
+                self.short_to_full_uuid[short_id] = item.id
+                
+                # Create simplified version with minimal fields and short ID
+                if content_type == "vocab":
+                    # Vocab: word + part_of_speech
+                    simplified = SimplifiedLearningItem(
+                        id=short_id,
+                        category=item.category,
+                        target_item=item.target_item,
+                        part_of_speech=item.pos,
+                    )
+                else:
+                    # Grammar: rule
+                    simplified = SimplifiedLearningItem(
+                        id=short_id,
+                        category=item.category,
+                        target_item=item.target_item,
+                        rule=item_data.get("rule"),
+                    )
+                
+                self.simplified_items.append(simplified)
     
     def _load_enriched_source(self, source_path: Path, category_key: str) -> None:
         """Load items from enriched JSON file(s).
@@ -644,29 +646,22 @@ class ContentGenerator:
         # Load each JSON file
         for json_file in json_files:
             try:
-                with open(json_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                # Handles both single item and array of items
+                for item in load_learning_items(json_file.read_bytes()):
+                    # Store full item
+                    self.all_learning_items[item.id] = item
                     
-                    # Handle both single item and array of items
-                    items_data = data if isinstance(data, list) else [data]
+                    # Map short UUID (first 8 chars) to full UUID
+                    short_id = item.id[:8]
+                    self.short_to_full_uuid[short_id] = item.id
                     
-                    for item_data in items_data:
-                        item = LearningItem(**item_data)
-                        
-                        # Store full item
-                        self.all_learning_items[item.id] = item
-                        
-                        # Map short UUID (first 8 chars) to full UUID
-                        short_id = item.id[:8]
-                        self.short_to_full_uuid[short_id] = item.id
-                        
-                        # Create simplified version - all enriched items just use target_item
-                        simplified = SimplifiedLearningItem(
-                            id=short_id,
-                            category=item.category,
-                            target_item=item.target_item,
-                        )
-                        self.simplified_items.append(simplified)
+                    # Create simplified version - all enriched items just use target_item
+                    simplified = SimplifiedLearningItem(
+                        id=short_id,
+                        category=item.category,
+                        target_item=item.target_item,
+                    )
+                    self.simplified_items.append(simplified)
             except Exception as e:
                 logger.warning(f"Failed to load {json_file}: {e}")
                 continue
@@ -837,11 +832,10 @@ Remember:
             # Concatenate text
             full_text = "\n".join([seg.text for seg in segments])
 
-            # Deduplicate learning_item_ids (convert short to full UUIDs)
-            all_ids = []
-            for seg in segments:
-                all_ids.extend(seg.learning_item_ids)
-            unique_ids = list(dict.fromkeys(all_ids))  # Preserve order
+            # Deduplicate learning_item_ids in one pass, preserving order
+            unique_ids = list(dict.fromkeys(
+                item_id for seg in segments for item_id in seg.learning_item_ids
+            ))
 
             content_unit = ContentUnit(
                 id=content_id,
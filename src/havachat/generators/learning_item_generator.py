@@ -14,7 +14,6 @@ Optimization: Uses lean response models to reduce token usage by ~60-70%.
 import json
 import logging
 import os
-from datetime import UTC, datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 from uuid import uuid4
@@ -23,7 +22,13 @@ from pydantic import BaseModel, Field
 
 from havachat.prompts import learning_item_prompts
 from havachat.utils.llm_client import LLMClient
-from havachat.validators.schema import Category, Example, LearningItem, LevelSystem
+from havachat.validators.schema import (
+    Category,
+    Example,
+    LearningItem,
+    LevelSystem,
+    batch_timestamp,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -397,36 +402,38 @@ class BaseLearningItemGenerator:
         """
         full_items = []
         
-        for lean in lean_items:
-            # Convert example strings to Example objects (text only)
-            examples = [
-                Example(text=example_text, translation="", media_urls=[])
-                for example_text in lean.examples
-            ]
-            
-            # Build full LearningItem with metadata
-            full_item = LearningItem(
-                id=str(uuid4()),
-                language=self.language,
-                category=category,
-                target_item=lean.target_item,
-                definition=lean.definition,
-                examples=examples,
-                romanization="",  # To be filled by language-specific logic if needed
-                sense_gloss=None,
-                lemma=None,
-                pos=None,
-                aliases=[],
-                media_urls=[],
-                level_system=self.level_system,
-                level_min=self.level,
-                level_max=self.level,
-                created_at=datetime.now(UTC),
-                version="1.0.0",
-                source_file=None,
-            )
-            
-            full_items.append(full_item)
+        # One shared created_at for the whole batch
+        with batch_timestamp() as created_at:
+            for lean in lean_items:
+                # Convert example strings to Example objects (text only)
+                examples = [
+                    Example(text=example_text, translation="", media_urls=())
+                    for example_text in lean.examples
+                ]
+                
+                # Build full LearningItem with metadata
+                full_item = LearningItem(
+                    id=str(uuid4()),
+                    language=self.language,
+                    category=category,
+                    target_item=lean.target_item,
+                    definition=lean.definition,
+                    examples=examples,
+                    romanization="",  # To be filled by language-specific logic if needed
+                    sense_gloss=None,
+                    lemma=None,
+                    pos=None,
+                    aliases=[],
+                    media_urls=(),
+                    level_system=self.level_system,
+                    level_min=self.level,
+                    level_max=self.level,
+                    created_at=created_at,
+                    version="1.0.0",
+                    source_file=None,
+                )
+                
+                full_items.append(full_item)
         
         return full_items
 
@@ -15,6 +15,8 @@ import csv
 import json
 import logging
 import re
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, List, Union
 
@@ -62,44 +64,49 @@ def extract_sense_marker(word: str) -> str:
     return match.group(1) if match else ""
 
 
+# Chinese POS abbreviations used in the HSK vocabulary lists
+_CHINESE_POS_MAP = {
+    "名": "noun",
+    "动": "verb",
+    "形": "adjective",
+    "数": "number",
+    "量": "measure word",
+    "代": "pronoun",
+    "副": "adverb",
+    "介": "preposition",
+    "连": "conjunction",
+    "助": "particle",
+    "叹": "interjection",
+    "拟声": "onomatopoeia",
+}
+
+# Separators between the parts of a compound POS like "量、（名）" or "介，连"
+_POS_SEPARATOR_RE = re.compile(r"[、，]")
+
+
+@lru_cache(maxsize=256)
 def translate_chinese_pos(chinese_pos: str) -> str:
     """Translate Chinese part-of-speech to English.
     
+    A vocabulary list uses only a few dozen distinct labels, so results
+    are memoized.
+    
     Args:
         chinese_pos: Chinese POS tag
         
     Returns:
         English POS tag
     """
-    pos_map = {
-        "名": "noun",
-        "动": "verb",
-        "形": "adjective",
-        "数": "number",
-        "量": "measure word",
-        "代": "pronoun",
-        "副": "adverb",
-        "介": "preposition",
-        "连": "conjunction",
-        "助": "particle",
-        "叹": "interjection",
-        "拟声": "onomatopoeia",
-    }
-    
     # Handle compound POS like "量、（名）" or "介、连"
     if "、" in chinese_pos or "，" in chinese_pos:
-        parts = re.split(r"[、，]", chinese_pos)
         translated = []
-        for part in parts:
+        for part in _POS_SEPARATOR_RE.split(chinese_pos):
             part = part.strip().strip("（）")
-            if part in pos_map:
-                translated.append(pos_map[part])
-            else:
-                translated.append(part)
+            translated.append(_CHINESE_POS_MAP.get(part, part))
         return "/".join(translated)
     
     chinese_pos = chinese_pos.strip().strip("（）")
-    return pos_map.get(chinese_pos, chinese_pos)
+    return _CHINESE_POS_MAP.get(chinese_pos, chinese_pos)
 
 
 def parse_chinese_vocab_tsv(source_path: Union[str, Path]) -> List[Dict[str, Any]]:
@@ -390,6 +397,15 @@ def parse_french_vocab_tsv(source_path: Union[str, Path]) -> List[Dict[str, Any]
 # ============================================================================
 
 
+# Grammar CSV columns, in the order parse_chinese_grammar_csv() unpacks them
+_GRAMMAR_COLUMNS = ("类别", "类别名称", "细目", "语法内容")
+
+# Separators between patterns in one 语法内容 cell: 、 or a full/half-width comma
+_GRAMMAR_SEPARATOR_RE = re.compile(r"[、,，]")
+_TRAILING_NUMBER_RE = re.compile(r"\s*\d+\s*$")
+_NUMBERED_PREFIX_RE = re.compile(r"^（\d+）[^：]*：")
+
+
 def parse_chinese_grammar_csv(source_path: Union[str, Path]) -> List[Dict[str, Any]]:
     """Parse Chinese grammar CSV file with official HSK grammar patterns.
     
@@ -421,32 +437,38 @@ def parse_chinese_grammar_csv(source_path: Union[str, Path]) -> List[Dict[str, A
         raise FileNotFoundError(f"Source file not found: {source_path}")
     
     items = []
-    with open(path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        fieldnames = next(reader, None)
         
         # Validate columns
         expected_cols = {"类别", "类别名称", "细目", "语法内容"}
-        if not expected_cols.issubset(set(reader.fieldnames or [])):
+        if not expected_cols.issubset(set(fieldnames or [])):
             raise ValueError(
-                f"CSV must have columns: {expected_cols}. Found: {reader.fieldnames}"
+                f"CSV must have columns: {expected_cols}. Found: {fieldnames}"
             )
         
+        # Plain rows plus one itemgetter skip building a dict per row;
+        # the last header occurrence wins, as with csv.DictReader
+        column_index = {name: i for i, name in enumerate(fieldnames)}
+        get_columns = itemgetter(*(column_index[name] for name in _GRAMMAR_COLUMNS))
+        
         for row in reader:
-            grammar_type = row["类别"].strip()
-            category_name = row["类别名称"].strip()
-            detail = row["细目"].strip()
-            content = row["语法内容"].strip()
+            if not row:
+                continue
+            grammar_type, category_name, detail, content = (
+                value.strip() for value in get_columns(row)
+            )
             
             # Split multi-item patterns by 、 or comma
-            patterns = re.split(r"[、,，]", content)
-            patterns = [p.strip() for p in patterns if p.strip()]
+            patterns = _GRAMMAR_SEPARATOR_RE.split(content)
             
             # Create individual items for each pattern to avoid mega-items
             for pattern in patterns:
                 # Remove any parenthetical numbers or notes for target_item
                 # e.g., "会 1" → "会", "（1）专用名量词：本" → "本"
-                clean_pattern = re.sub(r"\s*\d+\s*$", "", pattern)  # Remove trailing numbers
-                clean_pattern = re.sub(r"^（\d+）[^：]*：", "", clean_pattern)  # Remove prefix like "（1）专用名量词："
+                clean_pattern = _TRAILING_NUMBER_RE.sub("", pattern.strip())  # Remove trailing numbers
+                clean_pattern = _NUMBERED_PREFIX_RE.sub("", clean_pattern)  # Remove prefix like "（1）专用名量词："
                 clean_pattern = clean_pattern.strip()
                 
                 if clean_pattern:
@@ -4,7 +4,7 @@ Provides 2M free characters per month.
 """
 
 import os
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 
 from azure.ai.translation.text import TextTranslationClient
 from azure.core.credentials import AzureKeyCredential
@@ -17,6 +17,11 @@ from havachat.utils.translation_cache import TranslationCache
 class AzureTranslationHelper:
     """Helper for Azure Text Translation API with character usage tracking."""
     
+    # Per-request limits; Azure accepts up to 1000 texts and 50,000 characters
+    # per request, smaller requests keep a single failure cheap to retry
+    MAX_TEXTS_PER_REQUEST = 100
+    MAX_CHARS_PER_REQUEST = 50_000
+    
     def __init__(self, enable_cache: bool = True, cache_ttl_days: int = 30):
         """Initialize Azure Translation client with credentials from environment.
         
@@ -52,6 +57,8 @@ class AzureTranslationHelper:
         """Translate a batch of texts and track character usage.
         
         Uses cache to avoid redundant API calls for previously translated texts.
+        Uncached texts are deduplicated and sent in as few requests as the
+        per-request limits allow, so callers can pass a whole run's texts.
         
         Args:
             texts: List of texts to translate
@@ -78,8 +85,8 @@ class AzureTranslationHelper:
             logger.info(f"All {len(texts)} translations retrieved from cache")
             return cached_translations
         
-        # Prepare texts that need translation
-        texts_to_translate = [texts[i] for i in missing_indices]
+        # Translate each distinct uncached text once
+        texts_to_translate = list(dict.fromkeys(texts[i] for i in missing_indices))
         
         # Count characters before translation (only for non-cached texts)
         char_count = sum(len(text) for text in texts_to_translate)
@@ -97,56 +104,79 @@ class AzureTranslationHelper:
                 f"{remaining:,} characters remaining, but {char_count:,} requested."
             )
         
+        new_translations = {}
         try:
-            response = self.client.translate(
-                body=texts_to_translate,
-                from_language=from_language,
-                to_language=[to_language]
-            )
-            
-            # Extract translations
-            new_translations = []
-            for translation in response:
-                if translation.translations:
-                    new_translations.append(translation.translations[0].text)
-                else:
-                    logger.warning(f"No translation returned for text: {texts_to_translate[len(new_translations)]}")
-                    new_translations.append("")  # Empty string for failed translations
-            
-            # Update character usage
-            self.total_characters += char_count
-            logger.debug(
-                f"Translated {len(texts_to_translate)} texts ({char_count:,} chars). "
-                f"Total usage: {self.total_characters:,} / {self.monthly_limit:,} "
-                f"({(self.total_characters / self.monthly_limit * 100):.2f}%)"
-            )
-            
-            # Store new translations in cache
-            self.cache.set_batch(
-                texts_to_translate, 
-                new_translations, 
-                from_language, 
-                to_language, 
-                service="azure"
-            )
-            
-            # Merge cached and new translations
-            final_translations = []
-            new_translation_idx = 0
-            for i in range(len(texts)):
-                if i in missing_indices:
-                    final_translations.append(new_translations[new_translation_idx])
-                    new_translation_idx += 1
-                else:
-                    final_translations.append(cached_translations[i])
-            
-            return final_translations
+            for chunk in self._request_chunks(texts_to_translate):
+                response = self.client.translate(
+                    body=chunk,
+                    from_language=from_language,
+                    to_language=[to_language]
+                )
+                
+                # Extract translations
+                chunk_translations = []
+                for text, translation in zip(chunk, response):
+                    if translation.translations:
+                        chunk_translations.append(translation.translations[0].text)
+                    else:
+                        logger.warning(f"No translation returned for text: {text}")
+                        chunk_translations.append("")  # Empty string for failed translations
+                
+                # Update character usage per request, as each one is billed
+                chunk_chars = sum(len(text) for text in chunk)
+                self.total_characters += chunk_chars
+                logger.debug(
+                    f"Translated {len(chunk)} texts ({chunk_chars:,} chars). "
+                    f"Total usage: {self.total_characters:,} / {self.monthly_limit:,} "
+                    f"({(self.total_characters / self.monthly_limit * 100):.2f}%)"
+                )
+                
+                # Store new translations in cache
+                self.cache.set_batch(
+                    chunk,
+                    chunk_translations,
+                    from_language,
+                    to_language,
+                    service="azure"
+                )
+                new_translations.update(zip(chunk, chunk_translations))
             
         except HttpResponseError as e:
             logger.error(f"Azure Translation API error: {e.error.code if e.error else 'Unknown'}")
             if e.error:
                 logger.error(f"Message: {e.error.message}")
             raise
+        
+        # Merge cached and new translations
+        for i in missing_indices:
+            cached_translations[i] = new_translations[texts[i]]
+        
+        return cached_translations
+    
+    def _request_chunks(self, texts: List[str]) -> Iterator[List[str]]:
+        """Split texts into chunks within Azure's per-request limits.
+        
+        Args:
+            texts: Texts to translate
+        
+        Yields:
+            Lists of at most MAX_TEXTS_PER_REQUEST texts and (unless a single
+            text is longer) MAX_CHARS_PER_REQUEST characters
+        """
+        chunk: List[str] = []
+        chunk_chars = 0
+        for text in texts:
+            if chunk and (
+                len(chunk) == self.MAX_TEXTS_PER_REQUEST
+                or chunk_chars + len(text) > self.MAX_CHARS_PER_REQUEST
+            ):
+                yield chunk
+                chunk = []
+                chunk_chars = 0
+            chunk.append(text)
+            chunk_chars += len(text)
+        if chunk:
+            yield chunk
     
     def translate_single(
         self, 
@@ -10,13 +10,20 @@ Used by both enrichers and learning item generators.
 """
 
 import logging
+from functools import lru_cache
 from typing import List, Optional
 
 import opencc
-from pypinyin import Style, pinyin
+from pypinyin import Style, lazy_pinyin
+from pypinyin.constants import RE_HANS
 
 from havachat.utils.azure_translation import AzureTranslationHelper
-from havachat.utils.romanization import get_japanese_romaji, get_chinese_pinyin
+from havachat.utils.romanization import (
+    ROMANIZATION_CACHE_SIZE,
+    get_chinese_pinyin,
+    get_japanese_romaji,
+    numeric_tone_syllable,
+)
 from havachat.validators.schema import Example
 
 logger = logging.getLogger(__name__)
@@ -27,9 +34,15 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 
 
+@lru_cache(maxsize=ROMANIZATION_CACHE_SIZE)
 def get_numeric_pinyin(text: str) -> str:
     """Get pinyin with numeric tones (ai4, ba4 ba5).
     
+    Syllables romanized from Han characters are converted with a table
+    lookup (numeric_tone_syllable()), which is about twice as fast as
+    pypinyin's own TONE3 style. Other text (Latin, punctuation) is passed
+    through unchanged, as TONE3 does. Results are memoized per text.
+    
     Args:
         text: Chinese text
         
@@ -37,13 +50,32 @@ def get_numeric_pinyin(text: str) -> str:
         Pinyin with numeric tones (e.g., "ai4", "ba4 ba5")
     """
     try:
-        result = pinyin(text, style=Style.TONE3, heteronym=False)
-        return " ".join([item[0] for item in result])
+        syllables = []
+        pos = 0
+        for item in lazy_pinyin(text, style=Style.TONE):
+            # Each Han character yields one syllable; a run of other text
+            # comes back as a single unchanged item
+            if RE_HANS.match(text[pos]):
+                syllables.append(numeric_tone_syllable(item))
+                pos += 1
+            else:
+                syllables.append(item)
+                pos += len(item)
+        return " ".join(syllables)
     except Exception as e:
         logger.error(f"Failed to generate numeric pinyin for '{text}': {e}")
         return ""
 
 
+@lru_cache(maxsize=1)
+def _get_s2t_converter() -> opencc.OpenCC:
+    """Return the shared Simplified-to-Traditional converter.
+    
+    Building one loads the s2t dictionaries (several ms), so it is built once.
+    """
+    return opencc.OpenCC('s2t.json')
+
+
 def get_traditional_chinese(text: str) -> str:
     """Convert simplified Chinese to traditional Chinese using OpenCC.
     
@@ -56,9 +88,7 @@ def get_traditional_chinese(text: str) -> str:
         Traditional Chinese text
     """
     try:
-        converter = opencc.OpenCC('s2t.json')
-        traditional = converter.convert(text)
-        return traditional
+        return _get_s2t_converter().convert(text)
     except Exception as e:
         logger.error(f"Failed to convert to traditional for '{text}': {e}")
         return ""
@@ -129,7 +159,7 @@ def process_chinese_item(
                     Example(
                         text=text,
                         translation=translation,
-                        media_urls=[]
+                        media_urls=()
                     )
                 )
             item_dict["examples"] = formatted_examples
@@ -191,7 +221,7 @@ def process_japanese_item(
                     Example(
                         text=text,
                         translation=translation,
-                        media_urls=[]
+                        media_urls=()
                     )
                 )
             item_dict["examples"] = formatted_examples
@@ -251,7 +281,7 @@ def process_french_item(
                     Example(
                         text=text,
                         translation=translation,
-                        media_urls=[]
+                        media_urls=()
                     )
                 )
             item_dict["examples"] = formatted_examples
@@ -366,7 +396,7 @@ def post_process_learning_item(
                         Example(
                             text=text,
                             translation=translation,
-                            media_urls=[]
+                            media_urls=()
                         )
                     )
                 item_data["examples"] = formatted_examples
@@ -6,11 +6,13 @@ Provides automatic romanization using Python libraries instead of LLM:
 """
 
 import logging
+from functools import lru_cache
 from typing import Optional
 
 # Import romanization libraries
 try:
     from pypinyin import lazy_pinyin, Style
+    from pypinyin.pinyin_dict import pinyin_dict as PINYIN_DICT
     PYPINYIN_AVAILABLE = True
 except ImportError:
     PYPINYIN_AVAILABLE = False
@@ -23,7 +25,30 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Romanized words kept per function; vocabulary runs repeat the same words
+ROMANIZATION_CACHE_SIZE = 65536
+
+# Tone-marked letter -> (plain letter, tone). ü is written "v" as in
+# pypinyin's TONE3 style. Rarer readings (ê̄, m̀) carry combining marks,
+# which are dropped; ḿ, ń, ň, ǹ, ế, ề only exist precomposed.
+_TONE_MARKS = {
+    marked: (plain, tone)
+    for plain, marks in (
+        ("a", "āáǎà"), ("e", "ēéěè"), ("i", "īíǐì"), ("o", "ōóǒò"),
+        ("u", "ūúǔù"), ("v", "ǖǘǚǜ"), ("", "\u0304\u0301\u030c\u0300"),
+    )
+    for tone, marked in enumerate(marks, start=1)
+}
+_TONE_MARKS.update({
+    "ḿ": ("m", 2), "ń": ("n", 2), "ň": ("n", 3), "ǹ": ("n", 4),
+    "ế": ("ê", 2), "ề": ("ê", 4),
+})
+_STRIP_TONE_MARKS = str.maketrans(
+    {marked: plain for marked, (plain, _) in _TONE_MARKS.items()} | {"ü": "v"}
+)
+
 
+@lru_cache(maxsize=ROMANIZATION_CACHE_SIZE)
 def get_chinese_pinyin(text: str, tone_marks: bool = True) -> str:
     """Get pinyin romanization for Chinese text.
 
@@ -36,6 +61,8 @@ def get_chinese_pinyin(text: str, tone_marks: bool = True) -> str:
     Returns:
         Pinyin romanization with tone marks (e.g., "yínháng" for 银行)
 
+    Results are memoized per (text, tone_marks).
+
     Example:
         >>> get_chinese_pinyin("银行")
         'yínháng'
@@ -46,6 +73,13 @@ def get_chinese_pinyin(text: str, tone_marks: bool = True) -> str:
         logger.warning("pypinyin not available, returning empty string")
         return ""
 
+    # Single characters: read the most common reading straight from
+    # pypinyin's codepoint table ("xíng,háng,..."), skipping segmentation
+    if tone_marks and len(text) == 1:
+        readings = PINYIN_DICT.get(ord(text))
+        if readings:
+            return readings.split(",", 1)[0]
+
     # Get pinyin with tone marks
     style = Style.TONE if tone_marks else Style.NORMAL
 
@@ -60,6 +94,41 @@ def get_chinese_pinyin(text: str, tone_marks: bool = True) -> str:
         return ' '.join(pinyin_list)
 
 
+def numeric_tone_syllable(syllable: str) -> str:
+    """Convert one tone-marked pinyin syllable to numeric-tone form.
+
+    Matches pypinyin's TONE3 style for syllables romanized from Han
+    characters: the tone number goes last, ü becomes "v" and neutral-tone
+    syllables get no number. Text pypinyin passes through unchanged (Latin
+    words, punctuation) must not be converted.
+
+    Args:
+        syllable: Syllable with tone marks (e.g., "lǜ")
+
+    Returns:
+        Syllable with a trailing tone number (e.g., "lv4")
+
+    Example:
+        >>> numeric_tone_syllable("hǎo")
+        'hao3'
+        >>> numeric_tone_syllable("ba")
+        'ba'
+    """
+    plain = syllable.translate(_STRIP_TONE_MARKS)
+    for char in syllable:
+        marked = _TONE_MARKS.get(char)
+        if marked:
+            return f"{plain}{marked[1]}"
+    return plain
+
+
+@lru_cache(maxsize=1)
+def _get_kakasi():
+    """Return the shared pykakasi converter, building it on first use."""
+    return kakasi()
+
+
+@lru_cache(maxsize=ROMANIZATION_CACHE_SIZE)
 def get_japanese_romaji(text: str, capitalize: bool = False) -> str:
     """Get romaji romanization for Japanese text.
 
@@ -72,6 +141,8 @@ def get_japanese_romaji(text: str, capitalize: bool = False) -> str:
     Returns:
         Romaji romanization (Hepburn style)
 
+    Results are memoized per (text, capitalize).
+
     Example:
         >>> get_japanese_romaji("学校")
         'gakkou'
@@ -82,11 +153,8 @@ def get_japanese_romaji(text: str, capitalize: bool = False) -> str:
         logger.warning("pykakasi not available, returning empty string")
         return ""
 
-    # Initialize kakasi converter
-    kks = kakasi()
-
     # Convert to romaji
-    result = kks.convert(text)
+    result = _get_kakasi().convert(text)
 
     # Extract romaji from result
     romaji_parts = [item['hepburn'] for item in result]
@@ -187,11 +255,7 @@ def translate_chinese_pos(chinese_pos: str) -> str:
         'classifier'
     """
     # Handle compound POS like "名、动" or "量、（名）"
-    # Take the first/primary one
-    if "、" in chinese_pos:
-        chinese_pos = chinese_pos.split("、")[0]
-
-    # Remove parentheses
-    chinese_pos = chinese_pos.strip("()（）")
+    # Take the first/primary one, then remove parentheses
+    chinese_pos = chinese_pos.partition("、")[0].strip("()（）")
 
     return CHINESE_POS_MAP.get(chinese_pos, chinese_pos)
@@ -9,18 +9,48 @@ Usage statistics help identify:
 - Content coverage gaps
 """
 
+import heapq
 import json
 import logging
-from collections import defaultdict
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+from havachat.utils.file_io import read_json_mmap, write_bytes_atomic
 from havachat.validators.schema import LearningItem
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Utilization buckets, in the order UsageTracker._buckets stores them
+UNUSED, UNDERUTILIZED, WELL_UTILIZED, OVERUSED = range(4)
+
+
+def _utilization_bucket(appearances_count: int) -> int:
+    """Map an appearance count to its utilization bucket."""
+    if appearances_count == 0:
+        return UNUSED
+    if appearances_count < 3:
+        return UNDERUTILIZED
+    if appearances_count <= 10:
+        return WELL_UTILIZED
+    return OVERUSED
+
+
+_appearances_count = itemgetter("appearances_count")
+
+
+def _entry_snapshot(entry: Dict) -> Dict:
+    """Copy an entry with content_unit_ids as a sorted list, as saved to disk."""
+    return {**entry, "content_unit_ids": sorted(entry["content_unit_ids"])}
+
 
 class UsageStats(BaseModel):
     """Usage statistics for a learning item."""
@@ -37,16 +67,29 @@ class UsageTracker:
 
     Maintains a JSON file with appearance counts for each learning item.
     Updates are incremental - load existing stats, modify, and save.
+
+    In memory, each entry's ``content_unit_ids`` is a set for O(1) dedup;
+    it is written to disk as a sorted list.
+
+    A read-only tracker (for reporting) keeps the entries exactly as parsed,
+    so ``content_unit_ids`` stay lists, and refuses updates and saves.
     """
 
-    def __init__(self, stats_file: Path):
+    def __init__(self, stats_file: Path, read_only: bool = False):
         """Initialize usage tracker.
 
         Args:
             stats_file: Path to usage_stats.json file
+            read_only: Load stats for reporting only (default: False)
         """
         self.stats_file = stats_file
-        self.stats: Dict[str, Dict] = {}
+        self.read_only = read_only
+        self._stats: Dict[str, Dict] = {}
+        
+        # Report totals, kept in step with self._stats by increment_appearances()
+        self._total_appearances = 0
+        self._buckets = [0, 0, 0, 0]
+        self._by_category: Dict[str, Dict[str, int]] = {}
         
         # Load existing stats if file exists
         if stats_file.exists():
@@ -57,22 +100,71 @@ class UsageTracker:
     def load_stats(self) -> None:
         """Load existing usage statistics from file."""
         try:
-            with open(self.stats_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self.stats = data
-            logger.info(f"Loaded stats for {len(self.stats)} items from {self.stats_file}")
+            data = read_json_mmap(self.stats_file)
+            if not self.read_only:
+                for entry in data.values():
+                    entry["content_unit_ids"] = set(entry.get("content_unit_ids", ()))
+            self._stats = data
+            self._rebuild_totals()
+            logger.info(f"Loaded stats for {len(self._stats)} items from {self.stats_file}")
         except Exception as e:
             logger.warning(f"Failed to load stats from {self.stats_file}: {e}")
-            self.stats = {}
+            self._stats = {}
+            self._rebuild_totals()
+
+    @property
+    def stats(self) -> Dict[str, Dict]:
+        """Copy of the per-item statistics, keyed by learning item ID.
+
+        Report totals are kept in step with the tracker's own entries, so
+        changes go through increment_appearances() or update_batch().
+        """
+        return {
+            item_id: {**entry, "content_unit_ids": entry["content_unit_ids"].copy()}
+            for item_id, entry in self._stats.items()
+        }
+
+    def _rebuild_totals(self) -> None:
+        """Recompute report totals from scratch after self._stats is replaced."""
+        total_appearances = 0
+        buckets = [0, 0, 0, 0]
+        by_category: Dict[str, Dict[str, int]] = {}
+
+        # Single pass over the entries
+        for item in self._stats.values():
+            count = item["appearances_count"]
+            total_appearances += count
+            buckets[_utilization_bucket(count)] += 1
+            category_totals = by_category.setdefault(
+                item["category"], {"count": 0, "total_appearances": 0}
+            )
+            category_totals["count"] += 1
+            category_totals["total_appearances"] += count
+
+        self._total_appearances = total_appearances
+        self._buckets = buckets
+        self._by_category = by_category
 
     def save_stats(self) -> None:
-        """Save usage statistics to file."""
+        """Save usage statistics to file.
+
+        Raises:
+            RuntimeError: If the tracker was opened read-only
+        """
+        if self.read_only:
+            raise RuntimeError(f"UsageTracker for {self.stats_file} is read-only")
+
         self.stats_file.parent.mkdir(parents=True, exist_ok=True)
         
+        data = {item_id: _entry_snapshot(entry) for item_id, entry in self._stats.items()}
+        
         try:
-            with open(self.stats_file, "w", encoding="utf-8") as f:
-                json.dump(self.stats, f, ensure_ascii=False, indent=2)
-            logger.info(f"Saved stats for {len(self.stats)} items to {self.stats_file}")
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+            write_bytes_atomic(payload, self.stats_file)
+            logger.info(f"Saved stats for {len(self._stats)} items to {self.stats_file}")
         except Exception as e:
             logger.error(f"Failed to save stats to {self.stats_file}: {e}")
             raise
@@ -89,27 +181,45 @@ class UsageTracker:
             learning_item_id: UUID of the learning item
             content_unit_id: UUID of the content unit
             learning_item: Optional full LearningItem for metadata
+
+        Raises:
+            RuntimeError: If the tracker was opened read-only
         """
-        if learning_item_id not in self.stats:
+        if self.read_only:
+            raise RuntimeError(f"UsageTracker for {self.stats_file} is read-only")
+
+        entry = self._stats.get(learning_item_id)
+        if entry is None:
             # Initialize new entry
-            self.stats[learning_item_id] = {
+            entry = self._stats[learning_item_id] = {
                 "item_id": learning_item_id,
                 "target_item": learning_item.target_item if learning_item else "Unknown",
                 "category": learning_item.category.value if learning_item else "unknown",
                 "appearances_count": 0,
-                "content_unit_ids": [],
+                "content_unit_ids": set(),
             }
+            self._buckets[UNUSED] += 1
+            category_totals = self._by_category.setdefault(
+                entry["category"], {"count": 0, "total_appearances": 0}
+            )
+            category_totals["count"] += 1
         
-        # Update counts
-        self.stats[learning_item_id]["appearances_count"] += 1
+        # Update counts, moving the item between buckets on boundary crossings
+        old_bucket = _utilization_bucket(entry["appearances_count"])
+        entry["appearances_count"] += 1
+        new_bucket = _utilization_bucket(entry["appearances_count"])
+        if new_bucket != old_bucket:
+            self._buckets[old_bucket] -= 1
+            self._buckets[new_bucket] += 1
+        self._total_appearances += 1
+        self._by_category[entry["category"]]["total_appearances"] += 1
         
-        # Track content unit IDs (avoid duplicates)
-        if content_unit_id not in self.stats[learning_item_id]["content_unit_ids"]:
-            self.stats[learning_item_id]["content_unit_ids"].append(content_unit_id)
+        # Track content unit IDs (set, so duplicates are ignored)
+        entry["content_unit_ids"].add(content_unit_id)
         
         logger.debug(
             f"Updated usage: {learning_item_id} -> "
-            f"{self.stats[learning_item_id]['appearances_count']} appearances"
+            f"{entry['appearances_count']} appearances"
         )
 
     def update_batch(
@@ -137,7 +247,7 @@ class UsageTracker:
         Returns:
             Dictionary with summary statistics and detailed breakdown
         """
-        if not self.stats:
+        if not self._stats:
             return {
                 "total_items": 0,
                 "total_appearances": 0,
@@ -149,28 +259,21 @@ class UsageTracker:
                 "by_category": {},
             }
 
-        total_items = len(self.stats)
-        total_appearances = sum(item["appearances_count"] for item in self.stats.values())
+        total_items = len(self._stats)
+        total_appearances = self._total_appearances
         avg_appearances = total_appearances / total_items if total_items > 0 else 0
 
         # Categorize by utilization
-        unused = sum(1 for item in self.stats.values() if item["appearances_count"] == 0)
-        underutilized = sum(1 for item in self.stats.values() if 0 < item["appearances_count"] < 3)
-        well_utilized = sum(1 for item in self.stats.values() if 3 <= item["appearances_count"] <= 10)
-        overused = sum(1 for item in self.stats.values() if item["appearances_count"] > 10)
-
-        # Breakdown by category
-        by_category = defaultdict(lambda: {"count": 0, "total_appearances": 0})
-        for item in self.stats.values():
-            category = item["category"]
-            by_category[category]["count"] += 1
-            by_category[category]["total_appearances"] += item["appearances_count"]
-
-        # Calculate averages per category
-        for category in by_category:
-            count = by_category[category]["count"]
-            total = by_category[category]["total_appearances"]
-            by_category[category]["avg_appearances"] = total / count if count > 0 else 0
+        unused, underutilized, well_utilized, overused = self._buckets
+
+        # Breakdown by category, with averages
+        by_category = {}
+        for category, totals in self._by_category.items():
+            count = totals["count"]
+            by_category[category] = {
+                **totals,
+                "avg_appearances": totals["total_appearances"] / count if count > 0 else 0,
+            }
 
         report = {
             "total_items": total_items,
@@ -180,48 +283,60 @@ class UsageTracker:
             "underutilized_items": underutilized,
             "well_utilized_items": well_utilized,
             "overused_items": overused,
-            "by_category": dict(by_category),
+            "by_category": by_category,
         }
 
         return report
 
-    def get_underutilized_items(self, threshold: int = 3) -> List[Dict]:
+    def get_underutilized_items(
+        self, threshold: int = 3, limit: Optional[int] = None
+    ) -> List[Dict]:
         """Get list of underutilized learning items.
 
         Args:
             threshold: Maximum appearance count to be considered underutilized
+            limit: Optional maximum number of items to return (least used first)
 
         Returns:
-            List of item statistics with appearances < threshold
+            List of item statistics with appearances < threshold (copies, with
+            content_unit_ids as sorted lists)
         """
-        underutilized = [
-            item for item in self.stats.values()
+        underutilized = (
+            item for item in self._stats.values()
             if item["appearances_count"] < threshold
-        ]
-        
-        # Sort by appearance count (ascending)
-        underutilized.sort(key=lambda x: x["appearances_count"])
+        )
         
-        return underutilized
-
-    def get_overused_items(self, threshold: int = 10) -> List[Dict]:
+        # Sort by appearance count (ascending); partial sort when limited
+        if limit is not None:
+            items = heapq.nsmallest(limit, underutilized, key=_appearances_count)
+        else:
+            items = sorted(underutilized, key=_appearances_count)
+        return [_entry_snapshot(item) for item in items]
+
+    def get_overused_items(
+        self, threshold: int = 10, limit: Optional[int] = None
+    ) -> List[Dict]:
         """Get list of overused learning items.
 
         Args:
             threshold: Minimum appearance count to be considered overused
+            limit: Optional maximum number of items to return (most used first)
 
         Returns:
-            List of item statistics with appearances > threshold
+            List of item statistics with appearances > threshold (copies, with
+            content_unit_ids as sorted lists)
         """
-        overused = [
-            item for item in self.stats.values()
+        overused = (
+            item for item in self._stats.values()
             if item["appearances_count"] > threshold
-        ]
-        
-        # Sort by appearance count (descending)
-        overused.sort(key=lambda x: x["appearances_count"], reverse=True)
+        )
         
-        return overused
+        # Sort by appearance count (descending); partial sort when limited
+        if limit is not None:
+            items = heapq.nlargest(limit, overused, key=_appearances_count)
+        else:
+            items = sorted(overused, key=_appearances_count, reverse=True)
+        return [_entry_snapshot(item) for item in items]
 
     def print_report(self) -> None:
         """Print formatted usage report to console."""
@@ -6,30 +6,36 @@ generated content only uses characters present in the vocabulary.
 
 import logging
 import re
-from typing import List, Set, Dict, Tuple
+from functools import lru_cache
+from typing import AbstractSet, FrozenSet, List, Sequence, Set, Dict, Tuple
 
 logger = logging.getLogger(__name__)
 
 
-def extract_chinese_characters(text: str) -> Set[str]:
+@lru_cache(maxsize=4096)
+def extract_chinese_characters(text: str) -> FrozenSet[str]:
     """Extract all Chinese characters from text.
     
     Chinese characters are in the CJK Unified Ideographs Unicode block:
     U+4E00 to U+9FFF (most common Chinese characters)
     
+    Results are memoized per text (which must be a hashable str), so the
+    returned set is immutable.
+    
     Args:
         text: Text to extract characters from
         
     Returns:
-        Set of unique Chinese characters
+        Frozen set of unique Chinese characters
         
     Example:
         >>> extract_chinese_characters("我爱学习中文！123 abc")
         {'我', '爱', '学', '习', '中', '文'}
     """
-    # CJK Unified Ideographs range (most common Chinese characters)
-    chinese_chars = set(char for char in text if '\u4e00' <= char <= '\u9fff')
-    return chinese_chars
+    # CJK Unified Ideographs range (most common Chinese characters).
+    # set(text) deduplicates in C first, so the range check runs once per
+    # distinct character; scripts repeat the same few hundred characters.
+    return frozenset(char for char in set(text) if '\u4e00' <= char <= '\u9fff')
 
 
 def extract_japanese_characters(text: str) -> Set[str]:
@@ -102,14 +108,55 @@ def validate_chinese_characters(
         # No Chinese characters found, validation passes
         return True, []
     
-    # Extract all Chinese characters from vocabulary
-    vocab_chars = set()
-    for item in vocab_items:
-        vocab_chars.update(extract_chinese_characters(item))
+    # Find characters in content but not in vocab. content_chars only holds
+    # Chinese characters, so each vocab item can be subtracted as-is (a str
+    # is an iterable of characters) in one C-level pass, without extracting
+    # Chinese characters from every item first
+    return _report_missing_characters(content_chars.difference(*vocab_items))
+
+
+def prepare_vocab_characters(vocab_items: Sequence[str]) -> FrozenSet[str]:
+    """Collect the characters covered by a vocabulary once, for reuse.
+    
+    Pass the result to validate_chinese_characters_prepared() when many
+    content pieces are validated against the same vocabulary, so the
+    vocabulary is scanned once instead of once per content piece.
+    
+    Args:
+        vocab_items: List of vocabulary items (target_item field)
+        
+    Returns:
+        Frozen set of every character appearing in any vocabulary item
+    """
+    return frozenset().union(*vocab_items)
+
+
+def validate_chinese_characters_prepared(
+    content_text: str,
+    vocab_chars: FrozenSet[str]
+) -> Tuple[bool, List[str]]:
+    """Validate Chinese characters in content against prepared vocabulary characters.
     
-    # Find characters in content but not in vocab
-    missing_chars = content_chars - vocab_chars
+    Same result as validate_chinese_characters() for the vocabulary that
+    vocab_chars was prepared from.
     
+    Args:
+        content_text: The content text to validate
+        vocab_chars: Result of prepare_vocab_characters()
+        
+    Returns:
+        Tuple of (is_valid, missing_characters), as validate_chinese_characters()
+        
+    Example:
+        >>> vocab_chars = prepare_vocab_characters(["我", "爱"])
+        >>> validate_chinese_characters_prepared("我爱你", vocab_chars)
+        (False, ['你'])
+    """
+    return _report_missing_characters(extract_chinese_characters(content_text) - vocab_chars)
+
+
+def _report_missing_characters(missing_chars: AbstractSet[str]) -> Tuple[bool, List[str]]:
+    """Build the validation result for a set of missing characters, logging any."""
     if missing_chars:
         logger.warning(
             f"Found {len(missing_chars)} Chinese characters not in vocabulary: "
@@ -4,12 +4,17 @@ This module defines the data models used throughout the pre-generation havachat.
 All models include validation rules and JSON schema generation for contract testing.
 """
 
+import os
+import sys
+from array import array
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
-from typing import List, Optional, TYPE_CHECKING
-from uuid import uuid4
+from typing import Annotated, Iterator, List, Optional, Tuple, TYPE_CHECKING, Union
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator, model_validator
 
 if TYPE_CHECKING:
     from src.models.llm_judge_evaluation import LLMJudgeEvaluation
@@ -101,29 +106,172 @@ class FailureType(str, Enum):
 # ============================================================================
 
 
-class Example(BaseModel):
+# Language codes the pipeline generates content for; checked before the
+# general two-lowercase-letter rule
+_KNOWN_LANGUAGE_CODES = frozenset({"zh", "ja", "fr", "en", "es"})
+
+# Valid MCQOption.option_id (and MCQ answer_key) values
+_MCQ_OPTION_IDS = frozenset({"A", "B", "C", "D"})
+
+# Valid true/false answer_key values (compared lowercased)
+_TRUE_FALSE_ANSWERS = frozenset({"true", "false"})
+
+
+def _check_language_code(value: str) -> str:
+    """Accept a two-letter lowercase ISO 639-1 code without a regex match."""
+    if value in _KNOWN_LANGUAGE_CODES or (
+        len(value) == 2 and value.isascii() and value.isalpha() and value.islower()
+    ):
+        return value
+    raise ValueError("language must be a two-letter lowercase ISO 639-1 code")
+
+
+def _new_id() -> str:
+    """Return a random UUID v4 string, formatted like str(uuid4())."""
+    raw = bytearray(os.urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+# Shared default timestamp while inside a batch_timestamp() block
+_BATCH_TIMESTAMP: ContextVar[Optional[datetime]] = ContextVar("batch_timestamp", default=None)
+
+
+def _now() -> datetime:
+    """Default for audit timestamps: the batch timestamp if set, else now (UTC)."""
+    return _BATCH_TIMESTAMP.get() or datetime.now(UTC)
+
+
+@contextmanager
+def batch_timestamp() -> Iterator[datetime]:
+    """Give every model built inside the block the same default timestamp.
+
+    Bulk builders use this so N models cost one clock read instead of N.
+
+    Example:
+        >>> with batch_timestamp():
+        ...     items = [LearningItem(**row) for row in rows]
+    """
+    now = datetime.now(UTC)
+    token = _BATCH_TIMESTAMP.set(now)
+    try:
+        yield now
+    finally:
+        _BATCH_TIMESTAMP.reset(token)
+
+
+def _schema_example(schema: dict, model_cls: type) -> None:
+    """Add the model's example payload when a JSON schema is generated.
+
+    The payloads live in schema_examples and are only imported here, so
+    importing the models does not build them.
+    """
+    from havachat.validators.schema_examples import SCHEMA_EXAMPLES
+
+    example = SCHEMA_EXAMPLES.get(model_cls.__name__)
+    if example is not None:
+        schema["example"] = example
+
+
+# Shared model configs, assigned by reference. _schema_example looks the
+# example up by class name, so one config serves every class.
+_MODEL_CONFIG = ConfigDict(json_schema_extra=_schema_example)
+
+# Frozen, closed models that are built in bulk and nested into parents
+_HOT_MODEL_CONFIG = ConfigDict(
+    frozen=True,
+    extra="forbid",
+    revalidate_instances="never",
+    validate_assignment=False,
+    arbitrary_types_allowed=False,
+    json_schema_extra=_schema_example,
+)
+
+# Slotted dataclass leaves (Example, Speaker)
+_DATACLASS_CONFIG = ConfigDict(extra="forbid", json_schema_extra=_schema_example)
+
+
+def _intern_code(value):
+    """Intern a language/level code; a corpus repeats the same few values."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _trusted_tuples(data: dict, keys: Tuple[str, ...]) -> dict:
+    """Copy trusted data with the given list fields converted to tuples."""
+    fields = dict(data)
+    for key in keys:
+        if data.get(key) is not None:
+            fields[key] = tuple(data[key])
+    return fields
+
+
+def _fast_construct(model_cls: type, values: dict):
+    """Build a model straight from a complete dict of trusted field values.
+
+    When values holds exactly the model's fields, the dict itself becomes the
+    instance __dict__ (so the caller must not reuse it), skipping
+    model_construct's per-field alias and default handling. Anything else
+    falls back to model_construct.
+    """
+    if values.keys() != model_cls.model_fields.keys() or model_cls.__pydantic_post_init__:
+        return model_cls.model_construct(**values)
+    instance = model_cls.__new__(model_cls)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+def _trusted_datetime(value):
+    """Parse an ISO timestamp read back from disk; pass datetimes through."""
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _check_mcq_question(question: "Question") -> None:
+    """MCQ: exactly 4 options and an A-D answer key."""
+    if not question.options or len(question.options) != 4:
+        raise ValueError("MCQ questions must have exactly 4 options")
+    if question.answer_key not in _MCQ_OPTION_IDS:
+        raise ValueError(
+            "MCQ answer_key must be one of: A, B, C, D"
+        )
+
+
+def _check_true_false_question(question: "Question") -> None:
+    """True/false: no options and a true/false answer key."""
+    if question.options:
+        raise ValueError("True/false questions must not have options")
+    if question.answer_key.lower() not in _TRUE_FALSE_ANSWERS:
+        raise ValueError(
+            "True/false answer_key must be 'true' or 'false'"
+        )
+
+
+# Per-type constraint checks for Question; types not listed have none
+_QUESTION_TYPE_CHECKS = {
+    QuestionType.MCQ: _check_mcq_question,
+    QuestionType.TRUE_FALSE: _check_true_false_question,
+}
+
+
+# Example and Speaker are plain dataclasses: building one in Python skips
+# validation, while pydantic still validates them when they arrive as dicts
+# inside a LearningItem or ContentUnit
+@dataclass(slots=True, frozen=True)
+class Example:
     """Example sentence with translation and optional media."""
 
-    text: str = Field(
-        ..., description="Example text in target language"
-    )
-    translation: str = Field(
-        ..., description="English translation of the example"
-    )
-    media_urls: List[str] = Field(
-        default_factory=list,
-        description="URLs for media resources (audio, image, video)"
-    )
+    text: Annotated[str, Field(description="Example text in target language")]
+    translation: Annotated[str, Field(description="English translation of the example")]
+    media_urls: Annotated[
+        Tuple[str, ...],
+        Field(description="URLs for media resources (audio, image, video)"),
+    ] = ()
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "text": "我去银行取钱。",
-                "translation": "I go to the bank to withdraw money.",
-                "media_urls": []
-            }
-        }
-    }
+    __pydantic_config__ = _DATACLASS_CONFIG
 
 
 class LearningItem(BaseModel):
@@ -137,9 +285,11 @@ class LearningItem(BaseModel):
     max in ordinal comparison
     """
 
-    id: str = Field(default_factory=lambda: str(uuid4()), description="UUID v4")
+    id: str = Field(default_factory=_new_id, description="UUID v4")
     language: str = Field(
-        ..., description="ISO 639-1 code: zh, ja, fr, en, es", pattern="^[a-z]{2}$"
+        ...,
+        description="ISO 639-1 code: zh, ja, fr, en, es",
+        json_schema_extra={"pattern": "^[a-z]{2}$"},
     )
     category: Category
     target_item: str = Field(
@@ -167,11 +317,11 @@ class LearningItem(BaseModel):
     pos: Optional[str] = Field(
         None, description="Part of speech: noun, verb, adj, etc."
     )
-    aliases: List[str] = Field(
-        default_factory=list, description="Alternative forms or spellings"
+    aliases: Tuple[str, ...] = Field(
+        default=(), description="Alternative forms or spellings"
     )
-    media_urls: List[str] = Field(
-        default_factory=list,
+    media_urls: Tuple[str, ...] = Field(
+        default=(),
         description="URLs for media resources (audio, image, video) for this learning item"
     )
 
@@ -185,12 +335,44 @@ class LearningItem(BaseModel):
     )
 
     # Audit fields
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = Field(default_factory=_now)
     version: str = Field(default="1.0.0", description="Schema version")
     source_file: Optional[str] = Field(
         None, description="Original source file path"
     )
 
+    @field_validator("language", "level_min", "level_max", mode="before")
+    @classmethod
+    def intern_codes(cls, v):
+        """Intern language/level codes so loaded items share one string each."""
+        return _intern_code(v)
+
+    @field_validator("language")
+    @classmethod
+    def validate_language(cls, v: str) -> str:
+        """Ensure language is a two-letter lowercase ISO 639-1 code."""
+        return _check_language_code(v)
+
+    @classmethod
+    def from_trusted(cls, data: dict) -> "LearningItem":
+        """Build from data that was validated when it was written.
+
+        Skips pydantic validation entirely (model_construct), converting only
+        enums, timestamps and nested examples. For loaders reading the
+        knowledge repo; untrusted input must still use model_validate().
+        """
+        fields = _trusted_tuples(data, ("aliases", "media_urls"))
+        for key in ("language", "level_min", "level_max"):
+            fields[key] = _intern_code(data[key])
+        fields["category"] = Category(data["category"])
+        fields["level_system"] = LevelSystem(data["level_system"])
+        fields["examples"] = [
+            Example(**_trusted_tuples(e, ("media_urls",))) for e in data["examples"]
+        ]
+        if "created_at" in data:
+            fields["created_at"] = _trusted_datetime(data["created_at"])
+        return cls.model_construct(**fields)
+
     # @field_validator("examples")
     # @classmethod
     # def validate_examples_count(cls, v: List[str]) -> List[str]:
@@ -199,44 +381,7 @@ class LearningItem(BaseModel):
     #         raise ValueError("examples must contain between 3 and 5 items")
     #     return v
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "id": "550e8400-e29b-41d4-a716-446655440000",
-                "language": "zh",
-                "category": "vocab",
-                "target_item": "银行",
-                "definition": "A financial institution where people deposit money and obtain loans",
-                "examples": [
-                    {
-                        "text": "我去银行取钱。",
-                        "translation": "I go to the bank to withdraw money.",
-                        "media_urls": []
-                    },
-                    {
-                        "text": "这家银行提供低利率贷款。",
-                        "translation": "This bank offers low-interest loans.",
-                        "media_urls": []
-                    },
-                    {
-                        "text": "银行的营业时间是周一到周五。",
-                        "translation": "The bank's business hours are Monday to Friday.",
-                        "media_urls": []
-                    }
-                ],
-                "romanization": "yínháng",
-                "sense_gloss": "bank (financial institution)",
-                "lemma": "银行",
-                "pos": "noun",
-                "media_urls": [],
-                "level_system": "hsk",
-                "level_min": "HSK1",
-                "level_max": "HSK1",
-                "created_at": "2026-01-26T12:00:00Z",
-                "version": "1.0.0",
-            }
-        }
-    }
+    model_config = _HOT_MODEL_CONFIG
 
 
 class Segment(BaseModel):
@@ -247,7 +392,7 @@ class Segment(BaseModel):
     )
     text: str = Field(..., description="Text in target language")
     translation: Optional[str] = Field(None, description="English translation")
-    learning_item_ids: List[str] = Field(
+    learning_item_ids: Tuple[str, ...] = Field(
         ..., description="UUIDs of learning items featured in this segment"
     )
     start_time_ms: Optional[int] = Field(
@@ -257,43 +402,22 @@ class Segment(BaseModel):
         None, description="Audio end timestamp (milliseconds)"
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "segment_id": "seg-1",
-                "type": "dialogue",
-                "speaker": "A",
-                "text": "Bonjour! Je m'appelle Alice.",
-                "translation": "Hello! My name is Alice.",
-                "learning_item_ids": [
-                    "550e8400-e29b-41d4-a716-446655440001",
-                    "550e8400-e29b-41d4-a716-446655440002",
-                ],
-                "start_time_ms": None,
-                "end_time_ms": None,
-            }
-        }
-    }
-
-
-class Speaker(BaseModel):
+    model_config = _HOT_MODEL_CONFIG
+
+
+@dataclass(slots=True, frozen=True)
+class Speaker:
     """Speaker metadata for conversations."""
 
-    id: str = Field(..., description="Speaker ID (A, B, C, etc.)")
-    name: str = Field(..., description="Speaker name")
-    role: str = Field(..., description="Speaker role or relationship")
-    gender: Optional[str] = Field(None, description="Speaker gender in English (male/female/any)")
+    id: Annotated[str, Field(description="Speaker ID (A, B, C, etc.)")]
+    name: Annotated[str, Field(description="Speaker name")]
+    role: Annotated[str, Field(description="Speaker role or relationship")]
+    gender: Annotated[
+        Optional[str],
+        Field(description="Speaker gender in English (male/female/any)"),
+    ] = None
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "id": "A",
-                "name": "Alice",
-                "role": "Student",
-                "gender": "female",
-            }
-        }
-    }
+    __pydantic_config__ = _DATACLASS_CONFIG
 
 
 class ContentUnit(BaseModel):
@@ -305,8 +429,12 @@ class ContentUnit(BaseModel):
     - If has_audio=true, all segments must have start_time_ms and end_time_ms
     """
 
-    id: str = Field(default_factory=lambda: str(uuid4()), description="UUID v4")
-    language: str = Field(..., description="ISO 639-1 code", pattern="^[a-z]{2}$")
+    id: str = Field(default_factory=_new_id, description="UUID v4")
+    language: str = Field(
+        ...,
+        description="ISO 639-1 code",
+        json_schema_extra={"pattern": "^[a-z]{2}$"},
+    )
     type: ContentType
     title: str = Field(..., description="Content title")
     description: str = Field(..., description="Brief summary of content")
@@ -316,17 +444,17 @@ class ContentUnit(BaseModel):
         default=None,
         description="Speaker metadata for conversations (id, name, role, gender)"
     )
-    learning_item_ids: List[str] = Field(
+    learning_item_ids: Tuple[str, ...] = Field(
         ...,
         description="All learning items featured in this content (deduplicated)",
     )
 
     # Metadata
-    topic_ids: List[str] = Field(
-        default_factory=list, description="Thematic categories"
+    topic_ids: Tuple[str, ...] = Field(
+        default=(), description="Thematic categories"
     )
-    scenario_ids: List[str] = Field(
-        default_factory=list, description="Concrete situations"
+    scenario_ids: Tuple[str, ...] = Field(
+        default=(), description="Concrete situations"
     )
     level_system: LevelSystem
     level_min: str
@@ -342,7 +470,7 @@ class ContentUnit(BaseModel):
         default=ContentStatus.ACTIVE,
         description="Content validation status (active or for_review)"
     )
-    validation_notes: Optional[List[str]] = Field(
+    validation_notes: Optional[Tuple[str, ...]] = Field(
         default=None,
         description="List of validation issues requiring review"
     )
@@ -352,84 +480,101 @@ class ContentUnit(BaseModel):
     )
 
     # Audit
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = Field(default_factory=_now)
     version: str = Field(default="1.0.0")
 
+    @field_validator("language", "level_min", "level_max", mode="before")
+    @classmethod
+    def intern_codes(cls, v):
+        """Intern language/level codes so loaded items share one string each."""
+        return _intern_code(v)
+
+    @field_validator("language")
+    @classmethod
+    def validate_language(cls, v: str) -> str:
+        """Ensure language is a two-letter lowercase ISO 639-1 code."""
+        return _check_language_code(v)
+
+    @classmethod
+    def from_trusted(cls, data: dict) -> "ContentUnit":
+        """Build from data that was validated when it was written.
+
+        Skips field validation and both model validators below. For loaders
+        reading the knowledge repo; untrusted input must use model_validate().
+        """
+        fields = _trusted_tuples(
+            data, ("learning_item_ids", "topic_ids", "scenario_ids", "validation_notes")
+        )
+        for key in ("language", "level_min", "level_max"):
+            fields[key] = _intern_code(data[key])
+        fields["type"] = ContentType(data["type"])
+        fields["level_system"] = LevelSystem(data["level_system"])
+        fields["segments"] = [
+            _fast_construct(Segment, _trusted_tuples(s, ("learning_item_ids",)))
+            for s in data["segments"]
+        ]
+        if data.get("speakers") is not None:
+            fields["speakers"] = [Speaker(**s) for s in data["speakers"]]
+        if "status" in data:
+            fields["status"] = ContentStatus(data["status"])
+        if data.get("llm_judge_evaluation") is not None:
+            fields["llm_judge_evaluation"] = LLMJudgeEvaluation.model_validate(
+                data["llm_judge_evaluation"]
+            )
+        if "created_at" in data:
+            fields["created_at"] = _trusted_datetime(data["created_at"])
+        return _fast_construct(cls, fields)
+
     @model_validator(mode="after")
     def validate_learning_item_ids(self) -> "ContentUnit":
         """Ensure all segment learning_item_ids are in content-level list."""
-        segment_ids = set()
-        for segment in self.segments:
-            segment_ids.update(segment.learning_item_ids)
-
-        content_ids = set(self.learning_item_ids)
-        missing = segment_ids - content_ids
+        content_ids = frozenset(self.learning_item_ids)
+        missing = [
+            item_id
+            for segment in self.segments
+            for item_id in segment.learning_item_ids
+            if item_id not in content_ids
+        ]
         if missing:
             raise ValueError(
-                f"Segments reference learning_item_ids not in content-level list: {missing}"
+                f"Segments reference learning_item_ids not in content-level list: {set(missing)}"
             )
         return self
 
     @model_validator(mode="after")
     def validate_audio_timestamps(self) -> "ContentUnit":
         """If has_audio=true, all segments must have timestamps."""
-        if self.has_audio:
-            for idx, segment in enumerate(self.segments):
-                if segment.start_time_ms is None or segment.end_time_ms is None:
-                    raise ValueError(
-                        f"Segment at index {idx} missing timestamps (has_audio=true)"
-                    )
+        if not self.has_audio:
+            return self
+        for idx, segment in enumerate(self.segments):
+            start, end = segment.start_time_ms, segment.end_time_ms
+            if start is None or end is None:
+                raise ValueError(
+                    f"Segment at index {idx} missing timestamps (has_audio=true)"
+                )
         return self
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "id": "650e8400-e29b-41d4-a716-446655440000",
-                "language": "fr",
-                "type": "conversation",
-                "title": "Greeting Someone New",
-                "description": "A1 level conversation about meeting someone for the first time",
-                "text": "Alice: Bonjour! Je m'appelle Alice. Bob: Enchanté, Alice. Je suis Bob.",
-                "segments": [
-                    {
-                        "segment_id": "seg-1",
-                        "type": "dialogue",
-                        "speaker": "Alice",
-                        "text": "Bonjour! Je m'appelle Alice.",
-                        "translation": "Hello! My name is Alice.",
-                        "learning_item_ids": [
-                            "550e8400-e29b-41d4-a716-446655440001",
-                            "550e8400-e29b-41d4-a716-446655440002",
-                        ],
-                    }
-                ],
-                "learning_item_ids": [
-                    "550e8400-e29b-41d4-a716-446655440001",
-                    "550e8400-e29b-41d4-a716-446655440002",
-                ],
-                "topic_ids": ["social-interaction"],
-                "scenario_ids": ["meeting-someone-new"],
-                "level_system": "cefr",
-                "level_min": "A1",
-                "level_max": "A1",
-                "word_count": 12,
-                "estimated_reading_time_seconds": 30,
-                "has_audio": False,
-                "has_questions": False,
-                "publishable": False,
-                "created_at": "2026-01-26T12:00:00Z",
-                "version": "1.0.0",
-            }
-        }
-    }
+    model_config = _MODEL_CONFIG
 
 
 class MCQOption(BaseModel):
     """Multiple choice question option."""
 
-    option_id: str = Field(..., description="A, B, C, D", pattern="^[A-D]$")
+    option_id: str = Field(
+        ..., description="A, B, C, D", json_schema_extra={"pattern": "^[A-D]$"}
+    )
     text: str
 
+    @field_validator("option_id")
+    @classmethod
+    def validate_option_id(cls, v: str) -> str:
+        """Ensure option_id is one of A, B, C, D."""
+        if v not in _MCQ_OPTION_IDS:
+            raise ValueError("option_id must be one of: A, B, C, D")
+        return v
+
+    model_config = _HOT_MODEL_CONFIG
+
 
 class Question(BaseModel):
     """Comprehension question for a content unit.
@@ -440,9 +585,9 @@ class Question(BaseModel):
     - segment_range IDs must exist in parent content unit
     """
 
-    id: str = Field(default_factory=lambda: str(uuid4()), description="UUID v4")
+    id: str = Field(default_factory=_new_id, description="UUID v4")
     content_id: str = Field(..., description="Parent content unit UUID")
-    segment_range: Optional[List[str]] = Field(
+    segment_range: Optional[Tuple[str, ...]] = Field(
         None,
         description="Segment IDs this question covers, null for full content",
     )
@@ -464,57 +609,40 @@ class Question(BaseModel):
 
     # Metadata
     difficulty: Difficulty
-    tags: List[str] = Field(
+    tags: Tuple[str, ...] = Field(
         ...,
         description="inference, detail, main-idea, vocab-focus, grammar-focus",
     )
 
     # Audit
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = Field(default_factory=_now)
     version: str = Field(default="1.0.0")
 
+    @classmethod
+    def from_trusted(cls, data: dict) -> "Question":
+        """Build from data that was validated when it was written.
+
+        Skips field validation and the type constraint validator below. For
+        loaders only; untrusted input must use model_validate().
+        """
+        fields = _trusted_tuples(data, ("tags", "segment_range"))
+        fields["question_type"] = QuestionType(data["question_type"])
+        fields["difficulty"] = Difficulty(data["difficulty"])
+        if data.get("options") is not None:
+            fields["options"] = [MCQOption.model_construct(**o) for o in data["options"]]
+        if "created_at" in data:
+            fields["created_at"] = _trusted_datetime(data["created_at"])
+        return cls.model_construct(**fields)
+
     @model_validator(mode="after")
     def validate_question_type_constraints(self) -> "Question":
         """Validate type-specific constraints."""
-        if self.question_type == QuestionType.MCQ:
-            if not self.options or len(self.options) != 4:
-                raise ValueError("MCQ questions must have exactly 4 options")
-            if self.answer_key not in ["A", "B", "C", "D"]:
-                raise ValueError(
-                    "MCQ answer_key must be one of: A, B, C, D"
-                )
-        elif self.question_type == QuestionType.TRUE_FALSE:
-            if self.options:
-                raise ValueError("True/false questions must not have options")
-            if self.answer_key.lower() not in ["true", "false"]:
-                raise ValueError(
-                    "True/false answer_key must be 'true' or 'false'"
-                )
+        check = _QUESTION_TYPE_CHECKS.get(self.question_type)
+        if check is not None:
+            check(self)
         return self
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "id": "750e8400-e29b-41d4-a716-446655440000",
-                "content_id": "650e8400-e29b-41d4-a716-446655440000",
-                "segment_range": ["seg-1", "seg-2"],
-                "question_type": "mcq",
-                "question_text": "What is Alice's name?",
-                "options": [
-                    {"option_id": "A", "text": "Alice"},
-                    {"option_id": "B", "text": "Bob"},
-                    {"option_id": "C", "text": "Claire"},
-                    {"option_id": "D", "text": "Not mentioned"},
-                ],
-                "answer_key": "A",
-                "rationale": "Alice explicitly states 'Je m'appelle Alice' (My name is Alice). This tests basic comprehension of self-introduction patterns.",
-                "difficulty": "easy",
-                "tags": ["detail", "vocab-focus"],
-                "created_at": "2026-01-26T12:00:00Z",
-                "version": "1.0.0",
-            }
-        }
-    }
+    model_config = _HOT_MODEL_CONFIG
 
 
 class Topic(BaseModel):
@@ -533,17 +661,7 @@ class Topic(BaseModel):
         description="For hierarchical topics: food > restaurant-dining",
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "id": "food",
-                "name": "Food & Dining",
-                "aliases": ["cuisine", "eating", "meals"],
-                "language": None,
-                "parent_topic_id": None,
-            }
-        }
-    }
+    model_config = _MODEL_CONFIG
 
 
 class Scenario(BaseModel):
@@ -607,64 +725,68 @@ class Scenario(BaseModel):
     )
 
     # Audit
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = Field(default_factory=_now)
+    updated_at: datetime = Field(default_factory=_now)
     source: str = Field(
         default="manual", description="manual, live-api, imported"
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "id": "ordering-at-restaurant",
-                "name": "Ordering Food at a Restaurant",
-                "aliases": ["restaurant order", "dining out"],
-                "topic_id": "food",
-                "language": None,
-                "description": "Interacting with a server to order food and drinks at a casual restaurant",
-                "tags": ["transactional", "public", "informal"],
-                "formality": "informal",
-                "setting": "public",
-                "participant_count": "one-on-one",
-                "interaction_type": "transactional",
-                "content_unit_ids": [],
-                "learning_item_ids": [],
-                "usage_count": 0,
-                "last_used": None,
-                "embedding": None,
-                "created_at": "2026-01-26T12:00:00Z",
-                "updated_at": "2026-01-26T12:00:00Z",
-                "source": "manual",
-            }
-        }
-    }
-
-
-class UsageStats(BaseModel):
+    @classmethod
+    def from_trusted(cls, data: dict) -> "Scenario":
+        """Build from data that was validated when it was written.
+
+        Skips pydantic validation (model_construct). For loaders only;
+        untrusted input must use model_validate().
+        """
+        fields = dict(data)
+        for key in ("last_used", "created_at", "updated_at"):
+            if data.get(key) is not None:
+                fields[key] = _trusted_datetime(data[key])
+        return cls.model_construct(**fields)
+
+    def embedding_vector(self) -> Optional[array]:
+        """Return the embedding packed into a float32 array for similarity code."""
+        if self.embedding is None:
+            return None
+        return array("f", self.embedding)
+
+    model_config = _MODEL_CONFIG
+
+
+# UsageStats and FlaggedItem are created in bulk (one per learning item, one
+# per failure), so like Example they are slotted dataclasses, not models
+@dataclass(slots=True)
+class UsageStats:
     """Track how often each learning item appears in published content."""
 
     learning_item_id: str
-    appearances_count: int = Field(
-        default=0,
-        description="Number of published content units featuring this item",
-    )
-    last_used_content_id: Optional[str] = Field(None)
-    last_updated: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    appearances_count: Annotated[
+        int, Field(description="Number of published content units featuring this item")
+    ] = 0
+    last_used_content_id: Optional[str] = None
+    last_updated: datetime = field(default_factory=_now)
+
+    def model_dump(self) -> dict:
+        """Return the fields as a dict, like BaseModel.model_dump()."""
+        return asdict(self)
 
 
-class FlaggedItem(BaseModel):
+@dataclass(slots=True)
+class FlaggedItem:
     """QA gate failure details for a single item."""
 
     item_id: str
-    item_type: str = Field(
-        ..., description="learning_item, content_unit, question"
-    )
+    item_type: Annotated[str, Field(description="learning_item, content_unit, question")]
     failure_type: FailureType
     failure_reason: str
-    line_reference: Optional[str] = Field(
-        None, description="File path or segment ID"
-    )
-    suggested_fix: Optional[str] = Field(None)
+    line_reference: Annotated[
+        Optional[str], Field(description="File path or segment ID")
+    ] = None
+    suggested_fix: Optional[str] = None
+
+    def model_dump(self) -> dict:
+        """Return the fields as a dict, like BaseModel.model_dump()."""
+        return asdict(self)
 
 
 class ValidationReport(BaseModel):
@@ -673,10 +795,10 @@ class ValidationReport(BaseModel):
     Contains summary statistics and flagged items requiring manual review.
     """
 
-    batch_id: str = Field(default_factory=lambda: str(uuid4()), description="UUID for this QA run")
+    batch_id: str = Field(default_factory=_new_id, description="UUID for this QA run")
     language: str
     level: str
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = Field(default_factory=_now)
     total_items: int
     passed_count: int
     failed_count: int
@@ -685,33 +807,23 @@ class ValidationReport(BaseModel):
         ..., description="Pass rate, most common failures"
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "batch_id": "850e8400-e29b-41d4-a716-446655440000",
-                "language": "fr",
-                "level": "A1",
-                "timestamp": "2026-01-26T12:00:00Z",
-                "total_items": 100,
-                "passed_count": 95,
-                "failed_count": 5,
-                "flagged_items": [
-                    {
-                        "item_id": "550e8400-e29b-41d4-a716-446655440003",
-                        "item_type": "learning_item",
-                        "failure_type": "duplication",
-                        "failure_reason": "Duplicate target_item 'banco' with same sense_gloss 'bank (financial)'",
-                        "line_reference": "French/A1/vocab/item-550e8400-e29b-41d4-a716-446655440003.json",
-                        "suggested_fix": "Add sense_gloss disambiguation or merge items",
-                    }
-                ],
-                "summary_stats": {
-                    "pass_rate_percent": 95,
-                    "most_common_failures": ["duplication", "presence_check"],
-                },
-            }
-        }
-    }
+    @classmethod
+    def from_trusted(cls, data: dict) -> "ValidationReport":
+        """Build from data that was validated when it was written.
+
+        Skips pydantic validation (model_construct). For loaders only;
+        untrusted input must use model_validate().
+        """
+        fields = dict(data)
+        fields["flagged_items"] = [
+            FlaggedItem(**{**item, "failure_type": FailureType(item["failure_type"])})
+            for item in data["flagged_items"]
+        ]
+        if "timestamp" in data:
+            fields["timestamp"] = _trusted_datetime(data["timestamp"])
+        return cls.model_construct(**fields)
+
+    model_config = _MODEL_CONFIG
 
 
 # Rebuild ContentUnit model after LLMJudgeEvaluation is fully defined
@@ -723,3 +835,46 @@ except ImportError:
     # If LLMJudgeEvaluation is not available, ContentUnit can still be used
     # but llm_judge_evaluation field will remain optional
     pass
+
+
+# ============================================================================
+# Bulk validators
+# ============================================================================
+
+# Each adapter validates a whole batch in a single pydantic-core call. They
+# are compiled on first access by __getattr__ below, not at import, and then
+# cached as ordinary module attributes.
+_ADAPTER_TYPES = {
+    "LIST_LEARNING_ITEM_ADAPTER": List[LearningItem],
+    "LIST_CONTENT_UNIT_ADAPTER": List[ContentUnit],
+    "LIST_QUESTION_ADAPTER": List[Question],
+    # Learning item files hold either a single item or an array of items
+    "_LEARNING_ITEM_FILE_ADAPTER": Union[List[LearningItem], LearningItem],
+}
+
+
+def __getattr__(name: str) -> TypeAdapter:
+    """Build a bulk TypeAdapter the first time it is accessed (PEP 562)."""
+    try:
+        adapter_type = _ADAPTER_TYPES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    adapter = globals()[name] = TypeAdapter(adapter_type)
+    return adapter
+
+
+def load_learning_items(payload: bytes) -> List[LearningItem]:
+    """Validate a JSON learning item file (single object or array).
+
+    Args:
+        payload: Raw file contents, parsed by pydantic-core directly
+
+    Returns:
+        List of validated LearningItem objects
+
+    Raises:
+        ValidationError: If the JSON is malformed or any item is invalid
+    """
+    adapter = getattr(sys.modules[__name__], "_LEARNING_ITEM_FILE_ADAPTER")
+    items = adapter.validate_json(payload)
+    return items if isinstance(items, list) else [items]
@@ -0,0 +1,170 @@
+"""Example payloads for the JSON schemas of the pipeline models.
+
+Kept out of schema.py so that importing the models does not build these
+dicts; schema._schema_example() imports this module on first schema
+generation.
+"""
+
+SCHEMA_EXAMPLES = {
+    "Example": {
+        "text": "我去银行取钱。",
+        "translation": "I go to the bank to withdraw money.",
+        "media_urls": []
+    },
+    "LearningItem": {
+        "id": "550e8400-e29b-41d4-a716-446655440000",
+        "language": "zh",
+        "category": "vocab",
+        "target_item": "银行",
+        "definition": "A financial institution where people deposit money and obtain loans",
+        "examples": [
+            {
+                "text": "我去银行取钱。",
+                "translation": "I go to the bank to withdraw money.",
+                "media_urls": []
+            },
+            {
+                "text": "这家银行提供低利率贷款。",
+                "translation": "This bank offers low-interest loans.",
+                "media_urls": []
+            },
+            {
+                "text": "银行的营业时间是周一到周五。",
+                "translation": "The bank's business hours are Monday to Friday.",
+                "media_urls": []
+            }
+        ],
+        "romanization": "yínháng",
+        "sense_gloss": "bank (financial institution)",
+        "lemma": "银行",
+        "pos": "noun",
+        "media_urls": [],
+        "level_system": "hsk",
+        "level_min": "HSK1",
+        "level_max": "HSK1",
+        "created_at": "2026-01-26T12:00:00Z",
+        "version": "1.0.0",
+    },
+    "Segment": {
+        "speaker": "A",
+        "text": "Bonjour! Je m'appelle Alice.",
+        "translation": "Hello! My name is Alice.",
+        "learning_item_ids": [
+            "550e8400-e29b-41d4-a716-446655440001",
+            "550e8400-e29b-41d4-a716-446655440002",
+        ],
+        "start_time_ms": None,
+        "end_time_ms": None,
+    },
+    "Speaker": {
+        "id": "A",
+        "name": "Alice",
+        "role": "Student",
+        "gender": "female",
+    },
+    "ContentUnit": {
+        "id": "650e8400-e29b-41d4-a716-446655440000",
+        "language": "fr",
+        "type": "conversation",
+        "title": "Greeting Someone New",
+        "description": "A1 level conversation about meeting someone for the first time",
+        "text": "Alice: Bonjour! Je m'appelle Alice. Bob: Enchanté, Alice. Je suis Bob.",
+        "segments": [
+            {
+                "speaker": "Alice",
+                "text": "Bonjour! Je m'appelle Alice.",
+                "translation": "Hello! My name is Alice.",
+                "learning_item_ids": [
+                    "550e8400-e29b-41d4-a716-446655440001",
+                    "550e8400-e29b-41d4-a716-446655440002",
+                ],
+            }
+        ],
+        "learning_item_ids": [
+            "550e8400-e29b-41d4-a716-446655440001",
+            "550e8400-e29b-41d4-a716-446655440002",
+        ],
+        "topic_ids": ["social-interaction"],
+        "scenario_ids": ["meeting-someone-new"],
+        "level_system": "cefr",
+        "level_min": "A1",
+        "level_max": "A1",
+        "word_count": 12,
+        "estimated_reading_time_seconds": 30,
+        "has_audio": False,
+        "has_questions": False,
+        "publishable": False,
+        "created_at": "2026-01-26T12:00:00Z",
+        "version": "1.0.0",
+    },
+    "Question": {
+        "id": "750e8400-e29b-41d4-a716-446655440000",
+        "content_id": "650e8400-e29b-41d4-a716-446655440000",
+        "segment_range": ["seg-1", "seg-2"],
+        "question_type": "mcq",
+        "question_text": "What is Alice's name?",
+        "options": [
+            {"option_id": "A", "text": "Alice"},
+            {"option_id": "B", "text": "Bob"},
+            {"option_id": "C", "text": "Claire"},
+            {"option_id": "D", "text": "Not mentioned"},
+        ],
+        "answer_key": "A",
+        "rationale": "Alice explicitly states 'Je m'appelle Alice' (My name is Alice). This tests basic comprehension of self-introduction patterns.",
+        "difficulty": "easy",
+        "tags": ["detail", "vocab-focus"],
+        "created_at": "2026-01-26T12:00:00Z",
+        "version": "1.0.0",
+    },
+    "Topic": {
+        "id": "food",
+        "name": "Food & Dining",
+        "aliases": ["cuisine", "eating", "meals"],
+        "language": None,
+        "parent_topic_id": None,
+    },
+    "Scenario": {
+        "id": "ordering-at-restaurant",
+        "name": "Ordering Food at a Restaurant",
+        "aliases": ["restaurant order", "dining out"],
+        "topic_id": "food",
+        "language": None,
+        "description": "Interacting with a server to order food and drinks at a casual restaurant",
+        "tags": ["transactional", "public", "informal"],
+        "formality": "informal",
+        "setting": "public",
+        "participant_count": "one-on-one",
+        "interaction_type": "transactional",
+        "content_unit_ids": [],
+        "learning_item_ids": [],
+        "usage_count": 0,
+        "last_used": None,
+        "embedding": None,
+        "created_at": "2026-01-26T12:00:00Z",
+        "updated_at": "2026-01-26T12:00:00Z",
+        "source": "manual",
+    },
+    "ValidationReport": {
+        "batch_id": "850e8400-e29b-41d4-a716-446655440000",
+        "language": "fr",
+        "level": "A1",
+        "timestamp": "2026-01-26T12:00:00Z",
+        "total_items": 100,
+        "passed_count": 95,
+        "failed_count": 5,
+        "flagged_items": [
+            {
+                "item_id": "550e8400-e29b-41d4-a716-446655440003",
+                "item_type": "learning_item",
+                "failure_type": "duplication",
+                "failure_reason": "Duplicate target_item 'banco' with same sense_gloss 'bank (financial)'",
+                "line_reference": "French/A1/vocab/item-550e8400-e29b-41d4-a716-446655440003.json",
+                "suggested_fix": "Add sense_gloss disambiguation or merge items",
+            }
+        ],
+        "summary_stats": {
+            "pass_rate_percent": 95,
+            "most_common_failures": ["duplication", "presence_check"],
+        },
+    },
+}
@@ -1,11 +1,66 @@
 """Voice configuration validation logic."""
 
-import json
+import logging
 import random
+import string
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 from havachat.models.voice_config import VoiceConfig, VoiceConfigCollection
+from havachat.utils.file_io import read_json_mmap
+
+logger = logging.getLogger(__name__)
+
+# Speaker IDs handed out in order: A, B, C, ...
+_SPEAKER_IDS = tuple(string.ascii_uppercase)
+
+
+@lru_cache(maxsize=32)
+def _load_collection(config_path: Path, mtime: float) -> VoiceConfigCollection:
+    """Parse a voice config file, cached per path and modification time.
+    
+    The mtime argument is only part of the cache key, so an edited file
+    is re-read on the next lookup. Validators share the returned
+    collection, so treat it as read-only.
+    """
+    # Memory-mapped and parsed in place by orjson when it is installed
+    data = read_json_mmap(config_path)
+    
+    return VoiceConfigCollection(**data)
+
+
+class _VoiceIndex(NamedTuple):
+    """Lookup tables over a VoiceConfigCollection, in config order."""
+    
+    by_id: Dict[str, VoiceConfig]
+    # Keyed by (language, gender); gender None holds every gender
+    conv_by_lang_gender: Dict[Tuple[str, Optional[str]], List[VoiceConfig]]
+    single_by_lang_gender: Dict[Tuple[str, Optional[str]], List[VoiceConfig]]
+    all_languages: List[str]
+
+
+@lru_cache(maxsize=32)
+def _load_index(config_path: Path, mtime: float) -> Tuple[VoiceConfigCollection, _VoiceIndex]:
+    """Load a voice config file and build its lookup tables, cached like _load_collection."""
+    collection = _load_collection(config_path, mtime)
+    
+    by_id: Dict[str, VoiceConfig] = {}
+    conv: Dict[Tuple[str, Optional[str]], List[VoiceConfig]] = {}
+    single: Dict[Tuple[str, Optional[str]], List[VoiceConfig]] = {}
+    
+    for voice in collection.voices:
+        # First voice wins on duplicate IDs, as in get_voice_by_id()
+        by_id.setdefault(voice.voice_id, voice)
+        table = conv if voice.is_conversation_voice() else single
+        for language in voice.supported_languages:
+            table.setdefault((language, None), []).append(voice)
+            table.setdefault((language, voice.gender), []).append(voice)
+    
+    all_languages = sorted(
+        {language for voice in collection.voices for language in voice.supported_languages}
+    )
+    return collection, _VoiceIndex(by_id, conv, single, all_languages)
 
 
 class VoiceConfigValidator:
@@ -32,10 +87,22 @@ class VoiceConfigValidator:
                 f"Expected voice_config_{self.language_code}.json in {self.config_dir}"
             )
         
-        with open(self.config_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        self.config = VoiceConfigCollection(**data)
+        self.config, index = _load_index(self.config_path, self.config_path.stat().st_mtime)
+        self._by_id = index.by_id
+        self._conv_by_lang_gender = index.conv_by_lang_gender
+        self._single_by_lang_gender = index.single_by_lang_gender
+        self._all_languages = index.all_languages
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached voice configurations so the next load re-reads disk."""
+        _load_collection.cache_clear()
+        _load_index.cache_clear()
+    
+    def _conversation_voices(self, gender: str | None) -> List[VoiceConfig]:
+        """Conversation voices for this language; any gender but male/female matches all."""
+        key_gender = gender if gender in ("male", "female") else None
+        return self._conv_by_lang_gender.get((self.language_code, key_gender), [])
     
     def validate_voice_config(self, voice_id: str) -> tuple[bool, str]:
         """Validate that a voice ID exists and supports the target language.
@@ -49,7 +116,7 @@ class VoiceConfigValidator:
         if not self.config:
             return False, "Voice configuration not loaded"
         
-        voice = self.config.get_voice_by_id(voice_id)
+        voice = self._by_id.get(voice_id)
         if not voice:
             return False, f"Voice ID '{voice_id}' not found in configuration"
         
@@ -76,10 +143,9 @@ class VoiceConfigValidator:
         if not self.config:
             return False, "Voice configuration not loaded"
         
-        # Check that we have conversation voices for each required gender
-        for i, gender in enumerate(speaker_genders):
-            voices = self.config.get_conversation_voices(self.language_code, gender)
-            if not voices:
+        # Check each distinct gender once, in first-seen order so the error is stable
+        for gender in dict.fromkeys(speaker_genders):
+            if not self._conversation_voices(gender):
                 return False, (
                     f"No conversation voices found for gender '{gender}' "
                     f"in language '{self.language_code}'"
@@ -99,7 +165,7 @@ class VoiceConfigValidator:
         if not self.config:
             return None
         
-        voices = self.config.get_single_voices(self.language_code, gender)
+        voices = self._single_by_lang_gender.get((self.language_code, gender or None))
         return voices[0] if voices else None
     
     def get_conversation_voices_for_speakers(
@@ -120,27 +186,40 @@ class VoiceConfigValidator:
         if not self.config:
             return {}
         
-        voice_mapping = {}
-        speaker_ids = [chr(65 + i) for i in range(len(speaker_genders))]  # A, B, C, ...
+        # Group speakers by gender so each gender's voices are drawn in one call
+        speakers_by_gender: Dict[str, List[str]] = {}
+        for speaker_id, gender in zip(_SPEAKER_IDS, speaker_genders):
+            speakers_by_gender.setdefault(gender, []).append(speaker_id)
+        
+        selected: Dict[str, str] = {}
         used_voice_ids = set()
         
-        for speaker_id, gender in zip(speaker_ids, speaker_genders):
-            # Get all conversation voices for this gender
-            voices = self.config.get_conversation_voices(self.language_code, gender)
-            if voices:
-                # Filter out already-used voices
-                available_voices = [v for v in voices if v.voice_id not in used_voice_ids]
-                if not available_voices:
-                    # If all voices of this gender are used, allow reuse but log warning
-                    available_voices = voices
-                    import logging
-                    logger = logging.getLogger(__name__)
-                    logger.warning(f"All {gender} voices already used, reusing a voice for speaker {speaker_id}")
-                
-                # Randomly select one
-                selected_voice = random.choice(available_voices)
-                voice_mapping[speaker_id] = selected_voice.voice_id
-                used_voice_ids.add(selected_voice.voice_id)
+        for gender, speaker_ids in speakers_by_gender.items():
+            voices = self._conversation_voices(gender)
+            if not voices:
+                continue
+            
+            # Distinct voices first, then reuse once this gender runs out
+            available_voices = [v for v in voices if v.voice_id not in used_voice_ids]
+            picks = random.sample(available_voices, min(len(speaker_ids), len(available_voices)))
+            shortfall = len(speaker_ids) - len(picks)
+            if shortfall:
+                logger.warning(
+                    f"All {gender} voices already used, reusing a voice for speakers "
+                    f"{', '.join(speaker_ids[-shortfall:])}"
+                )
+                picks += random.choices(voices, k=shortfall)
+            
+            for speaker_id, voice in zip(speaker_ids, picks):
+                selected[speaker_id] = voice.voice_id
+                used_voice_ids.add(voice.voice_id)
+        
+        # Return in speaker order
+        voice_mapping = {
+            speaker_id: selected[speaker_id]
+            for speaker_id in _SPEAKER_IDS[:len(speaker_genders)]
+            if speaker_id in selected
+        }
         
         return voice_mapping
     
@@ -149,11 +228,7 @@ class VoiceConfigValidator:
         if not self.config:
             return []
         
-        languages = set()
-        for voice in self.config.voices:
-            languages.update(voice.supported_languages)
-        
-        return sorted(list(languages))
+        return list(self._all_languages)
 
 
 def validate_voice_config(voice_id: str, language_code: str, config_dir: str | Path | None = None) -> tuple[bool, str]:
@@ -7,7 +7,7 @@ Enables bidirectional sync and prevents duplicate row creation.
 from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class NotionMapping(BaseModel):
@@ -17,6 +17,9 @@ class NotionMapping(BaseModel):
     - Updates to existing Notion rows (vs creating duplicates)
     - Status synchronization between Notion and local files
     - Audit trail of push/sync operations
+    
+    Instances are immutable; NotionMappingManager replaces them with
+    model_copy(update=...) so its column index cannot drift out of sync.
     """
     
     content_id: str = Field(..., description="Local content UUID")
@@ -49,8 +52,9 @@ class NotionMapping(BaseModel):
         description="Status in local JSON file (pending_review, approved, rejected, published)"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "content_id": "abc123-def456-ghi789",
                 "notion_page_id": "notion-page-xyz789",
@@ -64,6 +68,7 @@ class NotionMapping(BaseModel):
                 "status_in_local": "approved"
             }
         }
+    )
 
 
 class NotionPushQueue(BaseModel):
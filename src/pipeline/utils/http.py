@@ -0,0 +1,32 @@
+"""
+Shared HTTP session for REST API clients.
+
+requests.get()/post() open a new connection, including the TLS handshake,
+for every call. Clients that talk to the same host many times per run
+(e.g. NotionClient pushing and polling pages) share one pooled Session
+instead, so connections are reused across calls and threads.
+"""
+
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Connections kept open per host; covers NotionClient.PUSH_MAX_WORKERS
+# threads plus the occasional concurrent schema or status query
+POOL_MAXSIZE = 16
+
+
+@lru_cache(maxsize=1)
+def get_session() -> requests.Session:
+    """
+    Return the process-wide requests Session, created on first use.
+
+    Returns:
+        Session with a connection pool mounted for http and https
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
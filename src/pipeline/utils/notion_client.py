@@ -12,15 +12,18 @@ used for human review of generated content. It handles:
 
 import json
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import requests
 from pydantic import ValidationError
 
 from src.models.llm_judge_evaluation import LLMJudgeEvaluation
 from src.models.notion_mapping import NotionPushQueue
+from src.pipeline.utils.http import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +66,13 @@ class NotionClient:
     RETRY_BASE_DELAY = 1.0  # seconds
     RETRY_MULTIPLIER = 2.0
     
+    # Concurrent pushes; Notion allows about 3 requests per second on average
+    # and answers bursts above that with 429s, which the retry loop absorbs
+    PUSH_MAX_WORKERS = 5
+    
+    # Seconds a retrieved data source schema is reused before refetching
+    SCHEMA_CACHE_TTL = 300
+    
     # Notion API configuration
     NOTION_API_VERSION = "2025-09-03"
     NOTION_API_BASE = "https://api.notion.com/v1"
@@ -71,7 +81,8 @@ class NotionClient:
         self,
         api_token: str,
         database_id: str,
-        queue_file: str = "notion_push_queue.jsonl"
+        queue_file: str = "notion_push_queue.jsonl",
+        session: Optional[requests.Session] = None
     ):
         """
         Initialize Notion client.
@@ -80,16 +91,24 @@ class NotionClient:
             api_token: Notion integration API token
             database_id: Notion database ID
             queue_file: Path to failed push queue file
+            session: HTTP session to send requests with (default: the shared
+                pooled session from get_session())
         """
         self.api_token = api_token
         self.database_id = database_id
         self.queue_file = queue_file
+        self.session = session or get_session()
         self.headers = {
             "Authorization": f"Bearer {self.api_token}",
             "Notion-Version": self.NOTION_API_VERSION,
             "Content-Type": "application/json"
         }
         self.data_source_id = None  # Will be fetched on first use
+        # Data source properties and when they were fetched (time.monotonic())
+        self._schema_cache: Optional[Dict[str, Any]] = None
+        self._schema_cache_ts = 0.0
+        # push_conversations() may queue failures from several threads
+        self._queue_lock = threading.Lock()
         
     def _get_data_source_id(self) -> str:
         """
@@ -104,7 +123,7 @@ class NotionClient:
             
         # Retrieve database to get data sources
         url = f"{self.NOTION_API_BASE}/databases/{self.database_id}"
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url, headers=self.headers)
         response.raise_for_status()
         database = response.json()
         
@@ -118,23 +137,41 @@ class NotionClient:
         
         return self.data_source_id
         
+    def _get_data_source_properties(self) -> Dict[str, Any]:
+        """
+        Fetch the data source properties (schema), reusing them for SCHEMA_CACHE_TTL seconds.
+        
+        Returns:
+            Properties dict keyed by column name
+        """
+        now = time.monotonic()
+        if self._schema_cache is not None and now - self._schema_cache_ts < self.SCHEMA_CACHE_TTL:
+            return self._schema_cache
+            
+        # Get data source ID first (API v2025-09-03)
+        data_source_id = self._get_data_source_id()
+        
+        # Retrieve data source to get properties (schema)
+        url = f"{self.NOTION_API_BASE}/data_sources/{data_source_id}"
+        response = self.session.get(url, headers=self.headers)
+        response.raise_for_status()
+        
+        self._schema_cache = response.json().get("properties", {})
+        self._schema_cache_ts = now
+        return self._schema_cache
+        
     def validate_database_schema(self) -> None:
         """
         Validate that Notion database has expected schema.
         
+        The schema is fetched at most once per SCHEMA_CACHE_TTL seconds, so
+        repeated calls in a long-running sync loop do not hit the API.
+        
         Raises:
             NotionSchemaError: If schema doesn't match expected structure
         """
         try:
-            # Get data source ID first (API v2025-09-03)
-            data_source_id = self._get_data_source_id()
-            
-            # Retrieve data source to get properties (schema)
-            url = f"{self.NOTION_API_BASE}/data_sources/{data_source_id}"
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            data_source = response.json()
-            properties = data_source.get("properties", {})
+            properties = self._get_data_source_properties()
             
             # Check each required column
             missing_columns = []
@@ -214,6 +251,43 @@ class NotionClient:
             lines.append(f"{speaker}: {translation}")
         return "\n".join(lines)
         
+    def _build_page_payload(
+        self,
+        content_type: str,
+        title: str,
+        description: Optional[str],
+        topic: Optional[str],
+        scenario: Optional[str],
+        segments: List[Dict[str, Any]],
+        llm_evaluation: Optional[LLMJudgeEvaluation],
+    ) -> Dict[str, Any]:
+        """
+        Build the Notion page properties for a conversation/story.
+        
+        Returns:
+            Properties dict keyed by column name
+        """
+        # Format script and translation
+        script = self.format_script(segments)
+        translation = self.format_translation(segments)
+        
+        # Serialize LLM evaluation
+        llm_comment = llm_evaluation.to_json_string() if llm_evaluation else ""
+        
+        return {
+            "Type": {"select": {"name": content_type}},
+            "Title": {"title": [{"text": {"content": title}}]},
+            "Description": {"rich_text": [{"text": {"content": description or ""}}]},
+            "Topic": {"rich_text": [{"text": {"content": topic or ""}}]},
+            "Scenario": {"rich_text": [{"text": {"content": scenario or ""}}]},
+            "Script": {"rich_text": [{"text": {"content": script}}]},
+            "Translation": {"rich_text": [{"text": {"content": translation}}]},
+            "Audio": {"files": []},  # Empty until generated (files type, not url)
+            "LLM Comment": {"rich_text": [{"text": {"content": llm_comment}}]},
+            "Human Comment": {"rich_text": []},
+            "Status": {"status": {"name": "Not started"}},  # status type, not select
+        }
+        
     def push_conversation(
         self,
         content_id: Optional[str] = None,
@@ -275,27 +349,15 @@ class NotionClient:
         if not all([content_id, content_type, title, segments, language, level]):
             raise ValueError("Missing required parameters for push_conversation")
         
-        # Format script and translation
-        script = self.format_script(segments)
-        translation = self.format_translation(segments)
-        
-        # Serialize LLM evaluation
-        llm_comment = llm_evaluation.to_json_string() if llm_evaluation else ""
-        
-        # Build payload
-        payload = {
-            "Type": {"select": {"name": content_type}},
-            "Title": {"title": [{"text": {"content": title}}]},
-            "Description": {"rich_text": [{"text": {"content": description or ""}}]},
-            "Topic": {"rich_text": [{"text": {"content": topic or ""}}]},
-            "Scenario": {"rich_text": [{"text": {"content": scenario or ""}}]},
-            "Script": {"rich_text": [{"text": {"content": script}}]},
-            "Translation": {"rich_text": [{"text": {"content": translation}}]},
-            "Audio": {"files": []},  # Empty until generated (files type, not url)
-            "LLM Comment": {"rich_text": [{"text": {"content": llm_comment}}]},
-            "Human Comment": {"rich_text": []},
-            "Status": {"status": {"name": "Not started"}},  # status type, not select
-        }
+        payload = self._build_page_payload(
+            content_type=content_type,
+            title=title,
+            description=description,
+            topic=topic,
+            scenario=scenario,
+            segments=segments,
+            llm_evaluation=llm_evaluation,
+        )
         
         # Retry with exponential backoff
         last_error = None
@@ -313,7 +375,7 @@ class NotionClient:
                     },
                     "properties": payload
                 }
-                response = requests.post(url, headers=self.headers, json=body)
+                response = self.session.post(url, headers=self.headers, json=body)
                 response.raise_for_status()
                 result = response.json()
                 notion_page_id = result["id"]
@@ -345,6 +407,53 @@ class NotionClient:
         
         raise Exception(f"Failed to push content after {self.MAX_RETRIES} attempts: {last_error}")
         
+    def push_conversations(
+        self,
+        content_units: List[Any],
+        max_workers: int = PUSH_MAX_WORKERS,
+        on_result: Optional[Callable[[Any, Union[str, Exception]], None]] = None
+    ) -> List[Union[str, Exception]]:
+        """
+        Push several ContentUnit objects to Notion concurrently.
+        
+        Each push runs push_conversation() on a worker thread, so retries and
+        the failed push queue behave as for a single push. A failed push does
+        not stop the others.
+        
+        Args:
+            content_units: ContentUnit objects to push
+            max_workers: Maximum number of concurrent pushes (default: 5)
+            on_result: Called on the calling thread with (content_unit, page ID
+                or exception) as each push finishes, e.g. to save its mapping
+                before the rest of the batch completes
+            
+        Returns:
+            Notion page ID or the raised exception for each content unit,
+            in input order
+        """
+        if not content_units:
+            return []
+            
+        # Resolve the data source once instead of once per worker; on failure
+        # each push retries it as usual
+        try:
+            self._get_data_source_id()
+        except Exception as e:
+            logger.warning(f"Failed to resolve data source before pushing: {e}")
+        
+        results: List[Union[str, Exception]] = [None] * len(content_units)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.push_conversation, content_unit=content_unit): index
+                for index, content_unit in enumerate(content_units)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                results[index] = future.exception() or future.result()
+                if on_result is not None:
+                    on_result(content_units[index], results[index])
+        return results
+        
     def _queue_failed_push(
         self,
         content_id: str,
@@ -380,7 +489,7 @@ class NotionClient:
         )
         
         # Append to queue file (newline-delimited JSON)
-        with open(self.queue_file, "a") as f:
+        with self._queue_lock, open(self.queue_file, "a") as f:
             f.write(queue_entry.model_dump_json() + "\n")
             
         logger.error(f"Queued failed push: {content_id} ({title})")
@@ -414,7 +523,7 @@ class NotionClient:
             # Query data source using REST API (API v2025-09-03)
             data_source_id = self._get_data_source_id()
             url = f"{self.NOTION_API_BASE}/data_sources/{data_source_id}/query"
-            response = requests.post(url, headers=self.headers, json=body)
+            response = self.session.post(url, headers=self.headers, json=body)
             response.raise_for_status()
             data = response.json()
             results = data.get("results", [])
@@ -482,7 +591,7 @@ class NotionClient:
                     }
                 }
             }
-            response = requests.patch(url, headers=self.headers, json=body)
+            response = self.session.patch(url, headers=self.headers, json=body)
             response.raise_for_status()
             logger.info(f"Updated audio URL for {notion_page_id}")
             
@@ -517,7 +626,7 @@ class NotionClient:
                     "Status": {"status": {"name": status}}  # status type, not select
                 }
             }
-            response = requests.patch(url, headers=self.headers, json=body)
+            response = self.session.patch(url, headers=self.headers, json=body)
             response.raise_for_status()
             logger.info(f"Updated status for {notion_page_id} to '{status}'")
             
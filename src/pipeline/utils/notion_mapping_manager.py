@@ -7,14 +7,29 @@ between local content IDs and Notion page IDs, along with sync status tracking.
 
 import json
 import logging
+from collections import Counter
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 
+from havachat.utils.file_io import read_json_mmap, write_bytes_atomic
 from src.models.notion_mapping import NotionMapping
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Column value for a missing status; substituted once when a row is indexed
+_UNKNOWN_STATUS = "unknown"
+
+# Default applied by NotionMapping when an entry omits status_in_local
+_DEFAULT_LOCAL_STATUS = NotionMapping.model_fields["status_in_local"].default
+
 
 class NotionMappingManager:
     """Manager for Notion mapping persistence and lookups."""
@@ -27,7 +42,14 @@ class NotionMappingManager:
             mapping_file: Path to mapping JSON file
         """
         self.mapping_file = Path(mapping_file)
+        # Entries loaded from disk stay as raw dicts in _raw until first
+        # accessed, then move into _mappings as validated NotionMapping objects
+        self._raw: Dict[str, dict] = {}
         self._mappings: Dict[str, NotionMapping] = {}
+        self._reset_columns()
+        # Nesting depth of batch() blocks and whether a save is pending
+        self._batching = 0
+        self._dirty = False
         self._load_mapping()
         
     def _load_mapping(self) -> None:
@@ -37,42 +59,190 @@ class NotionMappingManager:
             return
             
         try:
-            with open(self.mapping_file, "r") as f:
-                data = json.load(f)
+            data = read_json_mmap(self.mapping_file)
                 
-            # Convert to NotionMapping objects
+            # Index raw entries; NotionMapping objects are built on first access
             for entry in data:
-                mapping = NotionMapping(**entry)
-                self._mappings[mapping.content_id] = mapping
+                self._raw[entry["content_id"]] = entry
+                self._index_row(
+                    entry["content_id"],
+                    entry["notion_page_id"],
+                    entry["language"],
+                    entry["level"],
+                    entry["type"],
+                    entry["status_in_notion"],
+                    entry.get("status_in_local", _DEFAULT_LOCAL_STATUS),
+                    entry["title"],
+                )
                 
-            logger.info(f"Loaded {len(self._mappings)} mappings from {self.mapping_file}")
+            logger.info(f"Loaded {len(self._row_index)} mappings from {self.mapping_file}")
             
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse mapping file: {e}")
+            self._raw = {}
             self._mappings = {}
+            self._reset_columns()
         except Exception as e:
             logger.error(f"Failed to load mapping file: {e}")
+            self._raw = {}
             self._mappings = {}
+            self._reset_columns()
+            
+    def _materialize(self, content_id: str) -> NotionMapping:
+        """Return the NotionMapping for a known content_id, validating it on first use.
+        
+        The raw entry is only dropped once validation succeeds, so an invalid
+        entry keeps raising ValidationError and is still written back on save.
+        """
+        mapping = self._mappings.get(content_id)
+        if mapping is None:
+            mapping = NotionMapping.model_validate(self._raw[content_id])
+            self._mappings[content_id] = mapping
+            del self._raw[content_id]
+        return mapping
+            
+    def _reset_columns(self) -> None:
+        """
+        Clear the column view of the mappings.
+        
+        The hot read paths (get_stats, find_by_title, get_content_id) scan
+        these parallel lists instead of walking NotionMapping objects. All
+        lists are aligned by row; _row_index maps content_id to its row.
+        """
+        self._row_index: Dict[str, int] = {}
+        self._col_content_id: List[str] = []
+        self._col_notion_page_id: List[str] = []
+        self._col_language: List[str] = []
+        self._col_level: List[str] = []
+        self._col_type: List[str] = []
+        self._col_notion_status: List[str] = []
+        self._col_local_status: List[str] = []
+        self._col_title_lower: List[str] = []
+        
+    def _columns(self) -> Tuple[List[str], ...]:
+        """Return the column lists in the order _index_mapping() fills them."""
+        return (
+            self._col_content_id,
+            self._col_notion_page_id,
+            self._col_language,
+            self._col_level,
+            self._col_type,
+            self._col_notion_status,
+            self._col_local_status,
+            self._col_title_lower,
+        )
+        
+    def _index_mapping(self, mapping: NotionMapping) -> None:
+        """Insert or overwrite the column row for a mapping."""
+        self._index_row(
+            mapping.content_id,
+            mapping.notion_page_id,
+            mapping.language,
+            mapping.level,
+            mapping.type,
+            mapping.status_in_notion,
+            mapping.status_in_local,
+            mapping.title,
+        )
+        
+    def _index_row(
+        self,
+        content_id: str,
+        notion_page_id: str,
+        language: str,
+        level: str,
+        content_type: str,
+        status_in_notion: Optional[str],
+        status_in_local: Optional[str],
+        title: str
+    ) -> None:
+        """Insert or overwrite the column row for a content_id."""
+        values = (
+            content_id,
+            notion_page_id,
+            language,
+            level,
+            content_type,
+            status_in_notion or _UNKNOWN_STATUS,
+            status_in_local or _UNKNOWN_STATUS,
+            title.lower(),
+        )
+        columns = self._columns()
+        
+        row = self._row_index.get(content_id)
+        if row is None:
+            self._row_index[content_id] = len(self._col_content_id)
+            for column, value in zip(columns, values):
+                column.append(value)
+        else:
+            for column, value in zip(columns, values):
+                column[row] = value
+                
+    def _unindex_mapping(self, content_id: str) -> None:
+        """Remove a column row by moving the last row into its slot."""
+        row = self._row_index.pop(content_id)
+        for column in self._columns():
+            last = column.pop()
+            if row < len(column):
+                column[row] = last
+        if row < len(self._col_content_id):
+            self._row_index[self._col_content_id[row]] = row
             
     def save_mapping(self) -> None:
         """Save mappings to file."""
         try:
-            # Convert to list of dicts
+            # Convert to list of dicts; entries never accessed are written back as loaded
             data = [
-                mapping.model_dump(mode="json")
-                for mapping in self._mappings.values()
+                self._mappings[content_id].model_dump(mode="json")
+                if content_id in self._mappings
+                else self._raw[content_id]
+                for content_id in self._row_index
             ]
             
-            # Write to file with pretty formatting
-            with open(self.mapping_file, "w") as f:
-                json.dump(data, f, indent=2, default=str)
+            # Serialize with pretty formatting
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(data, indent=2, default=str).encode("utf-8")
+                
+            # Replace the file atomically so a crash never leaves it truncated
+            write_bytes_atomic(payload, self.mapping_file)
                 
-            logger.info(f"Saved {len(self._mappings)} mappings to {self.mapping_file}")
+            logger.info(f"Saved {len(data)} mappings to {self.mapping_file}")
             
         except Exception as e:
             logger.error(f"Failed to save mapping file: {e}")
             raise
             
+    def _save_or_defer(self) -> None:
+        """Save mappings now, or mark them dirty when inside a batch() block."""
+        if self._batching:
+            self._dirty = True
+        else:
+            self.save_mapping()
+            
+    @contextmanager
+    def batch(self) -> Iterator["NotionMappingManager"]:
+        """
+        Defer saves until the outermost batch block exits.
+        
+        Mutations made inside the block are written to disk once on exit
+        instead of once per call.
+        
+        Example:
+            >>> with manager.batch():
+            ...     for row in rows:
+            ...         manager.add_mapping(**row)
+        """
+        self._batching += 1
+        try:
+            yield self
+        finally:
+            self._batching -= 1
+            if not self._batching and self._dirty:
+                self._dirty = False
+                self.save_mapping()
+            
     def add_mapping(
         self,
         content_id: str,
@@ -115,12 +285,27 @@ class NotionMappingManager:
             status_in_local=status_in_local
         )
         
+        self._raw.pop(content_id, None)
         self._mappings[content_id] = mapping
-        self.save_mapping()
+        self._index_mapping(mapping)
+        self._save_or_defer()
         
         logger.info(f"Added mapping: {content_id} → {notion_page_id}")
         return mapping
         
+    def add_mappings(self, items: Iterable[Mapping[str, Any]]) -> List[NotionMapping]:
+        """
+        Add several mappings with a single save.
+        
+        Args:
+            items: Keyword arguments for add_mapping(), one dict per mapping
+            
+        Returns:
+            Created NotionMapping objects, in input order
+        """
+        with self.batch():
+            return [self.add_mapping(**item) for item in items]
+        
     def get_notion_page_id(self, content_id: str) -> Optional[str]:
         """
         Get Notion page ID for a content ID.
@@ -131,8 +316,8 @@ class NotionMappingManager:
         Returns:
             Notion page ID or None if not found
         """
-        mapping = self._mappings.get(content_id)
-        return mapping.notion_page_id if mapping else None
+        row = self._row_index.get(content_id)
+        return self._col_notion_page_id[row] if row is not None else None
         
     def get_content_id(self, notion_page_id: str) -> Optional[str]:
         """
@@ -144,10 +329,11 @@ class NotionMappingManager:
         Returns:
             Content ID or None if not found
         """
-        for content_id, mapping in self._mappings.items():
-            if mapping.notion_page_id == notion_page_id:
-                return content_id
-        return None
+        try:
+            row = self._col_notion_page_id.index(notion_page_id)
+        except ValueError:
+            return None
+        return self._col_content_id[row]
         
     def get_mapping(self, content_id: str) -> Optional[NotionMapping]:
         """
@@ -159,7 +345,9 @@ class NotionMappingManager:
         Returns:
             NotionMapping object or None if not found
         """
-        return self._mappings.get(content_id)
+        if content_id not in self._row_index:
+            return None
+        return self._materialize(content_id)
         
     def update_sync_status(
         self,
@@ -175,20 +363,23 @@ class NotionMappingManager:
             status_in_notion: New Notion status (if provided)
             status_in_local: New local status (if provided)
         """
-        mapping = self._mappings.get(content_id)
+        mapping = self.get_mapping(content_id)
         if not mapping:
             logger.warning(f"Mapping not found for content_id: {content_id}")
             return
             
-        # Update fields
+        # Update fields (mappings are frozen, so store an updated copy)
+        updates = {"last_synced_at": datetime.now()}
         if status_in_notion is not None:
-            mapping.status_in_notion = status_in_notion
+            updates["status_in_notion"] = status_in_notion
         if status_in_local is not None:
-            mapping.status_in_local = status_in_local
+            updates["status_in_local"] = status_in_local
             
-        mapping.last_synced_at = datetime.now()
+        mapping = mapping.model_copy(update=updates)
+        self._mappings[content_id] = mapping
+        self._index_mapping(mapping)
         
-        self.save_mapping()
+        self._save_or_defer()
         logger.info(f"Updated sync status for {content_id}")
         
     def find_by_title(
@@ -208,23 +399,20 @@ class NotionMappingManager:
         Returns:
             List of matching NotionMapping objects
         """
-        title_lower = title.lower()
-        results = []
+        needle = title.lower()
         
-        for mapping in self._mappings.values():
-            # Check title match
-            if title_lower not in mapping.title.lower():
-                continue
-                
-            # Apply optional filters
-            if language and mapping.language != language:
-                continue
-            if level and mapping.level != level:
-                continue
-                
-            results.append(mapping)
-            
-        return results
+        return [
+            self._materialize(content_id)
+            for content_id, title_lower, mapping_language, mapping_level in zip(
+                self._col_content_id,
+                self._col_title_lower,
+                self._col_language,
+                self._col_level,
+            )
+            if needle in title_lower
+            and (not language or mapping_language == language)
+            and (not level or mapping_level == level)
+        ]
         
     def get_all_mappings(self) -> List[NotionMapping]:
         """
@@ -233,7 +421,7 @@ class NotionMappingManager:
         Returns:
             List of all NotionMapping objects
         """
-        return list(self._mappings.values())
+        return [self._materialize(content_id) for content_id in list(self._row_index)]
         
     def delete_mapping(self, content_id: str) -> bool:
         """
@@ -245,9 +433,11 @@ class NotionMappingManager:
         Returns:
             True if deleted, False if not found
         """
-        if content_id in self._mappings:
-            del self._mappings[content_id]
-            self.save_mapping()
+        if content_id in self._row_index:
+            self._mappings.pop(content_id, None)
+            self._raw.pop(content_id, None)
+            self._unindex_mapping(content_id)
+            self._save_or_defer()
             logger.info(f"Deleted mapping for {content_id}")
             return True
         return False
@@ -257,33 +447,12 @@ class NotionMappingManager:
         Get statistics about mappings.
         
         Returns:
-            Dict with counts by status
+            Dict with counts by status (missing statuses count as "unknown")
         """
-        stats = {
-            "total": len(self._mappings),
-            "by_notion_status": {},
-            "by_local_status": {},
-            "by_language": {},
-            "by_type": {}
+        return {
+            "total": len(self._row_index),
+            "by_notion_status": dict(Counter(self._col_notion_status)),
+            "by_local_status": dict(Counter(self._col_local_status)),
+            "by_language": dict(Counter(self._col_language)),
+            "by_type": dict(Counter(self._col_type))
         }
-        
-        for mapping in self._mappings.values():
-            # Count by Notion status
-            notion_status = mapping.status_in_notion or "unknown"
-            stats["by_notion_status"][notion_status] = \
-                stats["by_notion_status"].get(notion_status, 0) + 1
-                
-            # Count by local status
-            local_status = mapping.status_in_local or "unknown"
-            stats["by_local_status"][local_status] = \
-                stats["by_local_status"].get(local_status, 0) + 1
-                
-            # Count by language
-            stats["by_language"][mapping.language] = \
-                stats["by_language"].get(mapping.language, 0) + 1
-                
-            # Count by type
-            stats["by_type"][mapping.type] = \
-                stats["by_type"].get(mapping.type, 0) + 1
-                
-        return stats
@@ -4,16 +4,122 @@ This module implements comprehensive conversation/story quality evaluation using
 Evaluates content across 6 dimensions with detailed explanations and recommendations.
 """
 
+import json
 import logging
-from typing import Literal
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Literal, Optional, Union
 
 from pydantic import ValidationError
 
 from src.models.llm_judge_evaluation import DimensionScore, LLMJudgeEvaluation
+from src.pipeline.validators.llm_judge_cache import ExactMatchCache, SemanticCache
 from havachat.utils.llm_client import LLMClient
 
 logger = logging.getLogger(__name__)
 
+# Level guidance, checked in order; the first pattern found in the level wins
+_LEVEL_GUIDANCE = (
+    (
+        re.compile(r"hsk1|a1|n5"),
+        "Expect very simple sentences, basic vocabulary, present tense focus, minimal complex structures",
+    ),
+    (
+        re.compile(r"hsk2|a2|n4"),
+        "Expect simple sentences, common vocabulary, some past tense, basic conjunctions",
+    ),
+    (
+        re.compile(r"hsk3|b1|n3"),
+        "Expect more complex sentences, broader vocabulary, multiple tenses, some subordination",
+    ),
+    (
+        re.compile(r"hsk4|b2|n2"),
+        "Expect complex structures, idiomatic expressions, nuanced vocabulary, varied sentence patterns",
+    ),
+)
+_DEFAULT_LEVEL_GUIDANCE = "Expect advanced structures, sophisticated vocabulary, and native-like fluency"
+
+# Scored dimensions of LLMJudgeEvaluation, in report order
+_DIMENSION_NAMES = (
+    "naturalness",
+    "level_appropriateness",
+    "grammatical_correctness",
+    "vocabulary_diversity",
+    "cultural_accuracy",
+    "engagement",
+)
+
+
+_SYSTEM_PROMPT = (
+    "You are an expert language learning content evaluator. "
+    "Provide detailed, objective assessments of educational content quality."
+)
+
+# Sampling temperature for evaluations; kept low for consistent scores
+_EVALUATION_TEMPERATURE = 0.3
+
+# OpenAI Batch API endpoint used by LLMJudge.submit_batch()
+_BATCH_ENDPOINT = "/v1/chat/completions"
+
+
+# Evaluation prompt; filled in by LLMJudge._build_evaluation_prompt()
+_EVALUATION_PROMPT_TEMPLATE = """You are an expert language learning content evaluator. Evaluate the following {content_type} for {language} learners at {level} level.
+
+**Content to Evaluate:**
+{text}
+
+**Your Task:**
+Provide a comprehensive quality assessment across 6 dimensions. For each dimension, give:
+1. A score from 1 (poor) to 10 (excellent)
+2. A detailed explanation (50-200 words) justifying the score
+
+**Evaluation Dimensions:**
+
+1. **Naturalness** (1-10)
+   - How authentic and natural does the {content_type} sound?
+   - Would native speakers use these expressions in real life?
+   - Is the flow smooth and conversational (for dialogue) or well-structured (for narrative)?
+
+2. **Level Appropriateness** (1-10)
+   - Is the language suitable for {level} learners?
+   - {level_guidance}
+   - Are sentence structures appropriate for this level?
+
+3. **Grammatical Correctness** (1-10)
+   - Are there any grammar errors?
+   - Is the syntax correct and consistent?
+   - Are verb tenses, particles, and word order appropriate?
+
+4. **Vocabulary Diversity** (1-10)
+   - Is there good variety in vocabulary used?
+   - Are words repeated too often, or is there natural variation?
+   - Is the vocabulary level-appropriate while still introducing useful terms?
+
+5. **Cultural Accuracy** (1-10)
+   - Are cultural references appropriate and accurate?
+   - Do scenarios reflect realistic cultural contexts?
+   - Are social norms and pragmatics handled correctly?
+
+6. **Engagement** (1-10)
+   - Is the content interesting and engaging for learners?
+   - Does it maintain attention throughout?
+   - Are scenarios relevant and relatable?
+
+{type_specific}
+
+**Overall Recommendation:**
+Based on all dimensions, provide:
+- **overall_recommendation**: "proceed" (ready for audio generation) or "review" (needs human review)
+- **recommendation_justification**: Clear reasoning for your recommendation (50-150 words)
+
+**Important Guidelines:**
+- Be honest and constructive in your evaluations
+- Justify scores with specific examples from the text
+- Consider the target learner level in all assessments
+- Flag any major issues that would hinder learning
+"""
+
 
 class LLMJudge:
     """LLM-based quality judge for conversations and stories.
@@ -27,15 +133,26 @@ class LLMJudge:
     6. Engagement - Interest level for learners
     """
     
-    def __init__(self, llm_client: LLMClient, model: str = "gpt-4"):
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        model: str = "gpt-4",
+        cache: Optional[ExactMatchCache] = None,
+        semantic_cache: Optional[SemanticCache] = None
+    ):
         """Initialize LLM judge.
         
         Args:
             llm_client: Configured LLM client with instructor support
             model: LLM model to use for evaluation (default: gpt-4)
+            cache: Optional cache of evaluations for identical requests
+            semantic_cache: Optional cache of evaluations for near-identical texts,
+                consulted after an exact-match miss
         """
         self.llm_client = llm_client
         self.model = model
+        self.cache = cache
+        self.semantic_cache = semantic_cache
         self.inconsistency_threshold = 4  # Score difference flagging inconsistency
     
     def evaluate_conversation(
@@ -66,23 +183,62 @@ class LLMJudge:
         
         prompt = self._build_evaluation_prompt(text, language, level, content_type)
         
+        # Key on the exact request, so any prompt change misses the cache
+        cache_key = None
+        if self.cache is not None:
+            cache_key = ExactMatchCache.make_key(
+                model=self.model,
+                system_prompt=_SYSTEM_PROMPT,
+                prompt=prompt,
+                temperature=_EVALUATION_TEMPERATURE,
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self._finalize_evaluation(cached, content_id, content_type)
+                logger.info(f"Using cached evaluation for {content_id}")
+                return cached
+        
+        # Then near-duplicate texts under the same prompt settings; the prompt
+        # built without the text identifies those settings
+        semantic_scope = embedding = None
+        if self.semantic_cache is not None:
+            semantic_scope = ExactMatchCache.make_key(
+                model=self.model,
+                system_prompt=_SYSTEM_PROMPT,
+                prompt=self._build_evaluation_prompt("", language, level, content_type),
+                temperature=_EVALUATION_TEMPERATURE,
+            )
+            try:
+                embedding = self.semantic_cache.embed(text)
+            except Exception as e:
+                logger.warning(f"Skipping semantic cache, embedding failed: {e}")
+            
+            cached = (
+                self.semantic_cache.get(semantic_scope, embedding)
+                if embedding is not None else None
+            )
+            if cached is not None:
+                self._finalize_evaluation(cached, content_id, content_type)
+                if cache_key is not None:
+                    self.cache.set(cache_key, cached)
+                logger.info(f"Using semantically cached evaluation for {content_id}")
+                return cached
+        
         try:
             # Use instructor to get structured output
             evaluation = self.llm_client.generate(
                 prompt=prompt,
                 response_model=LLMJudgeEvaluation,
-                temperature=0.3,  # Lower temperature for consistent evaluation
-                system_prompt="You are an expert language learning content evaluator. "
-                             "Provide detailed, objective assessments of educational content quality."
+                temperature=_EVALUATION_TEMPERATURE,
+                system_prompt=_SYSTEM_PROMPT
             )
             
-            # Override content metadata (LLM doesn't know these)
-            evaluation.content_id = content_id
-            evaluation.content_type = content_type
-            evaluation.evaluator_model = self.model
+            self._finalize_evaluation(evaluation, content_id, content_type)
             
-            # Check for inconsistencies
-            self._detect_inconsistencies(evaluation)
+            if cache_key is not None:
+                self.cache.set(cache_key, evaluation)
+            if embedding is not None:
+                self.semantic_cache.set(semantic_scope, embedding, evaluation)
             
             logger.info(
                 f"Evaluation complete: avg_score={evaluation.average_score():.1f}, "
@@ -98,6 +254,165 @@ class LLMJudge:
             logger.error(f"LLM evaluation failed: {e}")
             raise
     
+    def evaluate_batch(
+        self,
+        items: Iterable[Dict[str, Any]],
+        max_workers: int = 10
+    ) -> List[Union[LLMJudgeEvaluation, Exception]]:
+        """Evaluate many conversations or stories concurrently.
+        
+        Each evaluation is a network-bound LLM round trip, so running them on
+        a thread pool overlaps the waits instead of paying them one by one.
+        
+        Args:
+            items: Keyword arguments for evaluate_conversation(), one dict per item
+            max_workers: Maximum number of evaluations in flight (default: 10)
+            
+        Returns:
+            One entry per item, in input order: the LLMJudgeEvaluation, or the
+            exception raised for that item so one failure does not discard the batch
+        """
+        items = list(items)
+        if not items:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            futures = [executor.submit(self.evaluate_conversation, **item) for item in items]
+        
+        return [future.exception() or future.result() for future in futures]
+    
+    def submit_batch(self, items: Iterable[Dict[str, Any]], openai_client: Optional[Any] = None) -> str:
+        """Submit evaluations to the OpenAI Batch API for offline scoring.
+        
+        Batch requests cost about half as much as interactive calls and finish
+        within 24 hours; collect the results with poll_batch(). Requires an
+        OpenAI model that supports structured outputs (json_schema).
+        
+        Args:
+            items: Keyword arguments for evaluate_conversation(), one dict per item
+            openai_client: OpenAI client to use (default: a new openai.OpenAI())
+            
+        Returns:
+            OpenAI batch ID
+        """
+        client = openai_client or self._default_openai_client()
+        
+        lines = []
+        for item in items:
+            content_type = item.get("content_type", "conversation")
+            prompt = self._build_evaluation_prompt(
+                item["text"], item["language"], item["level"], content_type
+            )
+            lines.append(json.dumps({
+                # content_type rides along in custom_id; the LLM doesn't know it
+                "custom_id": f"{content_type}:{item['content_id']}",
+                "method": "POST",
+                "url": _BATCH_ENDPOINT,
+                "body": {
+                    "model": self.model,
+                    "temperature": _EVALUATION_TEMPERATURE,
+                    "messages": [
+                        {"role": "system", "content": _SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt},
+                    ],
+                    "response_format": {
+                        "type": "json_schema",
+                        "json_schema": {
+                            "name": LLMJudgeEvaluation.__name__,
+                            "schema": LLMJudgeEvaluation.model_json_schema(),
+                        },
+                    },
+                },
+            }, ensure_ascii=False))
+        
+        batch_input = client.files.create(
+            file=("llm_judge_batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = client.batches.create(
+            input_file_id=batch_input.id,
+            endpoint=_BATCH_ENDPOINT,
+            completion_window="24h",
+        )
+        
+        logger.info(f"Submitted LLM judge batch {batch.id} with {len(lines)} evaluations")
+        return batch.id
+    
+    def poll_batch(
+        self,
+        batch_id: str,
+        openai_client: Optional[Any] = None
+    ) -> Optional[Dict[str, Union[LLMJudgeEvaluation, Exception]]]:
+        """Collect the results of a batch submitted with submit_batch().
+        
+        Args:
+            batch_id: OpenAI batch ID returned by submit_batch()
+            openai_client: OpenAI client to use (default: a new openai.OpenAI())
+            
+        Returns:
+            None while the batch is still running, otherwise a dict mapping
+            content_id to its LLMJudgeEvaluation, or to the exception for an
+            item whose request or output failed
+            
+        Raises:
+            RuntimeError: If the batch failed, expired, or was cancelled
+        """
+        client = openai_client or self._default_openai_client()
+        
+        batch = client.batches.retrieve(batch_id)
+        if batch.status in ("failed", "expired", "cancelled"):
+            raise RuntimeError(f"LLM judge batch {batch_id} ended with status '{batch.status}'")
+        if batch.status != "completed":
+            logger.info(f"LLM judge batch {batch_id} is {batch.status}")
+            return None
+        
+        results: Dict[str, Union[LLMJudgeEvaluation, Exception]] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in client.files.content(file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                content_type, _, content_id = record["custom_id"].partition(":")
+                try:
+                    response = record.get("response") or {}
+                    if record.get("error") or response.get("status_code") != 200:
+                        raise RuntimeError(
+                            f"Batch request failed: {record.get('error') or response.get('body')}"
+                        )
+                    message = response["body"]["choices"][0]["message"]["content"]
+                    evaluation = LLMJudgeEvaluation.model_validate_json(message)
+                    self._finalize_evaluation(evaluation, content_id, content_type)
+                    results[content_id] = evaluation
+                except Exception as e:
+                    logger.error(f"LLM judge batch result for {content_id} failed: {e}")
+                    results[content_id] = e
+        
+        logger.info(f"Collected {len(results)} results from LLM judge batch {batch_id}")
+        return results
+    
+    @staticmethod
+    def _default_openai_client() -> Any:
+        """Create a plain OpenAI client for the Batch API (Instructor is not involved)."""
+        from openai import OpenAI
+        return OpenAI()
+    
+    def _finalize_evaluation(
+        self,
+        evaluation: LLMJudgeEvaluation,
+        content_id: str,
+        content_type: str
+    ) -> None:
+        """Fill in content metadata and flag inconsistencies (modifies in place)."""
+        # Override content metadata (LLM doesn't know these)
+        evaluation.content_id = content_id
+        evaluation.content_type = content_type
+        evaluation.evaluator_model = self.model
+        
+        # Check for inconsistencies
+        self._detect_inconsistencies(evaluation)
+    
     def _build_evaluation_prompt(
         self, 
         text: str, 
@@ -119,65 +434,19 @@ class LLMJudge:
         type_specific = self._get_type_specific_guidance(content_type)
         level_guidance = self._get_level_guidance(level)
         
-        prompt = f"""You are an expert language learning content evaluator. Evaluate the following {content_type} for {language} learners at {level} level.
-
-**Content to Evaluate:**
-{text}
-
-**Your Task:**
-Provide a comprehensive quality assessment across 6 dimensions. For each dimension, give:
-1. A score from 1 (poor) to 10 (excellent)
-2. A detailed explanation (50-200 words) justifying the score
-
-**Evaluation Dimensions:**
-
-1. **Naturalness** (1-10)
-   - How authentic and natural does the {content_type} sound?
-   - Would native speakers use these expressions in real life?
-   - Is the flow smooth and conversational (for dialogue) or well-structured (for narrative)?
-
-2. **Level Appropriateness** (1-10)
-   - Is the language suitable for {level} learners?
-   - {level_guidance}
-   - Are sentence structures appropriate for this level?
-
-3. **Grammatical Correctness** (1-10)
-   - Are there any grammar errors?
-   - Is the syntax correct and consistent?
-   - Are verb tenses, particles, and word order appropriate?
-
-4. **Vocabulary Diversity** (1-10)
-   - Is there good variety in vocabulary used?
-   - Are words repeated too often, or is there natural variation?
-   - Is the vocabulary level-appropriate while still introducing useful terms?
-
-5. **Cultural Accuracy** (1-10)
-   - Are cultural references appropriate and accurate?
-   - Do scenarios reflect realistic cultural contexts?
-   - Are social norms and pragmatics handled correctly?
-
-6. **Engagement** (1-10)
-   - Is the content interesting and engaging for learners?
-   - Does it maintain attention throughout?
-   - Are scenarios relevant and relatable?
-
-{type_specific}
-
-**Overall Recommendation:**
-Based on all dimensions, provide:
-- **overall_recommendation**: "proceed" (ready for audio generation) or "review" (needs human review)
-- **recommendation_justification**: Clear reasoning for your recommendation (50-150 words)
-
-**Important Guidelines:**
-- Be honest and constructive in your evaluations
-- Justify scores with specific examples from the text
-- Consider the target learner level in all assessments
-- Flag any major issues that would hinder learning
-"""
-        return prompt
+        return _EVALUATION_PROMPT_TEMPLATE.format(
+            text=text,
+            language=language,
+            level=level,
+            content_type=content_type,
+            type_specific=type_specific,
+            level_guidance=level_guidance,
+        )
     
-    def _get_type_specific_guidance(self, content_type: str) -> str:
-        """Get type-specific evaluation guidance."""
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _get_type_specific_guidance(content_type: str) -> str:
+        """Get type-specific evaluation guidance (cached per content type)."""
         if content_type == "conversation":
             return """
 **Conversation-Specific Considerations:**
@@ -195,20 +464,16 @@ Based on all dimensions, provide:
 - Does the story maintain reader interest throughout?
 """
     
-    def _get_level_guidance(self, level: str) -> str:
-        """Get level-specific evaluation guidance."""
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _get_level_guidance(level: str) -> str:
+        """Get level-specific evaluation guidance (cached per level)."""
         level_lower = level.lower()
         
-        if "hsk1" in level_lower or "a1" in level_lower or "n5" in level_lower:
-            return "Expect very simple sentences, basic vocabulary, present tense focus, minimal complex structures"
-        elif "hsk2" in level_lower or "a2" in level_lower or "n4" in level_lower:
-            return "Expect simple sentences, common vocabulary, some past tense, basic conjunctions"
-        elif "hsk3" in level_lower or "b1" in level_lower or "n3" in level_lower:
-            return "Expect more complex sentences, broader vocabulary, multiple tenses, some subordination"
-        elif "hsk4" in level_lower or "b2" in level_lower or "n2" in level_lower:
-            return "Expect complex structures, idiomatic expressions, nuanced vocabulary, varied sentence patterns"
-        else:
-            return "Expect advanced structures, sophisticated vocabulary, and native-like fluency"
+        for pattern, guidance in _LEVEL_GUIDANCE:
+            if pattern.search(level_lower):
+                return guidance
+        return _DEFAULT_LEVEL_GUIDANCE
     
     def _detect_inconsistencies(self, evaluation: LLMJudgeEvaluation) -> None:
         """Detect contradictory scores and flag inconsistencies.
@@ -216,18 +481,15 @@ Based on all dimensions, provide:
         Args:
             evaluation: Evaluation to check for inconsistencies (modified in-place)
         """
-        scores = [
-            ("naturalness", evaluation.naturalness.score),
-            ("level_appropriateness", evaluation.level_appropriateness.score),
-            ("grammatical_correctness", evaluation.grammatical_correctness.score),
-            ("vocabulary_diversity", evaluation.vocabulary_diversity.score),
-            ("cultural_accuracy", evaluation.cultural_accuracy.score),
-            ("engagement", evaluation.engagement.score)
-        ]
-        
-        # Find highest and lowest scores
-        max_dim, max_score = max(scores, key=lambda x: x[1])
-        min_dim, min_score = min(scores, key=lambda x: x[1])
+        # Find highest and lowest scores in one pass (first one wins on ties)
+        max_dim = min_dim = _DIMENSION_NAMES[0]
+        max_score = min_score = getattr(evaluation, max_dim).score
+        for dim in _DIMENSION_NAMES[1:]:
+            score = getattr(evaluation, dim).score
+            if score > max_score:
+                max_dim, max_score = dim, score
+            elif score < min_score:
+                min_dim, min_score = dim, score
         
         score_diff = max_score - min_score
         
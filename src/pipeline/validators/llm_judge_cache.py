@@ -0,0 +1,284 @@
+"""Caches for LLM judge evaluations.
+
+Re-running the judge on the same input (pipeline re-runs, regression
+sweeps) returns the stored evaluation instead of calling the LLM again.
+
+- ExactMatchCache: keyed by a hash of the exact request
+- SemanticCache: matches near-duplicate texts by embedding similarity
+
+Default TTL: 30 days
+Storage: SQLite files in data/cache/ (llm_judge.sqlite, llm_judge_semantic.sqlite)
+"""
+
+import hashlib
+import json
+import logging
+import math
+import sqlite3
+import threading
+import time
+from array import array
+from operator import mul
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.models.llm_judge_evaluation import LLMJudgeEvaluation
+
+logger = logging.getLogger(__name__)
+
+# Default cache directory, shared with the translation cache
+_DEFAULT_CACHE_DIR = Path(__file__).parent.parent.parent.parent / "data" / "cache"
+
+
+class ExactMatchCache:
+    """SQLite-backed cache of LLMJudgeEvaluation results keyed by request hash."""
+
+    DEFAULT_TTL_DAYS = 30
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl_days: int = DEFAULT_TTL_DAYS,
+        enabled: bool = True
+    ):
+        """Initialize evaluation cache.
+
+        Args:
+            cache_dir: Directory for cache storage (default: data/cache/)
+            ttl_days: Time-to-live in days (default: 30)
+            enabled: Whether caching is enabled (default: True)
+        """
+        self.enabled = enabled
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+
+        self.cache_file = Path(cache_dir or _DEFAULT_CACHE_DIR) / "llm_judge.sqlite"
+
+        self._conn: Optional[sqlite3.Connection] = None
+        # LLMJudge.evaluate_batch() calls in from worker threads
+        self._lock = threading.Lock()
+
+        if self.enabled:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.cache_file, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS evaluations ("
+                "key TEXT PRIMARY KEY, evaluation TEXT NOT NULL, "
+                "created_at REAL NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def make_key(**fields: Any) -> str:
+        """Build a cache key from every input that affects the evaluation.
+
+        Args:
+            **fields: JSON-serializable request fields (model, prompts, ...)
+
+        Returns:
+            SHA-256 hex digest of the fields
+        """
+        key_data = json.dumps(fields, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(key_data.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[LLMJudgeEvaluation]:
+        """Return the cached evaluation for a key, or None on a miss or expiry."""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT evaluation FROM evaluations WHERE key = ? AND expires_at >= ?",
+                (key, time.time()),
+            ).fetchone()
+
+        if row is None:
+            return None
+        logger.debug(f"LLM judge cache hit: {key[:12]}")
+        return LLMJudgeEvaluation.model_validate_json(row[0])
+
+    def set(self, key: str, evaluation: LLMJudgeEvaluation) -> None:
+        """Store an evaluation under a key, replacing any previous entry."""
+        if not self.enabled:
+            return
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO evaluations (key, evaluation, created_at, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, evaluation.model_dump_json(), now, now + self.ttl_seconds),
+            )
+            self._conn.commit()
+
+    def clear_expired(self) -> int:
+        """Delete expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        if not self.enabled:
+            return 0
+
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM evaluations WHERE expires_at < ?", (time.time(),)
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            self.enabled = False
+
+
+def openai_embedding_fn(model: str = "text-embedding-3-small") -> Callable[[str], List[float]]:
+    """Return an embedding function backed by the OpenAI embeddings API.
+
+    Args:
+        model: OpenAI embedding model (default: text-embedding-3-small)
+
+    Returns:
+        Callable mapping a text to its embedding vector
+    """
+    from openai import OpenAI
+    client = OpenAI()
+
+    def embed(text: str) -> List[float]:
+        return client.embeddings.create(model=model, input=text).data[0].embedding
+
+    return embed
+
+
+class SemanticCache:
+    """Cache that returns an evaluation stored for a near-identical text.
+
+    Regenerated content often rewords a script only slightly, which an
+    exact-match key always misses. Entries are grouped by scope (model,
+    prompt settings, language, level, content type) so only evaluations of
+    comparable requests can match. Within a scope, the stored embedding
+    with the highest cosine similarity wins if it reaches the threshold.
+
+    Embeddings are kept as normalized float32 arrays and scanned linearly;
+    a scope holds at most a few thousand scripts.
+    """
+
+    DEFAULT_TTL_DAYS = 30
+    DEFAULT_THRESHOLD = 0.97
+
+    def __init__(
+        self,
+        embedding_fn: Callable[[str], Sequence[float]],
+        cache_dir: Optional[Path] = None,
+        threshold: float = DEFAULT_THRESHOLD,
+        ttl_days: int = DEFAULT_TTL_DAYS,
+        enabled: bool = True
+    ):
+        """Initialize semantic cache.
+
+        Args:
+            embedding_fn: Maps a text to its embedding (see openai_embedding_fn())
+            cache_dir: Directory for cache storage (default: data/cache/)
+            threshold: Minimum cosine similarity for a hit (default: 0.97)
+            ttl_days: Time-to-live in days (default: 30)
+            enabled: Whether caching is enabled (default: True)
+        """
+        self.embedding_fn = embedding_fn
+        self.threshold = threshold
+        self.enabled = enabled
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+        self.cache_file = Path(cache_dir or _DEFAULT_CACHE_DIR) / "llm_judge_semantic.sqlite"
+
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        # scope -> [(normalized embedding, evaluation JSON, expires_at)], loaded on first use
+        self._entries: Dict[str, List[Tuple[array, str, float]]] = {}
+
+        if self.enabled:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.cache_file, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS evaluations ("
+                "scope TEXT NOT NULL, embedding BLOB NOT NULL, evaluation TEXT NOT NULL, "
+                "created_at REAL NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS evaluations_scope ON evaluations (scope)"
+            )
+            self._conn.commit()
+
+    def embed(self, text: str) -> array:
+        """Embed a text and normalize it to unit length."""
+        vector = array("f", self.embedding_fn(text))
+        norm = math.sqrt(sum(map(mul, vector, vector)))
+        if norm:
+            vector = array("f", (value / norm for value in vector))
+        return vector
+
+    def _load_scope(self, scope: str) -> List[Tuple[array, str, float]]:
+        """Return the entries for a scope, reading them from disk once (lock held)."""
+        entries = self._entries.get(scope)
+        if entries is None:
+            entries = []
+            rows = self._conn.execute(
+                "SELECT embedding, evaluation, expires_at FROM evaluations "
+                "WHERE scope = ? AND expires_at >= ?",
+                (scope, time.time()),
+            )
+            for blob, evaluation, expires_at in rows:
+                vector = array("f")
+                vector.frombytes(blob)
+                entries.append((vector, evaluation, expires_at))
+            self._entries[scope] = entries
+        return entries
+
+    def get(self, scope: str, embedding: array) -> Optional[LLMJudgeEvaluation]:
+        """Return the closest cached evaluation in a scope, or None below the threshold.
+
+        Args:
+            scope: Cache scope (see ExactMatchCache.make_key())
+            embedding: Normalized embedding from embed()
+        """
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        best_json, best_similarity = None, self.threshold
+        with self._lock:
+            for vector, evaluation, expires_at in self._load_scope(scope):
+                if expires_at < now or len(vector) != len(embedding):
+                    continue
+                similarity = sum(map(mul, vector, embedding))
+                if similarity >= best_similarity:
+                    best_json, best_similarity = evaluation, similarity
+
+        if best_json is None:
+            return None
+        logger.debug(f"LLM judge semantic cache hit (similarity={best_similarity:.3f})")
+        return LLMJudgeEvaluation.model_validate_json(best_json)
+
+    def set(self, scope: str, embedding: array, evaluation: LLMJudgeEvaluation) -> None:
+        """Store an evaluation for an embedding in a scope."""
+        if not self.enabled:
+            return
+
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+        evaluation_json = evaluation.model_dump_json()
+        with self._lock:
+            self._load_scope(scope).append((embedding, evaluation_json, expires_at))
+            self._conn.execute(
+                "INSERT INTO evaluations (scope, embedding, evaluation, created_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (scope, embedding.tobytes(), evaluation_json, now, expires_at),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            self.enabled = False
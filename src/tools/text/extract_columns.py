@@ -1,7 +1,22 @@
 import csv
 import argparse
-import os
 import sys
+from itertools import chain
+from operator import itemgetter
+from pathlib import Path
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Read/write buffer size; larger buffers cut read()/write() syscalls on big files
+BUFFER_SIZE = 1 << 18
+
+# Inputs above this size go through pyarrow's block-parallel CSV reader
+ARROW_MIN_SIZE = 10 * 1024 * 1024
 
 def extract_columns(input_path, column_indices, output_path=None):
     """
@@ -13,32 +28,60 @@ def extract_columns(input_path, column_indices, output_path=None):
         output_path (str, optional): Path to the output TSV file. 
             Defaults to <input_name>_core.tsv if not provided.
     """
-    if not os.path.exists(input_path):
+    input_file = Path(input_path)
+    if not input_file.is_file():
         print(f"Error: Input file '{input_path}' not found.")
         sys.exit(1)
 
     if output_path is None:
-        base, ext = os.path.splitext(input_path)
-        output_path = f"{base}_core{ext}"
+        output_path = input_file.with_name(f"{input_file.stem}_core{input_file.suffix}")
 
     try:
-        with open(input_path, mode='r', encoding='utf-8') as infile:
-            reader = csv.reader(infile, delimiter='\t')
-            
-            with open(output_path, mode='w', encoding='utf-8', newline='') as outfile:
+        if input_file.stat().st_size > ARROW_MIN_SIZE and _extract_with_arrow(
+            input_path, column_indices, output_path
+        ):
+            print(f"Successfully extracted columns to '{output_path}'")
+            return
+        
+        # itemgetter returns a bare value for one index, a tuple otherwise
+        getter = itemgetter(*column_indices)
+        single = len(column_indices) == 1
+        
+        # Shortest row that has every requested column (negative indices count from the end)
+        min_required = max(i + 1 if i >= 0 else -i for i in column_indices)
+        short_row_warning = f"Warning: Row has fewer than {max(column_indices) + 1} columns. Skipping row."
+        
+        with open(input_path, mode='r', encoding='utf-8', buffering=BUFFER_SIZE) as infile:
+            with open(output_path, mode='w', encoding='utf-8', newline='', buffering=BUFFER_SIZE) as outfile:
                 writer = csv.writer(outfile, delimiter='\t')
+                eol = writer.dialect.lineterminator
                 
-                for row in reader:
-                    if not row:
+                # Plain TSV lines are split directly; the first line with a quote
+                # hands the rest of the file to csv.reader, since quoted fields
+                # may hold tabs or newlines.
+                for line in infile:
+                    if '"' in line:
+                        reader = csv.reader(chain([line], infile), delimiter='\t')
+                        _write_rows(reader, writer, getter, single, min_required, short_row_warning)
+                        break
+                    
+                    line = line.rstrip('\n')
+                    if not line:
                         continue
                     
-                    try:
-                        extracted_row = [row[i] for i in column_indices]
-                        writer.writerow(extracted_row)
-                    except IndexError:
-                        # Optionally handle rows with fewer columns than requested
-                        print(f"Warning: Row has fewer than {max(column_indices) + 1} columns. Skipping row.")
+                    fields = line.split('\t')
+                    if len(fields) < min_required:
+                        print(short_row_warning)
                         continue
+                    
+                    extracted = getter(fields)
+                    if not single:
+                        outfile.write('\t'.join(extracted) + eol)
+                    elif extracted:
+                        outfile.write(extracted + eol)
+                    else:
+                        # csv.writer quotes a lone empty field; keep its output
+                        writer.writerow((extracted,))
 
         print(f"Successfully extracted columns to '{output_path}'")
 
@@ -46,6 +89,71 @@ def extract_columns(input_path, column_indices, output_path=None):
         print(f"An error occurred: {e}")
         sys.exit(1)
 
+def _extract_with_arrow(input_path, column_indices, output_path):
+    """
+    Extract columns with pyarrow, streaming the file in 1 MiB blocks.
+    
+    Only used when the output is guaranteed to match the csv path: any
+    ragged row, or value that would need quoting, makes Arrow raise, and
+    the caller then falls back to the line-by-line path.
+    
+    Returns:
+        bool: True if the output was written, False if the caller should fall back.
+    """
+    # A lone empty field is written as '""' by csv.writer, which Arrow cannot
+    # reproduce; negative or repeated indices have no Arrow column equivalent
+    if (
+        not PYARROW_AVAILABLE
+        or len(column_indices) < 2
+        or min(column_indices) < 0
+        or len(set(column_indices)) != len(column_indices)
+    ):
+        return False
+    
+    names = [f"f{i}" for i in column_indices]
+    read_options = pa_csv.ReadOptions(block_size=1 << 20, autogenerate_column_names=True)
+    parse_options = pa_csv.ParseOptions(delimiter='\t', newlines_in_values=True)
+    convert_options = pa_csv.ConvertOptions(
+        include_columns=names,
+        column_types={name: pa.string() for name in names},
+        strings_can_be_null=False,
+    )
+    write_options = pa_csv.WriteOptions(
+        include_header=False,
+        delimiter='\t',
+        eol=csv.excel.lineterminator,
+        quoting_style='none',
+    )
+    
+    try:
+        with pa_csv.open_csv(
+            input_path,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options,
+        ) as reader:
+            with pa_csv.CSVWriter(output_path, reader.schema, write_options=write_options) as writer:
+                for batch in reader:
+                    writer.write_batch(batch)
+    except (pa.ArrowInvalid, pa.ArrowKeyError):
+        return False
+    
+    return True
+
+def _write_rows(reader, writer, getter, single, min_required, short_row_warning):
+    """Write the selected columns of each csv row, skipping short rows."""
+    for row in reader:
+        if not row:
+            continue
+        
+        if len(row) < min_required:
+            # Optionally handle rows with fewer columns than requested
+            print(short_row_warning)
+            continue
+        
+        extracted = getter(row)
+        writer.writerow((extracted,) if single else extracted)
+
 def main():
     parser = argparse.ArgumentParser(description="Extract specific columns from a TSV file.")
     parser.add_argument("input", help="Path to the input TSV file.")
@@ -1,21 +1,65 @@
 import json
 import argparse
+import hashlib
 import os
+import re
+import shutil
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import repeat
 from pathlib import Path
 from docling.document_converter import DocumentConverter
 import pandas as pd
 
+try:
+    import pypandoc
+    PYPANDOC_AVAILABLE = True
+except ImportError:
+    PYPANDOC_AVAILABLE = False
+
+try:
+    import fitz
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+try:
+    import pymupdf4llm
+    PYMUPDF4LLM_AVAILABLE = True
+except ImportError:
+    PYMUPDF4LLM_AVAILABLE = False
+
+# Converted outputs keyed by PDF content and config; HAVACHAT_PDF_NO_CACHE=1 bypasses it
+CACHE_DIR = Path(__file__).resolve().parents[3] / "data" / "cache" / "pdf"
+
+# Pages per worker below which extra processes cost more (model loading) than they save
+MIN_PAGES_PER_WORKER = 4
+
+# Page range: "3" or "1-5" (whitespace around the numbers is allowed)
+_RANGE_RE = re.compile(r'\s*(\d+)\s*(?:-\s*(\d+)\s*)?')
+
+@lru_cache(maxsize=1)
+def _get_converter():
+    """Return a shared DocumentConverter; Docling loads its models on construction."""
+    return DocumentConverter()
+
 def convert_pdf(input_path, config_str, output_path=None):
     """
     Converts a PDF file to Markdown, TXT, or Word format using Docling.
+
+    With extractTables off, markdown and txt output use PyMuPDF instead
+    when it is installed (pymupdf4llm for markdown). Otherwise a "workers"
+    value above 1 splits longer page ranges across Docling processes.
     
     Args:
         input_path (str): Path to the input PDF file.
         config_str (str): JSON string with config fields.
         output_path (str, optional): Path to the output file.
     """
-    if not os.path.exists(input_path):
+    input_file = Path(input_path)
+    if not input_file.is_file():
         print(f"Error: Input file '{input_path}' not found.")
         sys.exit(1)
 
@@ -29,17 +73,15 @@ def convert_pdf(input_path, config_str, output_path=None):
     output_format = config.get("format", "markdown").lower()
     extract_tables = config.get("extractTables", True)
     page_range_str = config.get("pageRange") # e.g. "1-5" or "1"
+    workers = int(config.get("workers", 1))  # processes for Docling page blocks
     
     # Process page range
     page_range = None
     if page_range_str:
-        try:
-            if "-" in str(page_range_str):
-                start, end = map(int, str(page_range_str).split("-"))
-                page_range = [start, end]
-            else:
-                page_range = [int(page_range_str), int(page_range_str)]
-        except ValueError:
+        match = _RANGE_RE.fullmatch(str(page_range_str))
+        if match:
+            page_range = [int(match[1]), int(match[2] or match[1])]
+        else:
             print(f"Warning: Invalid page range format '{page_range_str}'. Ignoring.")
 
     # Determine extension
@@ -56,62 +98,95 @@ def convert_pdf(input_path, config_str, output_path=None):
     target_ext = ext_map[output_format]
 
     if output_path is None:
-        base, _ = os.path.splitext(input_path)
-        output_path = f"{base}{'-' + page_range_str if page_range_str else ''}{target_ext}"
+        output_path = input_file.with_name(f"{input_file.stem}{'-' + page_range_str if page_range_str else ''}{target_ext}")
 
     print(f"Converting '{input_path}' (Pages: {page_range_str if page_range_str else 'All'}) to '{output_format}' ({output_path})...")
 
+    output_file = Path(output_path).absolute()
+    output_dir = output_file.parent
+    doc_filename = output_file.stem
+
+    def table_path(table_ix):
+        return output_dir / f"{doc_filename}-table{'-' + page_range_str if page_range_str else ''}-{table_ix + 1}.csv"
+
+    # Conversion is deterministic for the same PDF bytes and config
+    cache_entry = None
+    if os.environ.get("HAVACHAT_PDF_NO_CACHE") != "1":
+        cache_entry = CACHE_DIR / _cache_key(input_file, config)
+        if _restore_from_cache(cache_entry, output_file, table_path):
+            print(f"Successfully converted to '{output_path}' (cached)")
+            return
+
     try:
-        converter = DocumentConverter()
-        # Pass page_range to convert method
-        result = converter.convert(input_path, page_range=page_range)
-        
-        content = ""
-        if output_format == "markdown":
-            content = result.document.export_to_markdown()
-        elif output_format == "txt":
-            # Markdown is often the best plain text representation from Docling
-            # but we can try to strip some markdown if needed. 
-            # For now, we'll provide the markdown content as txt.
-            content = result.document.export_to_markdown()
-        elif output_format == "word":
-            # Docling doesn't natively export to .docx yet.
-            # We export to HTML which Word can open.
-            content = result.document.export_to_html()
-            print("Note: Word output is exported as HTML content saved as .docx for compatibility.")
+        # Without tables, plain text and markdown come straight from the PDF
+        # content stream; Docling's layout models are only needed otherwise
+        content = None
+        if not extract_tables:
+            content = _extract_without_layout(input_path, output_format, page_range)
+
+        write_output = _write_text
+        table_savers = []
+        if content is None and workers > 1 and (output_format != "word" or PYPANDOC_AVAILABLE):
+            content, table_savers = _convert_in_processes(
+                input_path, page_range, workers, extract_tables
+            )
+            if output_format == "word":
+                write_output = _write_docx
+
+        if content is None:
+            converter = _get_converter()
+            # Pass page_range to convert method
+            result = converter.convert(input_path, page_range=page_range)
+            document = result.document
+
+            content = ""
+            if output_format == "markdown":
+                content = document.export_to_markdown()
+            elif output_format == "txt":
+                # Markdown is often the best plain text representation from Docling
+                # but we can try to strip some markdown if needed. 
+                # For now, we'll provide the markdown content as txt.
+                content = document.export_to_markdown()
+            elif output_format == "word" and PYPANDOC_AVAILABLE:
+                # Docling doesn't natively export to .docx yet; pandoc builds a real
+                # .docx from the markdown export, skipping the HTML serialization.
+                content = document.export_to_markdown()
+                write_output = _write_docx
+            elif output_format == "word":
+                # Without pandoc, we export to HTML which Word can open.
+                content = document.export_to_html()
+                print("Note: Word output is exported as HTML content saved as .docx for compatibility.")
+
+            if extract_tables:
+                table_savers = [partial(_save_table, table, document) for table in document.tables]
 
         # Ensure output directory exists
-        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(content)
-
-        print(f"Successfully converted to '{output_path}'")
-
-        # Extract tables if requested
-        if extract_tables and result.document.tables:
-            print("Extracting tables...")
-            output_dir = Path(os.path.dirname(os.path.abspath(output_path)))
-            doc_filename = Path(output_path).stem
-            
-            for table_ix, table in enumerate(result.document.tables):
-                # Export to dataframe
-                table_df = table.export_to_dataframe(doc=result.document)
-                
-                # Forward fill cells that spread across multiple rows (assume empty string means merged)
-                # We replace empty strings with None to allow ffill, then fill remaining cells (if any) with empty string
-                table_df = table_df.replace("", None).ffill().fillna("")
-
-                # Save as CSV
-                element_csv_filename = output_dir / f"{doc_filename}-table{'-' + page_range_str if page_range_str else ''}-{table_ix + 1}.csv"
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        # The main file and each table are independent, so write them concurrently;
+        # messages are still printed in the original order as each one finishes
+        with ThreadPoolExecutor(max_workers=min(8, len(table_savers) + 1)) as pool:
+            content_future = pool.submit(write_output, output_path, content)
+
+            table_jobs = []
+            for table_ix, save_table in enumerate(table_savers):
+                element_csv_filename = table_path(table_ix)
+                table_jobs.append(
+                    (element_csv_filename, pool.submit(save_table, element_csv_filename))
+                )
+
+            content_future.result()
+            print(f"Successfully converted to '{output_path}'")
+
+            # Extract tables if requested
+            if table_jobs:
+                print("Extracting tables...")
+            for element_csv_filename, future in table_jobs:
+                future.result()
                 print(f"Saving CSV table to {element_csv_filename}")
-                table_df.to_csv(element_csv_filename, index=False)
-                
-                # # Save as HTML
-                # element_html_filename = output_dir / f"{doc_filename}-table{'-' + page_range_str if page_range_str else ''}-{table_ix + 1}.html"
-                # print(f"Saving HTML table to {element_html_filename}")
-                # with element_html_filename.open("w", encoding="utf-8") as fp:
-                #     fp.write(table.export_to_html(doc=result.document))
+
+        if cache_entry is not None:
+            _store_in_cache(cache_entry, output_file, [path for path, _ in table_jobs])
 
     except Exception as e:
         print(f"An error occurred during conversion: {e}")
@@ -120,10 +195,157 @@ def convert_pdf(input_path, config_str, output_path=None):
         traceback.print_exc()
         sys.exit(1)
 
+def _cache_key(input_file, config):
+    """Hash the PDF bytes, the config (minus "workers", which doesn't change output)
+    and which optional backends are installed, since they pick the extraction path."""
+    digest = hashlib.sha256()
+    with open(input_file, "rb") as f:
+        for block in iter(partial(f.read, 1 << 20), b""):
+            digest.update(block)
+    settings = {key: value for key, value in config.items() if key != "workers"}
+    settings["backends"] = {
+        "pymupdf": PYMUPDF_AVAILABLE,
+        "pymupdf4llm": PYMUPDF4LLM_AVAILABLE,
+        "pypandoc": PYPANDOC_AVAILABLE,
+    }
+    digest.update(json.dumps(settings, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+def _restore_from_cache(cache_entry, output_file, table_path):
+    """Copy a cached conversion to the requested paths; False on a miss."""
+    manifest_file = cache_entry / "manifest.json"
+    if not manifest_file.is_file():
+        return False
+    manifest = json.loads(manifest_file.read_text(encoding="utf-8"))
+
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(cache_entry / "output", output_file)
+    for table_ix in range(manifest["tables"]):
+        shutil.copyfile(cache_entry / f"table-{table_ix + 1}.csv", table_path(table_ix))
+    return True
+
+def _store_in_cache(cache_entry, output_file, table_files):
+    """Save a finished conversion; the entry appears atomically via rename."""
+    staging = None
+    try:
+        cache_entry.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=cache_entry.parent))
+        shutil.copyfile(output_file, staging / "output")
+        for table_ix, table_file in enumerate(table_files):
+            shutil.copyfile(table_file, staging / f"table-{table_ix + 1}.csv")
+        (staging / "manifest.json").write_text(json.dumps({"tables": len(table_files)}), encoding="utf-8")
+        staging.rename(cache_entry)
+    except OSError as e:
+        # Another run stored the same entry first, or the cache isn't writable
+        print(f"Note: conversion not cached ({e})")
+        if staging is not None:
+            shutil.rmtree(staging, ignore_errors=True)
+
+def _extract_without_layout(input_path, output_format, page_range):
+    """Extract text or markdown with PyMuPDF, skipping layout analysis.
+
+    Returns None when the format needs Docling or PyMuPDF isn't installed.
+    """
+    if output_format == "txt" and PYMUPDF_AVAILABLE:
+        with fitz.open(input_path) as doc:
+            return "\n".join(doc[i].get_text("text") for i in _page_indices(page_range, doc.page_count))
+    if output_format == "markdown" and PYMUPDF4LLM_AVAILABLE:
+        with fitz.open(input_path) as doc:
+            pages = _page_indices(page_range, doc.page_count)
+        return pymupdf4llm.to_markdown(input_path, pages=list(pages))
+    return None
+
+def _page_indices(page_range, page_count):
+    """Return 0-based page indices for a 1-based inclusive [start, end] range."""
+    if page_range is None:
+        return range(page_count)
+    return range(max(page_range[0], 1) - 1, min(page_range[1], page_count))
+
+# Characters encoded and written per write() call in _write_text
+WRITE_CHUNK_CHARS = 1 << 20
+
+def _write_text(path, content):
+    """Write the converted document in slices.
+
+    A single write() encodes the whole string into one bytes object first;
+    slicing keeps that extra copy to about one chunk.
+    """
+    with open(path, "w", encoding="utf-8", buffering=WRITE_CHUNK_CHARS) as f:
+        for start in range(0, len(content), WRITE_CHUNK_CHARS):
+            f.write(content[start:start + WRITE_CHUNK_CHARS])
+
+def _write_docx(path, markdown):
+    """Convert markdown to a .docx file with pandoc."""
+    pypandoc.convert_text(markdown, "docx", format="md", outputfile=str(path))
+
+def _convert_in_processes(input_path, page_range, workers, extract_tables):
+    """Convert contiguous page blocks with Docling in separate processes.
+
+    Returns (markdown, table savers) with tables numbered across the whole
+    range, or (None, []) when the range is too short to be worth splitting.
+    """
+    first, last = page_range or (1, _page_count(input_path))
+    workers = min(workers, (last - first + 1) // MIN_PAGES_PER_WORKER)
+    if workers < 2:
+        return None, []
+
+    # Contiguous blocks keep the markdown in page order when joined
+    block_size, extra = divmod(last - first + 1, workers)
+    blocks = []
+    start = first
+    for block_ix in range(workers):
+        end = start + block_size + (block_ix < extra) - 1
+        blocks.append([start, end])
+        start = end + 1
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(_convert_page_block, repeat(input_path), blocks, repeat(extract_tables)))
+
+    content = "\n\n".join(markdown for markdown, _ in parts)
+    table_savers = [partial(_save_table_frame, table_df) for _, frames in parts for table_df in frames]
+    return content, table_savers
+
+def _page_count(input_path):
+    """Return the number of pages in a PDF (pypdfium2 ships with Docling)."""
+    import pypdfium2
+
+    pdf = pypdfium2.PdfDocument(input_path)
+    try:
+        return len(pdf)
+    finally:
+        pdf.close()
+
+def _convert_page_block(input_path, page_range, extract_tables):
+    """Convert one page block in a worker process; returns (markdown, table frames)."""
+    document = _get_converter().convert(input_path, page_range=page_range).document
+    frames = [table.export_to_dataframe(doc=document) for table in document.tables] if extract_tables else []
+    return document.export_to_markdown(), frames
+
+def _save_table(table, document, csv_path):
+    """Export one table to CSV."""
+    _save_table_frame(table.export_to_dataframe(doc=document), csv_path)
+
+    # # Save as HTML
+    # element_html_filename = csv_path.with_suffix(".html")
+    # with element_html_filename.open("w", encoding="utf-8") as fp:
+    #     fp.write(table.export_to_html(doc=document))
+
+def _save_table_frame(table_df, csv_path):
+    """Clean up an exported table and save it as CSV."""
+    # Forward fill cells that spread across multiple rows (assume empty string means merged)
+    # We mask empty strings as missing to allow ffill, then fill remaining cells (if any) with empty string.
+    # Only the mask allocates a new frame; the fills run in place on it.
+    table_df = table_df.mask(table_df.eq(""))
+    table_df.ffill(inplace=True)
+    table_df.fillna("", inplace=True)
+
+    # Save as CSV
+    table_df.to_csv(csv_path, index=False)
+
 def main():
     parser = argparse.ArgumentParser(description="Convert PDF to other formats using Docling.")
     parser.add_argument("input", help="Path to the input PDF file.")
-    parser.add_argument("config", help="JSON config: '{\"format\": \"markdown|txt|word\", \"extractTables\": bool}'")
+    parser.add_argument("config", help="JSON config: '{\"format\": \"markdown|txt|word\", \"extractTables\": bool, \"pageRange\": \"1-5\", \"workers\": int}'")
     parser.add_argument("-o", "--output", help="Path to the output file (optional).")
 
     args = parser.parse_args()
@@ -9,6 +9,7 @@ Tests the complete workflow:
 """
 
 import json
+import shutil
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -26,61 +27,65 @@ from havachat.cli.notion_sync import NotionSyncCLI
 class TestLLMJudgeNotionPipeline:
     """Test suite for LLM judge and Notion integration pipeline."""
     
-    @pytest.fixture
-    def temp_data_dir(self):
-        """Create temporary data directory structure."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            data_dir = Path(tmpdir) / "data"
-            data_dir.mkdir()
-            
-            # Create language/level directory
-            zh_hsk3 = data_dir / "zh" / "HSK3"
-            zh_hsk3.mkdir(parents=True)
-            
-            # Create sample content file
-            conversations = [
-                {
-                    "id": "conv-1",
-                    "type": "conversation",
-                    "title": "Ordering Food",
-                    "description": "A conversation about ordering food",
-                    "topic_name": "Food",
-                    "scenario_name": "Restaurant Ordering",
-                    "learning_item_ids": ["item-1", "item-2"],
-                    "segments": [
-                        {
-                            "speaker": "Speaker-1",
-                            "text": "你好！",
-                            "translation": "Hello!"
-                        }
-                    ],
-                    "status": "generated",
-                    "created_at": "2026-01-31T10:00:00"
-                }
-            ]
-            
-            with open(zh_hsk3 / "conversations.json", "w") as f:
-                json.dump(conversations, f)
-                
-            # Create usage stats file
-            usage_stats = [
-                {
-                    "learning_item_id": "item-1",
-                    "appearances_count": 5,
-                    "last_used_content_id": "conv-1"
-                },
-                {
-                    "learning_item_id": "item-2",
-                    "appearances_count": 3,
-                    "last_used_content_id": "conv-1"
-                }
-            ]
+    @pytest.fixture(scope="class")
+    def data_template_dir(self, tmp_path_factory):
+        """Create the data directory structure once; tests get copies."""
+        data_dir = tmp_path_factory.mktemp("template") / "data"
+        data_dir.mkdir()
+        
+        # Create language/level directory
+        zh_hsk3 = data_dir / "zh" / "HSK3"
+        zh_hsk3.mkdir(parents=True)
+        
+        # Create sample content file
+        conversations = [
+            {
+                "id": "conv-1",
+                "type": "conversation",
+                "title": "Ordering Food",
+                "description": "A conversation about ordering food",
+                "topic_name": "Food",
+                "scenario_name": "Restaurant Ordering",
+                "learning_item_ids": ["item-1", "item-2"],
+                "segments": [
+                    {
+                        "speaker": "Speaker-1",
+                        "text": "你好！",
+                        "translation": "Hello!"
+                    }
+                ],
+                "status": "generated",
+                "created_at": "2026-01-31T10:00:00"
+            }
+        ]
+        
+        with open(zh_hsk3 / "conversations.json", "w") as f:
+            json.dump(conversations, f)
             
-            with open(zh_hsk3 / "usage_stats.json", "w") as f:
-                json.dump(usage_stats, f)
-                
-            yield data_dir
+        # Create usage stats file
+        usage_stats = [
+            {
+                "learning_item_id": "item-1",
+                "appearances_count": 5,
+                "last_used_content_id": "conv-1"
+            },
+            {
+                "learning_item_id": "item-2",
+                "appearances_count": 3,
+                "last_used_content_id": "conv-1"
+            }
+        ]
+        
+        with open(zh_hsk3 / "usage_stats.json", "w") as f:
+            json.dump(usage_stats, f)
             
+        return data_dir
+        
+    @pytest.fixture
+    def temp_data_dir(self, data_template_dir, tmp_path):
+        """Copy the data directory template, so tests can modify their files."""
+        return Path(shutil.copytree(data_template_dir, tmp_path / "data"))
+        
     @pytest.fixture
     def temp_mapping_file(self):
         """Create temporary mapping file."""
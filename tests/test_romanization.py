@@ -7,6 +7,7 @@ from havachat.utils.romanization import (
     extract_sense_marker,
     get_japanese_romaji,
     get_chinese_pinyin,
+    numeric_tone_syllable,
     translate_chinese_pos,
 )
 
@@ -28,12 +29,51 @@ class TestChinesePinyin:
         assert get_chinese_pinyin("会") == "huì"
         assert get_chinese_pinyin("和") == "hé"
 
+    def test_single_characters_match_pypinyin(self):
+        """Test the single-character table lookup agrees with pypinyin."""
+        from pypinyin import Style, lazy_pinyin
+
+        for char in "爱行了长重的得地着好还都":
+            expected = "".join(lazy_pinyin(char, style=Style.TONE, errors="ignore"))
+            assert get_chinese_pinyin(char) == expected
+        assert get_chinese_pinyin("!") == ""
+
     def test_tone_marks(self):
         """Test that tone marks are correctly included."""
         result = get_chinese_pinyin("中国")
         assert "ō" in result or "ó" in result or "ǒ" in result or "ò" in result
 
 
+class TestNumericToneSyllable:
+    """Tests for tone-mark to tone-number conversion."""
+
+    def test_matches_pypinyin_tone3(self):
+        """Test conversion agrees with pypinyin's TONE3 style."""
+        from pypinyin import Style, pinyin
+
+        for text in ["银行", "绿色", "女儿", "爸爸", "嗯", "呣", "欸", "hello 你好!"]:
+            expected = [item[0] for item in pinyin(text, style=Style.TONE3)]
+            marked = [item[0] for item in pinyin(text, style=Style.TONE)]
+            assert [numeric_tone_syllable(s) for s in marked] == expected
+
+    def test_neutral_tone(self):
+        """Test neutral-tone syllables get no number."""
+        assert numeric_tone_syllable("ba") == "ba"
+        assert numeric_tone_syllable("lǜ") == "lv4"
+
+    def test_numeric_pinyin_leaves_non_han_text(self):
+        """Test only Han syllables are converted in mixed text, as in TONE3."""
+        from pypinyin import Style, lazy_pinyin
+
+        from havachat.utils.item_processing import get_numeric_pinyin
+
+        for text in ["ü", "café", "lǜ 绿色", "你好abc世界", "咖啡 café!"]:
+            expected = " ".join(lazy_pinyin(text, style=Style.TONE3))
+            assert get_numeric_pinyin(text) == expected
+        assert get_numeric_pinyin("ü") == "ü"
+        assert get_numeric_pinyin("咖啡 café") == "ka1 fei1  café"
+
+
 class TestSenseMarkers:
     """Tests for sense marker handling."""
 
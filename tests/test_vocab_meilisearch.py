@@ -12,19 +12,65 @@ Prerequisites:
 - OPENAI_API_KEY set in environment or .env file
 """
 
-import json
 import os
 import subprocess
 import sys
 import time
+from itertools import islice
 from pathlib import Path
 
 import meilisearch
 from dotenv import load_dotenv
 
+from havachat.utils.file_io import read_json_stream
+
 # Load environment variables
 load_dotenv()
 
+# Documents sent per add_documents request
+DOCUMENT_BATCH_SIZE = 10_000
+
+# Seconds to wait for a Meilisearch task before giving up
+TASK_TIMEOUT = 300
+
+
+def _await_task(client: meilisearch.Client, uid: int, timeout: float = TASK_TIMEOUT):
+    """Poll a Meilisearch task until it finishes.
+
+    Polls quickly at first and backs off to every 2 seconds, so short tasks
+    return within ~100ms and long ones (embedding generation) do not flood
+    the server.
+
+    Args:
+        client: Meilisearch client
+        uid: Task UID
+        timeout: Seconds to wait before raising TimeoutError
+
+    Returns:
+        The finished task (status "succeeded", "failed" or "canceled")
+    """
+    deadline = time.monotonic() + timeout
+    backoff = 0.1
+    while True:
+        task = client.get_task(uid)
+        if task.status in ("succeeded", "failed", "canceled"):
+            return task
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"Meilisearch task {uid} still {task.status} after {timeout}s")
+        time.sleep(backoff)
+        backoff = min(backoff * 1.5, 2.0)
+
+
+def _await_indexing(index, timeout: float = TASK_TIMEOUT) -> None:
+    """Poll index stats until Meilisearch reports it is no longer indexing."""
+    deadline = time.monotonic() + timeout
+    backoff = 0.1
+    while index.get_stats().is_indexing:
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"Index {index.uid} still indexing after {timeout}s")
+        time.sleep(backoff)
+        backoff = min(backoff * 1.5, 2.0)
+
 
 def run_enrichment(
     language: str,
@@ -33,9 +79,13 @@ def run_enrichment(
     input_file: Path,
     output_file: Path,
     max_items: int = 20,
+    isolated: bool = False,
 ) -> bool:
     """Run vocabulary enrichment CLI.
 
+    Runs the CLI's main() in this process by default, skipping interpreter
+    startup and the re-import of the enrichment dependencies.
+
     Args:
         language: Language code (zh, ja, fr)
         level: Proficiency level
@@ -43,6 +93,7 @@ def run_enrichment(
         input_file: Input file path
         output_file: Output file path
         max_items: Maximum items to process
+        isolated: Run the CLI in a subprocess instead (default: False)
 
     Returns:
         True if successful, False otherwise
@@ -51,10 +102,7 @@ def run_enrichment(
     print(f"Enriching {language} {level} vocabulary...")
     print(f"{'='*80}")
 
-    cmd = [
-        sys.executable,
-        "-m",
-        "havachat.cli.enrich_vocab",
+    cli_args = [
         "--language",
         language,
         "--level",
@@ -71,20 +119,32 @@ def run_enrichment(
         "INFO",
     ]
 
-    try:
-        result = subprocess.run(
-            cmd,
-            cwd=Path(__file__).parent.parent,
-            check=True,
-            capture_output=False,
-            text=True,
-        )
-        print(f"\n✓ Enrichment completed successfully")
-        return True
+    if isolated:
+        try:
+            subprocess.run(
+                [sys.executable, "-m", "havachat.cli.enrich_vocab", *cli_args],
+                cwd=Path(__file__).parent.parent,
+                check=True,
+                capture_output=False,
+                text=True,
+            )
+        except subprocess.CalledProcessError as e:
+            print(f"\n✗ Enrichment failed: {e}")
+            return False
+    else:
+        from havachat.cli.enrich_vocab import main as enrich_vocab_main
 
-    except subprocess.CalledProcessError as e:
-        print(f"\n✗ Enrichment failed: {e}")
-        return False
+        try:
+            exit_code = enrich_vocab_main(cli_args)
+        except SystemExit as e:
+            # argparse exits on invalid arguments
+            exit_code = e.code
+        if exit_code:
+            print(f"\n✗ Enrichment failed with exit code {exit_code}")
+            return False
+
+    print(f"\n✓ Enrichment completed successfully")
+    return True
 
 
 def setup_meilisearch_index(
@@ -110,21 +170,22 @@ def setup_meilisearch_index(
         # Create index or get existing
         index = client.index(index_name)
 
-        # Add documents (with retry)
+        # Add documents in batches: Meilisearch indexes large batches much
+        # faster than many small ones, but a single huge payload can exhaust
+        # its memory
         print(f"Adding {len(documents)} documents...")
-        task = index.add_documents(documents)
+        tasks = index.add_documents_in_batches(documents, batch_size=DOCUMENT_BATCH_SIZE)
 
-        # Wait for indexing to complete
-        print(f"Waiting for indexing task {task.task_uid}...")
-        time.sleep(2)
+        # Wait for every indexing task to complete
+        task_uids = [task.task_uid for task in tasks]
+        print(f"Waiting for indexing tasks {task_uids}...")
+        for task_uid in task_uids:
+            task_status = _await_task(client, task_uid)
+            print(f"Task {task_uid} status: {task_status.status}")
 
-        # Check task status
-        task_status = client.get_task(task.task_uid)
-        print(f"Task status: {task_status.status}")
-
-        if task_status.status == "failed":
-            print(f"✗ Indexing failed: {task_status.error}")
-            return False
+            if task_status.status == "failed":
+                print(f"✗ Indexing failed: {task_status.error}")
+                return False
 
         # Configure OpenAI embeddings
         print("\nConfiguring OpenAI embeddings...")
@@ -134,7 +195,7 @@ def setup_meilisearch_index(
             print("✗ OPENAI_API_KEY not found in environment")
             return False
 
-        index.update_embedders(
+        task = index.update_embedders(
             {
                 "vocab-openai": {
                     "source": "openAi",
@@ -145,6 +206,14 @@ def setup_meilisearch_index(
             }
         )
 
+        # Embeddings are generated as part of the settings task
+        print(f"Waiting for embeddings to generate (task {task.task_uid})...")
+        task_status = _await_task(client, task.task_uid)
+        if task_status.status != "succeeded":
+            print(f"✗ Embedder setup {task_status.status}: {task_status.error}")
+            return False
+        _await_indexing(index)
+
         print("✓ Meilisearch index configured successfully")
         return True
 
@@ -167,8 +236,6 @@ def test_search_queries(client: meilisearch.Client, index_name: str) -> None:
     print(f"Testing search queries on {index_name}")
     print(f"{'='*80}")
 
-    index = client.index(index_name)
-
     # Test queries
     test_queries = [
         {
@@ -187,34 +254,39 @@ def test_search_queries(client: meilisearch.Client, index_name: str) -> None:
         },
     ]
 
-    for i, test in enumerate(test_queries, 1):
-        print(f"\n--- Query {i}: {test['description']} ---")
-        print(f"Query text: '{test['query']}'")
-
-        search_params = {}
+    # Send all queries in one multi-search request: one HTTP round-trip
+    # instead of one per query
+    search_requests = []
+    for test in test_queries:
+        search_request = {"indexUid": index_name, "q": test["query"]}
 
         if test.get("hybrid"):
-            search_params["hybrid"] = {
+            search_request["hybrid"] = {
                 "embedder": "vocab-openai",
                 "semanticRatio": 0.8,
             }
 
-        try:
-            result = index.search(test["query"], search_params)
+        search_requests.append(search_request)
 
-            print(f"Found {result['estimatedTotalHits']} results:")
+    try:
+        results = client.multi_search(search_requests)["results"]
+    except Exception as e:
+        print(f"✗ Search failed: {e}")
+        import traceback
 
-            for j, hit in enumerate(result["hits"][:5], 1):
-                print(f"\n  {j}. {hit['target_item']}")
-                print(f"     Explanation: {hit['definition'][:100]}...")
-                if "_semanticScore" in hit:
-                    print(f"     Semantic score: {hit['_semanticScore']:.4f}")
+        traceback.print_exc()
+        return
 
-        except Exception as e:
-            print(f"✗ Search failed: {e}")
-            import traceback
+    for i, (test, result) in enumerate(zip(test_queries, results), 1):
+        print(f"\n--- Query {i}: {test['description']} ---")
+        print(f"Query text: '{test['query']}'")
+        print(f"Found {result['estimatedTotalHits']} results:")
 
-            traceback.print_exc()
+        for j, hit in enumerate(result["hits"][:5], 1):
+            print(f"\n  {j}. {hit['target_item']}")
+            print(f"     Explanation: {hit['definition'][:100]}...")
+            if "_semanticScore" in hit:
+                print(f"     Semantic score: {hit['_semanticScore']:.4f}")
 
 
 def main() -> int:
@@ -237,7 +309,7 @@ def main() -> int:
     output_file = output_dir / "mandarin_hsk1_enriched.json"
     max_items = 20
 
-    # Step 1: Run enrichment
+    # Step 1: Run enrichment (--isolated runs the CLI in a subprocess)
     success = run_enrichment(
         language=language,
         level=level,
@@ -245,6 +317,7 @@ def main() -> int:
         input_file=input_file,
         output_file=output_file,
         max_items=max_items,
+        isolated="--isolated" in sys.argv[1:],
     )
 
     if not success:
@@ -256,14 +329,9 @@ def main() -> int:
         print(f"\n✗ Output file not found: {output_file}")
         return 1
 
-    with open(output_file, "r", encoding="utf-8") as f:
-        documents = json.load(f)
-
-    print(f"\n✓ Loaded {len(documents)} enriched documents")
-
-    # Limit to 20 for testing
-    documents = documents[:20]
-    print(f"Using {len(documents)} documents for Meilisearch test")
+    # Limit to 20 for testing; only those items are parsed from the file
+    documents = list(islice(read_json_stream(output_file), 20))
+    print(f"\n✓ Loaded {len(documents)} enriched documents for Meilisearch test")
 
     # Step 3: Connect to Meilisearch
     try:
@@ -289,10 +357,6 @@ def main() -> int:
     if not success:
         return 1
 
-    # Give embeddings time to generate
-    print("\nWaiting for embeddings to generate (10 seconds)...")
-    time.sleep(10)
-
     # Step 5: Test search queries
     test_search_queries(client, index_name)
 
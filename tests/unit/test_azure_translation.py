@@ -0,0 +1,72 @@
+"""Unit tests for Azure Translation helper."""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from havachat.utils.azure_translation import AzureTranslationHelper
+from havachat.utils.translation_cache import TranslationCache
+
+
+@pytest.fixture
+def mock_translation_client():
+    """Mock Azure TextTranslationClient that echoes each text back translated."""
+    with patch("havachat.utils.azure_translation.TextTranslationClient") as mock_client:
+        def translate(body, from_language, to_language):
+            return [
+                MagicMock(translations=[MagicMock(text=f"en:{text}")])
+                for text in body
+            ]
+        mock_client.return_value.translate.side_effect = translate
+        yield mock_client.return_value
+
+
+@pytest.fixture
+def helper(mock_translation_client, tmp_path):
+    """Create helper with mocked credentials and a temporary cache."""
+    env = {
+        "AZURE_TEXT_TRANSLATION_APIKEY": "test-key",
+        "AZURE_TEXT_TRANSLATION_REGION": "test-region",
+    }
+    with patch.dict(os.environ, env):
+        helper = AzureTranslationHelper()
+    helper.cache = TranslationCache(cache_dir=tmp_path)
+    return helper
+
+
+def test_translate_batch_chunks_and_deduplicates(helper, mock_translation_client):
+    """Test large batches are split per request and repeated texts sent once."""
+    texts = [f"句子{i}" for i in range(250)] + ["句子0", "句子1"]
+
+    translations = helper.translate_batch(texts, "zh")
+
+    assert translations == [f"en:{text}" for text in texts]
+    chunk_sizes = [
+        len(call.kwargs["body"])
+        for call in mock_translation_client.translate.call_args_list
+    ]
+    assert chunk_sizes == [100, 100, 50]
+    assert helper.total_characters == sum(len(f"句子{i}") for i in range(250))
+
+
+def test_translate_batch_respects_character_limit(helper, mock_translation_client):
+    """Test a request is closed before it exceeds the character limit."""
+    helper.MAX_CHARS_PER_REQUEST = 10
+
+    helper.translate_batch(["一二三四五六", "七八九十", "甲乙"], "zh")
+
+    bodies = [call.kwargs["body"] for call in mock_translation_client.translate.call_args_list]
+    assert bodies == [["一二三四五六", "七八九十"], ["甲乙"]]
+
+
+def test_translate_batch_only_sends_cache_misses(helper, mock_translation_client):
+    """Test cached texts are merged back in order without another request."""
+    helper.translate_batch(["你好", "谢谢"], "zh")
+    mock_translation_client.translate.reset_mock()
+
+    translations = helper.translate_batch(["再见", "你好", "谢谢"], "zh")
+
+    assert translations == ["en:再见", "en:你好", "en:谢谢"]
+    mock_translation_client.translate.assert_called_once()
+    assert mock_translation_client.translate.call_args.kwargs["body"] == ["再见"]
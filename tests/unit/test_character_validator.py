@@ -4,7 +4,9 @@ import pytest
 
 from havachat.validators.character_validator import (
     extract_chinese_characters,
+    prepare_vocab_characters,
     validate_chinese_characters,
+    validate_chinese_characters_prepared,
     validate_content_characters,
 )
 
@@ -45,6 +47,12 @@ class TestChineseCharacterExtraction:
         assert '天' in chars
         assert '学' in chars
 
+    def test_extract_is_memoized(self):
+        """Test repeated texts return the same immutable set."""
+        chars = extract_chinese_characters("学校")
+        assert isinstance(chars, frozenset)
+        assert extract_chinese_characters("学校") is chars
+
 
 class TestChineseCharacterValidation:
     """Tests for Chinese character validation."""
@@ -106,6 +114,19 @@ class TestChineseCharacterValidation:
         assert is_valid is True
         assert missing == []
 
+    @pytest.mark.parametrize("content,vocab", [
+        ("我爱学习", ["我", "爱", "学习", "中文"]),
+        ("我在学校学习", ["我", "在", "学校"]),
+        ("我爱学习！你好吗？", ["我", "爱", "学习", "你好"]),
+        ("Hello world", ["你好"]),
+        ("我爱学习", []),
+    ])
+    def test_validate_prepared_matches(self, content, vocab):
+        """Test validating against prepared vocab characters gives the same result."""
+        vocab_chars = prepare_vocab_characters(vocab)
+        assert validate_chinese_characters_prepared(content, vocab_chars) == \
+            validate_chinese_characters(content, vocab)
+
 
 class TestContentCharacterValidation:
     """Tests for language-agnostic content validation."""
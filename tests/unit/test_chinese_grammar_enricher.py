@@ -249,7 +249,7 @@ def test_validate_output_insufficient_examples():
     )
     
     # Manually reduce examples to simulate insufficient examples
-    enriched.examples = enriched.examples[:2]
+    enriched = enriched.model_copy(update={"examples": enriched.examples[:2]})
     
     source_item = {"pattern": "会"}
     
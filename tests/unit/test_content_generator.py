@@ -0,0 +1,51 @@
+"""Unit tests for content generator topic and scenario storage."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from havachat.generators.content_generator import ContentGenerator, Scenario, Topic
+from havachat.validators.schema import LevelSystem
+
+
+@pytest.fixture
+def generator():
+    """Create a content generator with a mocked LLM client."""
+    return ContentGenerator(
+        language="zh",
+        level_system=LevelSystem.HSK,
+        level="HSK1",
+        llm_client=MagicMock(),
+    )
+
+
+def test_load_topics_and_scenarios(generator, tmp_path):
+    """Test topics and scenarios are loaded from JSON files."""
+    (tmp_path / "topics.json").write_text(
+        json.dumps([{"id": "t1", "name": "Food"}]), encoding="utf-8"
+    )
+    (tmp_path / "scenarios.json").write_text(
+        json.dumps([
+            {"id": "s1", "name": "Ordering at a restaurant"},
+            {"id": "s2", "name": "Buying groceries"},
+        ]),
+        encoding="utf-8",
+    )
+
+    generator.load_topics_and_scenarios(tmp_path)
+
+    assert generator.topics == {"Food": Topic(id="t1", name="Food")}
+    assert set(generator.scenarios) == {"Ordering at a restaurant", "Buying groceries"}
+    scenario = generator.scenarios["Buying groceries"]
+    assert isinstance(scenario, Scenario)
+    assert scenario.id == "s2"
+
+
+def test_load_topics_and_scenarios_missing_files(generator, tmp_path):
+    """Test missing files leave topics and scenarios empty."""
+    generator.load_topics_and_scenarios(tmp_path / "new")
+
+    assert generator.topics == {}
+    assert generator.scenarios == {}
+    assert generator.scenarios_file == tmp_path / "new" / "scenarios.json"
@@ -12,9 +12,14 @@ from havachat.utils.file_io import (
     list_files,
     parse_markdown_sections,
     read_csv,
+    read_csv_columns,
     read_json,
+    read_json_mmap,
+    read_json_stream,
     read_markdown,
     read_tsv,
+    read_tsv_columns,
+    write_bytes_atomic,
     write_csv,
     write_json,
     write_tsv,
@@ -78,6 +83,59 @@ class TestJSONFunctions:
         assert loaded_data == data
 
 
+    def test_read_json_mmap(self, tmp_path):
+        """Test memory-mapped JSON reading matches read_json."""
+        data = {"word": "你好", "items": [1, 2, 3]}
+        file_path = tmp_path / "test.json"
+        write_json(data, file_path)
+
+        assert read_json_mmap(file_path) == read_json(file_path)
+
+    def test_read_json_stream(self, tmp_path):
+        """Test streaming yields the items of a top-level array in order."""
+        data = [{"id": i, "word": f"词{i}", "score": i / 2} for i in range(5)]
+        file_path = tmp_path / "items.json"
+        write_json(data, file_path)
+
+        items = read_json_stream(file_path)
+        assert next(items) == data[0]
+        assert list(items) == data[1:]
+
+    def test_read_json_mmap_empty_file(self, tmp_path):
+        """Test memory-mapped reading of an empty file raises a decode error."""
+        file_path = tmp_path / "empty.json"
+        file_path.touch()
+
+        with pytest.raises(json.JSONDecodeError):
+            read_json_mmap(file_path)
+
+    def test_write_bytes_atomic_replaces_file(self, tmp_path):
+        """Test atomic write replaces contents and leaves no temp file."""
+        file_path = tmp_path / "stats.json"
+        file_path.write_text("old")
+
+        write_bytes_atomic(b'{"a": 1}', file_path)
+
+        assert read_json(file_path) == {"a": 1}
+        assert list(tmp_path.iterdir()) == [file_path]
+
+    def test_write_bytes_atomic_keeps_original_on_failure(self, tmp_path, monkeypatch):
+        """Test a failed rename keeps the original file and removes the temp file."""
+        file_path = tmp_path / "stats.json"
+        file_path.write_text("old")
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("havachat.utils.file_io.os.replace", fail_replace)
+
+        with pytest.raises(OSError):
+            write_bytes_atomic(b"new", file_path)
+
+        assert file_path.read_text() == "old"
+        assert list(tmp_path.iterdir()) == [file_path]
+
+
 class TestCSVTSVFunctions:
     """Test CSV and TSV read/write functions."""
 
@@ -113,6 +171,50 @@ class TestCSVTSVFunctions:
         loaded_data = read_tsv(file_path)
         assert loaded_data == data
 
+    def test_read_tsv_stream(self, tmp_path):
+        """Test streaming reads yield the same rows lazily."""
+        data = [{"word": f"词{i}", "rank": str(i)} for i in range(5)]
+        file_path = tmp_path / "stream.tsv"
+        write_tsv(data, file_path)
+
+        rows = read_tsv(file_path, stream=True)
+        assert not isinstance(rows, list)
+        assert next(rows) == data[0]
+        assert list(rows) == data[1:]
+
+    def test_read_csv_stream_nonexistent_file(self, tmp_path):
+        """Test streaming a missing file raises immediately."""
+        with pytest.raises(FileNotFoundError):
+            read_csv(tmp_path / "missing.csv", stream=True)
+
+    def test_read_csv_ragged_rows_match_dictreader(self, tmp_path):
+        """Test short, long and blank rows are read like csv.DictReader."""
+        import csv
+
+        file_path = tmp_path / "ragged.csv"
+        file_path.write_text("a,b,c\n1,2,3\n4,5\n\n6,7,8,9\n", encoding="utf-8")
+
+        with open(file_path, encoding="utf-8", newline="") as f:
+            expected = list(csv.DictReader(f))
+        assert read_csv(file_path) == expected
+
+    def test_read_tsv_columns(self, tmp_path):
+        """Test TSV files are read into one list per column."""
+        file_path = tmp_path / "columns.tsv"
+        file_path.write_text("word\tpos\n银行\tnoun\n学\n\n走\tverb\textra\n", encoding="utf-8")
+
+        assert read_tsv_columns(file_path) == {
+            "word": ["银行", "学", "走"],
+            "pos": ["noun", None, "verb"],
+        }
+
+    def test_read_csv_columns_header_only(self, tmp_path):
+        """Test a file with only a header gives empty columns."""
+        file_path = tmp_path / "header.csv"
+        file_path.write_text("name,age\n", encoding="utf-8")
+
+        assert read_csv_columns(file_path) == {"name": [], "age": []}
+
     def test_write_csv_empty_data_raises_error(self, tmp_path):
         """Test that writing empty data raises ValueError."""
         with pytest.raises(ValueError, match="Cannot write empty data"):
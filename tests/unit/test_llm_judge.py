@@ -1,5 +1,6 @@
 """Unit tests for LLM Judge implementation."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -7,6 +8,7 @@ from pydantic import ValidationError
 
 from src.models.llm_judge_evaluation import DimensionScore, LLMJudgeEvaluation
 from src.pipeline.validators.llm_judge import LLMJudge
+from src.pipeline.validators.llm_judge_cache import ExactMatchCache, SemanticCache
 
 
 @pytest.fixture
@@ -239,3 +241,129 @@ class TestLLMJudge:
         # Should be overridden with correct values
         assert result.content_id == "correct-id"
         assert result.evaluator_model == "gpt-4-turbo"
+    
+    def test_evaluate_batch_keeps_order_and_failures(self, mock_llm_client, sample_evaluation):
+        """Test batch evaluation returns results in input order, with errors in place."""
+        def generate(prompt, **kwargs):
+            if "broken" in prompt:
+                raise Exception("API Error")
+            return sample_evaluation.model_copy()
+        
+        mock_llm_client.generate.side_effect = generate
+        judge = LLMJudge(mock_llm_client)
+        
+        results = judge.evaluate_batch(
+            [
+                {"content_id": f"conv-{i}", "text": text, "language": "zh", "level": "hsk1"}
+                for i, text in enumerate(["你好", "broken", "再见"])
+            ],
+            max_workers=3
+        )
+        
+        assert [r.content_id for r in (results[0], results[2])] == ["conv-0", "conv-2"]
+        assert isinstance(results[1], Exception)
+        assert judge.evaluate_batch([]) == []
+    
+    def test_batch_api_round_trip(self, mock_llm_client, sample_evaluation):
+        """Test batch requests carry content metadata back into parsed evaluations."""
+        openai_client = MagicMock()
+        openai_client.files.create.return_value.id = "file-in"
+        openai_client.batches.create.return_value.id = "batch-1"
+        
+        judge = LLMJudge(mock_llm_client, model="gpt-4o-mini")
+        batch_id = judge.submit_batch(
+            [
+                {"content_id": "conv-1", "text": "你好", "language": "zh", "level": "hsk1"},
+                {"content_id": "story-1", "text": "从前", "language": "zh", "level": "hsk1",
+                 "content_type": "story"},
+            ],
+            openai_client=openai_client
+        )
+        
+        assert batch_id == "batch-1"
+        _, payload = openai_client.files.create.call_args.kwargs["file"]
+        requests = [json.loads(line) for line in payload.decode("utf-8").splitlines()]
+        assert [r["custom_id"] for r in requests] == ["conversation:conv-1", "story:story-1"]
+        assert requests[0]["body"]["model"] == "gpt-4o-mini"
+        
+        # Still running
+        openai_client.batches.retrieve.return_value.status = "in_progress"
+        assert judge.poll_batch("batch-1", openai_client=openai_client) is None
+        
+        # Completed: one success, one failed request
+        content = sample_evaluation.model_dump_json()
+        output = [
+            {"custom_id": "conversation:conv-1",
+             "response": {"status_code": 200, "body": {"choices": [{"message": {"content": content}}]}}},
+            {"custom_id": "story:story-1", "response": {"status_code": 500, "body": {}}},
+        ]
+        batch = openai_client.batches.retrieve.return_value
+        batch.status = "completed"
+        batch.output_file_id = "file-out"
+        batch.error_file_id = None
+        openai_client.files.content.return_value.text = "\n".join(json.dumps(r) for r in output)
+        
+        results = judge.poll_batch("batch-1", openai_client=openai_client)
+        
+        assert results["conv-1"].content_id == "conv-1"
+        assert results["conv-1"].evaluator_model == "gpt-4o-mini"
+        assert isinstance(results["story-1"], Exception)
+    
+    def test_cache_hit_skips_llm_call(self, mock_llm_client, sample_evaluation, tmp_path):
+        """Test identical requests are served from the cache with fresh metadata."""
+        mock_llm_client.generate.return_value = sample_evaluation
+        judge = LLMJudge(mock_llm_client, cache=ExactMatchCache(cache_dir=tmp_path))
+        
+        first = judge.evaluate_conversation(
+            content_id="conv-1", text="你好", language="zh", level="hsk1"
+        )
+        second = judge.evaluate_conversation(
+            content_id="conv-2", text="你好", language="zh", level="hsk1"
+        )
+        judge.evaluate_conversation(
+            content_id="conv-3", text="你好", language="zh", level="hsk2"
+        )
+        
+        assert mock_llm_client.generate.call_count == 2
+        assert second.content_id == "conv-2"
+        assert second.average_score() == first.average_score()
+    
+    def test_cache_expired_entries_miss(self, sample_evaluation, tmp_path):
+        """Test entries past their TTL are not returned and can be cleared."""
+        cache = ExactMatchCache(cache_dir=tmp_path, ttl_days=0)
+        key = ExactMatchCache.make_key(prompt="p", model="m")
+        cache.set(key, sample_evaluation)
+        
+        with patch("src.pipeline.validators.llm_judge_cache.time.time", return_value=10**12):
+            assert cache.get(key) is None
+            assert cache.clear_expired() == 1
+    
+    def test_semantic_cache_matches_near_duplicates(self, mock_llm_client, sample_evaluation, tmp_path):
+        """Test near-identical texts reuse an evaluation only within the same scope."""
+        vectors = {
+            "你好，我想买苹果。": [1.0, 0.0, 0.0],
+            "你好，我要买苹果。": [0.99, 0.05, 0.0],
+            "今天天气很好。": [0.0, 1.0, 0.0],
+        }
+        mock_llm_client.generate.return_value = sample_evaluation
+        judge = LLMJudge(
+            mock_llm_client,
+            semantic_cache=SemanticCache(vectors.__getitem__, cache_dir=tmp_path),
+        )
+        
+        judge.evaluate_conversation(
+            content_id="conv-1", text="你好，我想买苹果。", language="zh", level="hsk1"
+        )
+        near = judge.evaluate_conversation(
+            content_id="conv-2", text="你好，我要买苹果。", language="zh", level="hsk1"
+        )
+        assert mock_llm_client.generate.call_count == 1
+        assert near.content_id == "conv-2"
+        
+        judge.evaluate_conversation(
+            content_id="conv-3", text="今天天气很好。", language="zh", level="hsk1"
+        )
+        judge.evaluate_conversation(
+            content_id="conv-4", text="你好，我要买苹果。", language="zh", level="hsk2"
+        )
+        assert mock_llm_client.generate.call_count == 3
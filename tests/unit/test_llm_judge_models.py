@@ -169,6 +169,25 @@ class TestNotionMapping:
                 last_pushed_at=datetime.utcnow(),
                 status_in_notion="Invalid Status"  # Not in allowed list
             )
+    
+    def test_mapping_is_frozen(self):
+        """Test mappings reject attribute assignment but ignore unknown fields."""
+        mapping = NotionMapping(
+            content_id="abc-123",
+            notion_page_id="notion-xyz",
+            language="ja",
+            level="jlpt-n5",
+            type="conversation",
+            title="Test",
+            last_pushed_at=datetime(2026, 1, 31, 10, 30),
+            status_in_notion="Not started"
+        )
+        
+        with pytest.raises(ValidationError):
+            mapping.status_in_notion = "OK"
+        # Legacy mapping files may carry extra keys; they still load
+        legacy = NotionMapping(**mapping.model_dump(), unexpected="value")
+        assert legacy == mapping
 
 
 class TestNotionPushQueue:
@@ -3,6 +3,7 @@ Unit tests for NotionClient.
 """
 
 import json
+import time
 from datetime import datetime
 from unittest.mock import MagicMock, Mock, patch, mock_open
 
@@ -342,3 +343,127 @@ class TestNotionClient:
                 notion_page_id="page-1",
                 status="Invalid Status"
             )
+
+
+class TestNotionClientRest:
+    """Test suite for NotionClient with the REST calls mocked."""
+    
+    @staticmethod
+    def _content_unit(content_id, title):
+        """Create a ContentUnit stand-in with the fields push_conversation reads."""
+        segment = MagicMock()
+        segment.model_dump.return_value = {
+            "speaker": "Speaker-1", "text": "你好！", "translation": "Hello!"
+        }
+        unit = MagicMock(
+            id=content_id,
+            title=title,
+            description="",
+            topic_ids=[],
+            scenario_ids=[],
+            segments=[segment],
+            llm_judge_evaluation=None,
+            language="zh",
+            level_min="HSK1",
+        )
+        unit.type.value = "conversation"
+        return unit
+        
+    def test_push_conversations_keeps_order_and_failures(self, tmp_path):
+        """Test results follow input order and a failed push does not stop the rest."""
+        client = NotionClient(
+            api_token="test-token",
+            database_id="test-db-id",
+            queue_file=str(tmp_path / "queue.jsonl"),
+            session=Mock()
+        )
+        client.data_source_id = "ds-1"
+        
+        def post(url, headers, json):
+            title = json["properties"]["Title"]["title"][0]["text"]["content"]
+            if title == "Broken":
+                raise RuntimeError("API error")
+            response = Mock()
+            response.json.return_value = {"id": f"page-{title}"}
+            return response
+            
+        units = [
+            self._content_unit("c1", "One"),
+            self._content_unit("c2", "Broken"),
+            self._content_unit("c3", "Three"),
+        ]
+        client.session.post.side_effect = post
+        with patch("time.sleep"):
+            results = client.push_conversations(units, max_workers=3)
+            
+        assert results[0] == "page-One"
+        assert isinstance(results[1], Exception)
+        assert results[2] == "page-Three"
+        
+        queued = (tmp_path / "queue.jsonl").read_text().splitlines()
+        assert [json.loads(line)["content_id"] for line in queued] == ["c2"]
+        assert client.push_conversations([]) == []
+        
+    def test_push_conversations_reports_each_result(self, tmp_path):
+        """Test on_result sees every push as it finishes, before the call returns."""
+        client = NotionClient(
+            api_token="test-token",
+            database_id="test-db-id",
+            queue_file=str(tmp_path / "queue.jsonl"),
+            session=Mock()
+        )
+        client.data_source_id = "ds-1"
+        
+        def post(url, headers, json):
+            title = json["properties"]["Title"]["title"][0]["text"]["content"]
+            if title == "Broken":
+                raise RuntimeError("API error")
+            response = Mock()
+            response.json.return_value = {"id": f"page-{title}"}
+            return response
+            
+        units = [self._content_unit("c1", "One"), self._content_unit("c2", "Broken")]
+        client.session.post.side_effect = post
+        reported = {}
+        with patch("time.sleep"):
+            results = client.push_conversations(
+                units,
+                on_result=lambda unit, result: reported.__setitem__(unit.id, result)
+            )
+            
+        assert reported["c1"] == "page-One"
+        assert reported["c2"] is results[1]
+        assert isinstance(results[1], Exception)
+        
+    def test_validate_database_schema_caches_schema(self):
+        """Test the data source schema is fetched once per TTL."""
+        client = NotionClient(api_token="test-token", database_id="test-db-id", session=Mock())
+        client.data_source_id = "ds-1"
+        
+        response = Mock()
+        response.json.return_value = {
+            "properties": {
+                name: {"type": column_type}
+                for name, column_type in NotionClient.REQUIRED_COLUMNS.items()
+            }
+        }
+        client.session.get.return_value = response
+        client.validate_database_schema()
+        client.validate_database_schema()
+        assert client.session.get.call_count == 1
+        
+        with patch(
+            "src.pipeline.utils.notion_client.time.monotonic",
+            return_value=time.monotonic() + NotionClient.SCHEMA_CACHE_TTL + 1
+        ):
+            client.validate_database_schema()
+        assert client.session.get.call_count == 2
+        
+    def test_clients_share_pooled_session(self):
+        """Test clients reuse one HTTP session unless one is injected."""
+        first = NotionClient(api_token="token-1", database_id="db-1")
+        second = NotionClient(api_token="token-2", database_id="db-2")
+        assert first.session is second.session
+        
+        session = Mock()
+        assert NotionClient(api_token="t", database_id="d", session=session).session is session
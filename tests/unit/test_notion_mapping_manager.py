@@ -9,6 +9,7 @@ from pathlib import Path
 from unittest.mock import mock_open, patch
 
 import pytest
+from pydantic import ValidationError
 
 from src.models.notion_mapping import NotionMapping
 from src.pipeline.utils.notion_mapping_manager import NotionMappingManager
@@ -74,9 +75,74 @@ class TestNotionMappingManager:
         # Load mappings
         manager = NotionMappingManager(mapping_file=temp_mapping_file)
         
-        assert len(manager._mappings) == 2
-        assert "content-1" in manager._mappings
-        assert manager._mappings["content-1"].notion_page_id == "page-1"
+        assert manager.get_stats()["total"] == 2
+        assert manager.get_notion_page_id("content-1") == "page-1"
+        assert manager.get_mapping("content-1").notion_page_id == "page-1"
+        
+    def test_load_mapping_is_lazy(self, temp_mapping_file, sample_mappings):
+        """Test NotionMapping objects are only built when accessed."""
+        with open(temp_mapping_file, "w") as f:
+            json.dump(sample_mappings, f)
+            
+        manager = NotionMappingManager(mapping_file=temp_mapping_file)
+        
+        # Column-backed lookups do not materialize records
+        assert manager.get_content_id("page-2") == "content-2"
+        assert manager.get_stats()["by_language"] == {"zh": 1, "ja": 1}
+        assert len(manager._mappings) == 0
+        
+        mapping = manager.get_mapping("content-2")
+        assert isinstance(mapping, NotionMapping)
+        assert manager.get_mapping("content-2") is mapping
+        assert list(manager._mappings) == ["content-2"]
+        
+    def test_save_mapping_keeps_unaccessed_entries(self, temp_mapping_file, sample_mappings):
+        """Test saving writes both materialized and untouched entries in order."""
+        with open(temp_mapping_file, "w") as f:
+            json.dump(sample_mappings, f)
+            
+        manager = NotionMappingManager(mapping_file=temp_mapping_file)
+        manager.update_sync_status("content-2", status_in_notion="OK")
+        
+        with open(temp_mapping_file, "r") as f:
+            data = json.load(f)
+            
+        assert [entry["content_id"] for entry in data] == ["content-1", "content-2"]
+        assert data[0] == sample_mappings[0]
+        assert data[1]["status_in_notion"] == "OK"
+        
+    def test_invalid_entry_is_kept_after_failed_validation(self, temp_mapping_file, sample_mappings):
+        """Test a malformed entry keeps failing validation without losing data."""
+        sample_mappings[1]["status_in_notion"] = "Archived"
+        with open(temp_mapping_file, "w") as f:
+            json.dump(sample_mappings, f)
+            
+        manager = NotionMappingManager(mapping_file=temp_mapping_file)
+        
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                manager.get_mapping("content-2")
+        assert manager.get_notion_page_id("content-2") == "page-2"
+        
+        # Later saves still succeed and write the malformed entry back unchanged
+        manager.update_sync_status("content-1", status_in_notion="OK")
+        
+        with open(temp_mapping_file, "r") as f:
+            data = json.load(f)
+            
+        assert data[0]["status_in_notion"] == "OK"
+        assert data[1] == sample_mappings[1]
+        
+    def test_load_mapping_without_orjson(self, temp_mapping_file, sample_mappings):
+        """Test loading falls back to the stdlib json parser."""
+        with open(temp_mapping_file, "w") as f:
+            json.dump(sample_mappings, f)
+            
+        with patch("havachat.utils.file_io.ORJSON_AVAILABLE", False):
+            manager = NotionMappingManager(mapping_file=temp_mapping_file)
+            
+        assert manager.get_stats()["total"] == 2
+        assert manager.get_mapping("content-2").status_in_notion == "Rejected"
         
     def test_load_mapping_invalid_json(self, temp_mapping_file):
         """Test handling of invalid JSON."""
@@ -366,3 +432,133 @@ class TestNotionMappingManager:
         assert stats["by_language"]["ja"] == 1
         assert stats["by_type"]["conversation"] == 1
         assert stats["by_type"]["story"] == 1
+        
+    def test_batch_defers_save_until_exit(self, mapping_manager, temp_mapping_file):
+        """Test batch() writes the mapping file once on exit."""
+        with patch.object(
+            mapping_manager, "save_mapping", wraps=mapping_manager.save_mapping
+        ) as mock_save:
+            with mapping_manager.batch():
+                for i in range(3):
+                    mapping_manager.add_mapping(
+                        content_id=f"content-{i}",
+                        notion_page_id=f"page-{i}",
+                        language="zh",
+                        level="HSK3",
+                        content_type="conversation",
+                        title=f"Test {i}"
+                    )
+                mapping_manager.update_sync_status("content-0", status_in_notion="OK")
+                assert mock_save.call_count == 0
+                
+            assert mock_save.call_count == 1
+            
+        with open(temp_mapping_file, "r") as f:
+            data = json.load(f)
+        assert len(data) == 3
+        
+    def test_batch_nested(self, mapping_manager):
+        """Test nested batch() blocks only save when the outermost exits."""
+        with patch.object(mapping_manager, "save_mapping") as mock_save:
+            with mapping_manager.batch():
+                with mapping_manager.batch():
+                    mapping_manager.delete_mapping("non-existent")
+                    mapping_manager.add_mapping(
+                        content_id="content-1",
+                        notion_page_id="page-1",
+                        language="zh",
+                        level="HSK3",
+                        content_type="conversation",
+                        title="Test"
+                    )
+                assert mock_save.call_count == 0
+            assert mock_save.call_count == 1
+            
+            # No pending changes: exiting an empty batch does not save
+            with mapping_manager.batch():
+                pass
+            assert mock_save.call_count == 1
+        
+    def test_add_mappings_saves_once(self, mapping_manager, temp_mapping_file):
+        """Test add_mappings() adds every mapping with one write."""
+        items = [
+            {
+                "content_id": f"content-{i}",
+                "notion_page_id": f"page-{i}",
+                "language": "zh",
+                "level": "HSK3",
+                "content_type": "conversation",
+                "title": f"Test {i}",
+            }
+            for i in range(3)
+        ]
+        with patch.object(
+            mapping_manager, "save_mapping", wraps=mapping_manager.save_mapping
+        ) as mock_save:
+            mappings = mapping_manager.add_mappings(items)
+            assert mock_save.call_count == 1
+            
+        assert [m.notion_page_id for m in mappings] == ["page-0", "page-1", "page-2"]
+        with open(temp_mapping_file, "r") as f:
+            assert len(json.load(f)) == 3
+        
+    def test_get_stats_empty(self, mapping_manager):
+        """Test statistics for a manager with no mappings."""
+        stats = mapping_manager.get_stats()
+        
+        assert stats == {
+            "total": 0,
+            "by_notion_status": {},
+            "by_local_status": {},
+            "by_language": {},
+            "by_type": {}
+        }
+        
+    def test_find_by_title_after_replace_and_delete(self, mapping_manager):
+        """Test title index stays in sync when mappings are replaced or deleted."""
+        mapping_manager.add_mapping(
+            content_id="content-1",
+            notion_page_id="page-1",
+            language="zh",
+            level="HSK3",
+            content_type="conversation",
+            title="Ordering Food"
+        )
+        mapping_manager.add_mapping(
+            content_id="content-1",
+            notion_page_id="page-1",
+            language="zh",
+            level="HSK3",
+            content_type="conversation",
+            title="Buying Tickets"
+        )
+        
+        assert mapping_manager.find_by_title("food") == []
+        assert len(mapping_manager.find_by_title("TICKETS")) == 1
+        
+        mapping_manager.delete_mapping("content-1")
+        assert mapping_manager.find_by_title("tickets") == []
+        
+    def test_columns_stay_aligned_after_delete(self, mapping_manager):
+        """Test lookups after deleting a mapping from the middle."""
+        for i in range(3):
+            mapping_manager.add_mapping(
+                content_id=f"content-{i}",
+                notion_page_id=f"page-{i}",
+                language="zh" if i != 2 else "ja",
+                level="HSK3",
+                content_type="conversation",
+                title=f"Title {i}"
+            )
+            
+        mapping_manager.delete_mapping("content-0")
+        mapping_manager.update_sync_status("content-2", status_in_notion="OK")
+        
+        assert mapping_manager.get_content_id("page-0") is None
+        assert mapping_manager.get_content_id("page-2") == "content-2"
+        assert [m.content_id for m in mapping_manager.find_by_title("title", language="ja")] == ["content-2"]
+        
+        stats = mapping_manager.get_stats()
+        assert stats["total"] == 2
+        assert stats["by_language"] == {"zh": 1, "ja": 1}
+        assert stats["by_notion_status"] == {"Not started": 1, "OK": 1}
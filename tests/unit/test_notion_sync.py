@@ -0,0 +1,79 @@
+"""
+Unit tests for NotionSyncCLI.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from havachat.cli import notion_sync
+from havachat.cli.notion_sync import NotionSyncCLI
+from src.pipeline.utils.notion_mapping_manager import NotionMappingManager
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Create a data directory with two conversations sharing a learning item."""
+    zh_hsk3 = tmp_path / "data" / "zh" / "HSK3"
+    zh_hsk3.mkdir(parents=True)
+    conversations = [
+        {"id": "conv-1", "learning_item_ids": ["item-1", "item-2"], "status": "generated"},
+        {"id": "conv-2", "learning_item_ids": ["item-1"], "status": "generated"},
+    ]
+    usage_stats = [
+        {"learning_item_id": "item-1", "appearances_count": 5},
+        {"learning_item_id": "item-2", "appearances_count": 0},
+        {"learning_item_id": "item-3", "appearances_count": 2},
+    ]
+    (zh_hsk3 / "conversations.json").write_text(json.dumps(conversations), encoding="utf-8")
+    (zh_hsk3 / "usage_stats.json").write_text(json.dumps(usage_stats), encoding="utf-8")
+    return tmp_path / "data"
+
+
+@pytest.fixture
+def sync_cli(data_dir, tmp_path):
+    """Create NotionSyncCLI with a mocked Notion client and two mapped conversations."""
+    with patch("havachat.cli.notion_sync.NotionClient") as mock_client:
+        cli = NotionSyncCLI(
+            notion_token="test-token",
+            database_id="test-db",
+            data_root=str(data_dir)
+        )
+    cli.mapping_manager = NotionMappingManager(mapping_file=str(tmp_path / "mapping.json"))
+    for i in (1, 2):
+        cli.mapping_manager.add_mapping(
+            content_id=f"conv-{i}",
+            notion_page_id=f"page-{i}",
+            language="zh",
+            level="HSK3",
+            content_type="conversation",
+            title=f"Conversation {i}"
+        )
+    cli.notion_client = mock_client.return_value
+    return cli
+
+
+def test_rejected_items_rewrite_each_file_once(sync_cli, data_dir):
+    """Test rejections are applied with one write per content and usage stats file."""
+    sync_cli.notion_client.fetch_status_changes.return_value = [
+        {"notion_page_id": "page-1", "status": "Rejected", "title": "Conversation 1"},
+        {"notion_page_id": "page-2", "status": "Rejected", "title": "Conversation 2"},
+    ]
+    usage_stats_file = data_dir / "zh" / "HSK3" / "usage_stats.json"
+    conversations_file = data_dir / "zh" / "HSK3" / "conversations.json"
+
+    with patch.object(notion_sync, "_write_json", wraps=notion_sync._write_json) as mock_write:
+        sync_cli.check_notion()
+
+    written = sorted(str(c.args[1]) for c in mock_write.call_args_list)
+    assert written == sorted([str(conversations_file), str(usage_stats_file)])
+
+    counts = {
+        stat["learning_item_id"]: stat["appearances_count"]
+        for stat in json.loads(usage_stats_file.read_text(encoding="utf-8"))
+    }
+    assert counts == {"item-1": 3, "item-2": 0, "item-3": 2}
+
+    conversations = json.loads(conversations_file.read_text(encoding="utf-8"))
+    assert [unit["status"] for unit in conversations] == ["rejected", "rejected"]
@@ -1,12 +1,16 @@
 """Unit tests for Pydantic schema models."""
 
+import json
+
 import pytest
 from datetime import datetime
+from uuid import UUID
 from pydantic import ValidationError
 
 from havachat.validators.schema import (
     LevelSystem,
     Category,
+    Example,
     ContentType,
     SegmentType,
     QuestionType,
@@ -22,6 +26,9 @@ from havachat.validators.schema import (
     UsageStats,
     FlaggedItem,
     ValidationReport,
+    LIST_QUESTION_ADAPTER,
+    batch_timestamp,
+    load_learning_items,
 )
 
 
@@ -49,6 +56,8 @@ class TestLearningItem:
         assert item.category == Category.VOCAB
         assert len(item.examples) == 3
         assert item.id is not None  # UUID generated
+        assert str(UUID(item.id)) == item.id
+        assert UUID(item.id).version == 4
 
     def test_learning_item_invalid_language_code(self):
         """Test that invalid language code raises validation error."""
@@ -65,6 +74,25 @@ class TestLearningItem:
             )
         assert "language" in str(exc_info.value)
 
+    @pytest.mark.parametrize("language,valid", [("ko", True), ("ZH", False), ("z1", False)])
+    def test_learning_item_language_code_format(self, language, valid):
+        """Test any two-letter lowercase code is accepted, not just known ones."""
+        data = {
+            "language": language,
+            "category": "vocab",
+            "target_item": "test",
+            "definition": "test",
+            "examples": [],
+            "level_system": "cefr",
+            "level_min": "A1",
+            "level_max": "A1",
+        }
+        if valid:
+            assert LearningItem(**data).language == language
+        else:
+            with pytest.raises(ValidationError):
+                LearningItem(**data)
+
     @pytest.mark.skip(reason="Examples count validation is currently disabled in schema")
     def test_learning_item_examples_too_few(self):
         """Test that fewer than 3 examples raises validation error."""
@@ -130,6 +158,78 @@ class TestLearningItem:
         assert item.pos == "particle"
         assert "ha" in item.aliases
 
+    def test_learning_item_frozen_and_rejects_unknown_fields(self):
+        """Test items are immutable and unknown fields are rejected."""
+        data = {
+            "language": "zh",
+            "category": "vocab",
+            "target_item": "银行",
+            "definition": "bank",
+            "examples": [{"text": "我去银行。", "translation": "I go to the bank."}],
+            "level_system": "hsk",
+            "level_min": "HSK1",
+            "level_max": "HSK1",
+        }
+        item = LearningItem(**data)
+
+        with pytest.raises(ValidationError):
+            item.target_item = "钱"
+        with pytest.raises(ValidationError):
+            LearningItem(**data, level="HSK1")
+
+
+    def test_learning_item_interns_level_codes(self):
+        """Test equal level codes parsed separately share one string object."""
+        payload = (
+            '{"language": "zh", "category": "vocab", "target_item": "x", '
+            '"definition": "x", "examples": [], "level_system": "hsk", '
+            '"level_min": "HSK%d", "level_max": "HSK%d"}'
+        )
+        first = LearningItem.model_validate(json.loads(payload % (4, 4)))
+        second = LearningItem.model_validate(json.loads(payload % (4, 4)))
+
+        assert first.level_min is second.level_min
+        assert first.level_min is first.level_max
+
+class TestExample:
+    """Test the Example dataclass."""
+
+    def test_example_built_directly_is_kept_as_is(self):
+        """Test an Example instance is stored in the item without re-validation."""
+        example = Example(text="我去银行。", translation="I go to the bank.")
+        item = LearningItem(
+            language="zh",
+            category=Category.VOCAB,
+            target_item="银行",
+            definition="bank",
+            examples=[example],
+            level_system=LevelSystem.HSK,
+            level_min="HSK1",
+            level_max="HSK1",
+        )
+
+        assert item.examples[0] is example
+        assert item.model_dump()["examples"] == [
+            {"text": "我去银行。", "translation": "I go to the bank.", "media_urls": ()}
+        ]
+
+    def test_example_dict_is_validated(self):
+        """Test examples given as dicts are validated and unknown keys rejected."""
+        base = {
+            "language": "zh",
+            "category": "vocab",
+            "target_item": "银行",
+            "definition": "bank",
+            "level_system": "hsk",
+            "level_min": "HSK1",
+            "level_max": "HSK1",
+        }
+        item = LearningItem(**base, examples=[{"text": "a", "translation": "b", "media_urls": ["x"]}])
+
+        assert item.examples == [Example(text="a", translation="b", media_urls=("x",))]
+        with pytest.raises(ValidationError):
+            LearningItem(**base, examples=[{"text": "a", "translation": "b", "audio": "x"}])
+
 
 class TestSegment:
     """Test Segment model validation."""
@@ -255,6 +355,210 @@ class TestContentUnit:
         assert content.segments[0].start_time_ms == 0
 
 
+class TestFromTrusted:
+    """Test from_trusted() builds the same models without validation."""
+
+    def test_learning_item_round_trip(self):
+        """Test a dumped learning item is rebuilt equal to the original."""
+        item = LearningItem(
+            language="zh",
+            category=Category.VOCAB,
+            target_item="银行",
+            definition="bank",
+            examples=[{"text": "我去银行。", "translation": "I go to the bank."}],
+            level_system=LevelSystem.HSK,
+            level_min="HSK1",
+            level_max="HSK1",
+        )
+
+        rebuilt = LearningItem.from_trusted(item.model_dump(mode="json"))
+
+        assert rebuilt == item
+        assert rebuilt.category is Category.VOCAB
+        assert rebuilt.examples[0].text == "我去银行。"
+
+    def test_content_unit_round_trip(self):
+        """Test a dumped content unit is rebuilt equal to the original."""
+        content = ContentUnit(
+            language="fr",
+            type=ContentType.CONVERSATION,
+            title="Greeting",
+            description="A simple greeting",
+            text="Bonjour!",
+            segments=[Segment(speaker="A", text="Bonjour!", learning_item_ids=["item-1"])],
+            speakers=[{"id": "A", "name": "Alice", "role": "Student"}],
+            learning_item_ids=["item-1"],
+            level_system=LevelSystem.CEFR,
+            level_min="A1",
+            level_max="A1",
+        )
+
+        rebuilt = ContentUnit.from_trusted(content.model_dump(mode="json"))
+
+        assert rebuilt == content
+        assert rebuilt.segments[0].learning_item_ids == ("item-1",)
+        assert rebuilt.model_dump() == content.model_dump()
+
+    def test_content_unit_partial_data_gets_defaults(self):
+        """Test trusted data missing optional fields still gets their defaults."""
+        content = ContentUnit.from_trusted(
+            {
+                "language": "fr",
+                "type": "story",
+                "title": "Story",
+                "description": "A story",
+                "text": "Il était une fois.",
+                "segments": [{"text": "Il était une fois.", "learning_item_ids": []}],
+                "learning_item_ids": [],
+                "level_system": "cefr",
+                "level_min": "A1",
+                "level_max": "A1",
+            }
+        )
+
+        assert content.has_audio is False
+        assert content.topic_ids == ()
+        assert content.segments[0].speaker is None
+        assert content.id
+
+    def test_content_unit_skips_model_validators(self):
+        """Test trusted data is not re-checked by the model validators."""
+        data = {
+            "language": "fr",
+            "type": "story",
+            "title": "Story",
+            "description": "A story",
+            "text": "Il était une fois.",
+            "segments": [{"text": "Il était une fois.", "learning_item_ids": ["item-1"]}],
+            "learning_item_ids": [],
+            "level_system": "cefr",
+            "level_min": "A1",
+            "level_max": "A1",
+            "has_audio": True,
+        }
+
+        content = ContentUnit.from_trusted(data)
+
+        assert content.type is ContentType.STORY
+        with pytest.raises(ValidationError):
+            ContentUnit.model_validate(data)
+
+    def test_question_round_trip(self):
+        """Test a dumped MCQ question is rebuilt equal to the original."""
+        question = Question(
+            content_id="content-1",
+            question_type=QuestionType.MCQ,
+            question_text="What is Alice's name?",
+            options=[
+                MCQOption(option_id=option_id, text=option_id)
+                for option_id in "ABCD"
+            ],
+            answer_key="A",
+            rationale="Stated directly.",
+            difficulty=Difficulty.EASY,
+            tags=["detail"],
+        )
+
+        rebuilt = Question.from_trusted(question.model_dump(mode="json"))
+
+        assert rebuilt == question
+
+    def test_validation_report_round_trip(self):
+        """Test a dumped validation report is rebuilt equal to the original."""
+        report = ValidationReport(
+            language="fr",
+            level="A1",
+            total_items=1,
+            passed_count=0,
+            failed_count=1,
+            flagged_items=[
+                FlaggedItem(
+                    item_id="item-1",
+                    item_type="learning_item",
+                    failure_type=FailureType.DUPLICATION,
+                    failure_reason="Duplicate target_item",
+                )
+            ],
+            summary_stats={},
+        )
+
+        rebuilt = ValidationReport.from_trusted(report.model_dump(mode="json"))
+
+        assert rebuilt == report
+
+
+class TestBulkValidators:
+    """Test the module-level list validators."""
+
+    ITEM = {
+        "language": "zh",
+        "category": "vocab",
+        "target_item": "银行",
+        "definition": "bank",
+        "examples": [{"text": "我去银行。", "translation": "I go to the bank."}],
+        "level_system": "hsk",
+        "level_min": "HSK1",
+        "level_max": "HSK1",
+    }
+
+    def test_load_learning_items_array(self):
+        """Test a JSON array is validated into a list of items."""
+        payload = json.dumps([self.ITEM, {**self.ITEM, "target_item": "钱"}]).encode()
+
+        items = load_learning_items(payload)
+
+        assert [item.target_item for item in items] == ["银行", "钱"]
+        assert all(isinstance(item, LearningItem) for item in items)
+
+    def test_load_learning_items_single_object(self):
+        """Test a single JSON object is returned as a one-item list."""
+        items = load_learning_items(json.dumps(self.ITEM).encode())
+
+        assert len(items) == 1
+        assert items[0].category == Category.VOCAB
+
+    def test_load_learning_items_invalid(self):
+        """Test an invalid item in the batch raises ValidationError."""
+        payload = json.dumps([self.ITEM, {**self.ITEM, "language": "zho"}]).encode()
+
+        with pytest.raises(ValidationError):
+            load_learning_items(payload)
+
+    def test_question_adapter_runs_model_validator(self):
+        """Test the list adapter still applies Question's type constraints."""
+        rows = [
+            {
+                "content_id": "content-1",
+                "question_type": "mcq",
+                "question_text": "Pick one",
+                "options": [{"option_id": "A", "text": "A"}],
+                "answer_key": "A",
+                "rationale": "Only one option",
+                "difficulty": "easy",
+                "tags": [],
+            }
+        ]
+
+        with pytest.raises(ValidationError):
+            LIST_QUESTION_ADAPTER.validate_python(rows)
+
+
+class TestBatchTimestamp:
+    """Test batch_timestamp() shares one default timestamp."""
+
+    def test_models_in_batch_share_timestamp(self):
+        """Test defaults inside the block share one timestamp, outside do not."""
+        with batch_timestamp() as now:
+            first = Scenario(id="a", name="A", topic_id="t", description="d")
+            second = Scenario(id="b", name="B", topic_id="t", description="d")
+
+        after = Scenario(id="c", name="C", topic_id="t", description="d")
+
+        assert first.created_at is now
+        assert second.updated_at is now
+        assert after.created_at is not now
+
+
 class TestMCQOption:
     """Test MCQOption model validation."""
 
@@ -398,6 +702,29 @@ class TestScenario:
         assert scenario.formality == "informal"
         assert scenario.usage_count == 0  # Default value
 
+    def test_scenario_embedding_round_trip(self):
+        """Test embeddings stay float lists on the wire and pack to float32."""
+        scenario = Scenario(
+            id="ordering-at-restaurant",
+            name="Ordering Food at a Restaurant",
+            topic_id="food",
+            description="Interacting with a server to order food",
+            embedding=[0.5, -1.25, 2.0],
+        )
+
+        vector = scenario.embedding_vector()
+        assert vector.typecode == "f"
+        assert vector.tolist() == [0.5, -1.25, 2.0]
+
+        data = scenario.model_dump(mode="json")
+        assert data["embedding"] == [0.5, -1.25, 2.0]
+        assert Scenario.model_validate(data) == scenario
+        assert Scenario.model_validate_json(scenario.model_dump_json()) == scenario
+        assert Scenario.from_trusted(data).embedding == scenario.embedding
+
+        schema = Scenario.model_json_schema()["properties"]["embedding"]
+        assert {"type": "array", "items": {"type": "number"}} in schema["anyOf"]
+
 
 class TestUsageStats:
     """Test UsageStats model validation."""
@@ -413,6 +740,16 @@ class TestUsageStats:
         assert stats.appearances_count == 5
         assert stats.last_updated is not None
 
+    def test_usage_stats_model_dump(self):
+        """Test the dataclass still dumps to a plain dict."""
+        stats = UsageStats(learning_item_id="item-1", appearances_count=2)
+
+        dumped = stats.model_dump()
+
+        assert dumped["learning_item_id"] == "item-1"
+        assert dumped["appearances_count"] == 2
+        assert dumped["last_used_content_id"] is None
+
 
 class TestFlaggedItem:
     """Test FlaggedItem model validation."""
@@ -458,6 +795,56 @@ class TestValidationReport:
         assert len(report.flagged_items) == 1
         assert report.batch_id is not None  # UUID generated
 
+    def test_validation_report_validates_flagged_item_dicts(self):
+        """Test flagged items given as dicts are validated into FlaggedItem."""
+        report = ValidationReport(
+            language="fr",
+            level="A1",
+            total_items=1,
+            passed_count=0,
+            failed_count=1,
+            flagged_items=[
+                {
+                    "item_id": "item-1",
+                    "item_type": "learning_item",
+                    "failure_type": "duplication",
+                    "failure_reason": "Duplicate target_item",
+                }
+            ],
+            summary_stats={},
+        )
+
+        assert isinstance(report.flagged_items[0], FlaggedItem)
+        assert report.flagged_items[0].failure_type is FailureType.DUPLICATION
+        assert report.model_dump(mode="json")["flagged_items"][0]["failure_type"] == "duplication"
+
+
+class TestJsonSchemaExamples:
+    """Test example payloads are still attached to generated JSON schemas."""
+
+    @pytest.mark.parametrize("model", [LearningItem, ContentUnit, Question, ValidationReport])
+    def test_schema_includes_example(self, model):
+        """Test the example is added when the schema is generated."""
+        example = model.model_json_schema()["example"]
+
+        assert model.model_validate(example)
+
+    def test_schema_without_example(self):
+        """Test models without an example payload get no example key."""
+        assert "example" not in MCQOption.model_json_schema()
+
+    @pytest.mark.parametrize(
+        "model,field,pattern",
+        [
+            (LearningItem, "language", "^[a-z]{2}$"),
+            (ContentUnit, "language", "^[a-z]{2}$"),
+            (MCQOption, "option_id", "^[A-D]$"),
+        ],
+    )
+    def test_schema_keeps_field_patterns(self, model, field, pattern):
+        """Test code fields still advertise their pattern in the JSON schema."""
+        assert model.model_json_schema()["properties"][field]["pattern"] == pattern
+
 
 class TestEnums:
     """Test enum values."""
@@ -0,0 +1,158 @@
+"""Unit tests for learning item usage tracking."""
+
+import json
+
+import pytest
+
+from havachat.utils.usage_tracker import UsageTracker
+
+
+@pytest.fixture
+def stats_file(tmp_path):
+    """Path for a usage_stats.json file that does not exist yet."""
+    return tmp_path / "zh" / "HSK1" / "usage_stats.json"
+
+
+@pytest.fixture
+def tracker(stats_file):
+    """Create an empty usage tracker."""
+    return UsageTracker(stats_file)
+
+
+def test_increment_dedupes_content_unit_ids(tracker):
+    """Test repeated appearances in one content unit are recorded once."""
+    tracker.increment_appearances("item-1", "content-1")
+    tracker.increment_appearances("item-1", "content-1")
+    tracker.increment_appearances("item-1", "content-2")
+
+    entry = tracker.stats["item-1"]
+    assert entry["appearances_count"] == 3
+    assert entry["content_unit_ids"] == {"content-1", "content-2"}
+
+
+def test_save_and_load_round_trip(tracker, stats_file):
+    """Test content unit IDs are saved as sorted lists and reloaded as sets."""
+    tracker.update_batch("content-b", ["item-1", "item-2"])
+    tracker.update_batch("content-a", ["item-1"])
+    tracker.save_stats()
+
+    with open(stats_file, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    assert data["item-1"]["content_unit_ids"] == ["content-a", "content-b"]
+
+    reloaded = UsageTracker(stats_file)
+    assert reloaded.stats["item-1"]["content_unit_ids"] == {"content-a", "content-b"}
+    assert reloaded.stats["item-2"]["appearances_count"] == 1
+
+
+def test_usage_report_counts_buckets_and_categories(tracker):
+    """Test report totals track bucket boundary crossings."""
+    for i in range(11):
+        tracker.increment_appearances("item-over", f"content-{i}")
+    for i in range(3):
+        tracker.increment_appearances("item-well", f"content-{i}")
+    tracker.increment_appearances("item-under", "content-0")
+
+    report = tracker.get_usage_report()
+
+    assert report["total_items"] == 3
+    assert report["total_appearances"] == 15
+    assert report["unused_items"] == 0
+    assert report["underutilized_items"] == 1
+    assert report["well_utilized_items"] == 1
+    assert report["overused_items"] == 1
+    assert report["by_category"] == {
+        "unknown": {"count": 3, "total_appearances": 15, "avg_appearances": 5.0}
+    }
+
+
+def test_usage_report_matches_after_reload(tracker, stats_file):
+    """Test totals rebuilt on load match the incrementally maintained ones."""
+    for i in range(4):
+        tracker.update_batch(f"content-{i}", ["item-1", "item-2"][: i % 2 + 1])
+    tracker.save_stats()
+
+    reloaded = UsageTracker(stats_file)
+
+    assert reloaded.get_usage_report() == tracker.get_usage_report()
+
+
+def test_get_underutilized_and_overused_items_with_limit(stats_file):
+    """Test limited queries return the same head as the full sorted lists."""
+    stats_file.parent.mkdir(parents=True)
+    stats_file.write_text(
+        json.dumps({
+            f"item-{item_index}": {
+                "item_id": f"item-{item_index}",
+                "target_item": f"item-{item_index}",
+                "category": "vocab",
+                "appearances_count": count,
+                "content_unit_ids": [],
+            }
+            for item_index, count in enumerate([0, 1, 2, 12, 15, 11])
+        }),
+        encoding="utf-8",
+    )
+    tracker = UsageTracker(stats_file)
+
+    underutilized = tracker.get_underutilized_items()
+    overused = tracker.get_overused_items()
+
+    assert [i["appearances_count"] for i in underutilized] == [0, 1, 2]
+    assert [i["appearances_count"] for i in overused] == [15, 12, 11]
+    assert tracker.get_underutilized_items(limit=2) == underutilized[:2]
+    assert tracker.get_overused_items(limit=2) == overused[:2]
+
+
+def test_get_items_returns_serializable_copies(tracker):
+    """Test query results hold sorted lists and do not share tracker state."""
+    tracker.update_batch("content-b", ["item-1"])
+    tracker.update_batch("content-a", ["item-1"])
+
+    [item] = tracker.get_underutilized_items()
+    assert item["content_unit_ids"] == ["content-a", "content-b"]
+    json.dumps(item)
+
+    item["content_unit_ids"].append("content-c")
+    assert tracker.stats["item-1"]["content_unit_ids"] == {"content-a", "content-b"}
+
+
+def test_stats_returns_copies(tracker):
+    """Test changing the stats copy leaves the tracker and its report untouched."""
+    tracker.update_batch("content-1", ["item-1"])
+    report = tracker.get_usage_report()
+
+    stats = tracker.stats
+    stats["item-1"]["appearances_count"] = 20
+    stats["item-1"]["content_unit_ids"].add("content-2")
+    stats["item-2"] = {}
+
+    assert tracker.stats["item-1"]["appearances_count"] == 1
+    assert tracker.stats["item-1"]["content_unit_ids"] == {"content-1"}
+    assert tracker.get_usage_report() == report
+
+
+def test_malformed_stats_file_starts_empty(stats_file):
+    """Test an unreadable stats file is logged and the tracker starts empty."""
+    stats_file.parent.mkdir(parents=True)
+    stats_file.write_text(json.dumps({"item-1": {"item_id": "item-1"}}), encoding="utf-8")
+
+    tracker = UsageTracker(stats_file)
+
+    assert tracker.stats == {}
+    assert tracker.get_usage_report()["total_items"] == 0
+
+
+def test_read_only_tracker_reports_without_updates(tracker, stats_file):
+    """Test a read-only tracker loads stats for reporting and rejects writes."""
+    tracker.update_batch("content-1", ["item-1", "item-2"])
+    tracker.save_stats()
+
+    reader = UsageTracker(stats_file, read_only=True)
+
+    assert reader.get_usage_report() == tracker.get_usage_report()
+    assert reader.stats["item-1"]["content_unit_ids"] == ["content-1"]
+    with pytest.raises(RuntimeError):
+        reader.increment_appearances("item-1", "content-2")
+    with pytest.raises(RuntimeError):
+        reader.save_stats()
@@ -0,0 +1,106 @@
+"""Unit tests for voice configuration validation."""
+
+import json
+import os
+
+import pytest
+
+from havachat.validators.voice_validator import (
+    VoiceConfigValidator,
+    validate_voice_config,
+)
+
+
+def _voice(voice_id, languages, voice_type="single", gender="female"):
+    return {
+        "voice_id": voice_id,
+        "name": voice_id,
+        "type": voice_type,
+        "gender": gender,
+        "description": "test voice",
+        "supported_languages": languages,
+    }
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    """Directory with a voice_config_zh.json holding one voice."""
+    VoiceConfigValidator.clear_cache()
+    (tmp_path / "voice_config_zh.json").write_text(
+        json.dumps({"voices": [_voice("elevenlabs/a", ["zh"])]}), encoding="utf-8"
+    )
+    yield tmp_path
+    VoiceConfigValidator.clear_cache()
+
+
+def test_validators_share_cached_config(config_dir):
+    """Test validators for the same file reuse one parsed collection."""
+    first = VoiceConfigValidator("zh", config_dir)
+    second = VoiceConfigValidator("zh", config_dir)
+
+    assert first.config is second.config
+    assert validate_voice_config("elevenlabs/a", "zh", config_dir) == (True, "")
+
+
+def test_cache_reloads_when_file_changes(config_dir):
+    """Test an edited config file is re-read on the next load."""
+    config_path = config_dir / "voice_config_zh.json"
+    VoiceConfigValidator("zh", config_dir)
+
+    config_path.write_text(
+        json.dumps({"voices": [_voice("elevenlabs/b", ["zh"])]}), encoding="utf-8"
+    )
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    is_valid, _ = validate_voice_config("elevenlabs/b", "zh", config_dir)
+    assert is_valid
+
+
+def test_index_lookups_match_collection_scans(tmp_path):
+    """Test indexed lookups agree with the VoiceConfigCollection filters."""
+    VoiceConfigValidator.clear_cache()
+    voices = [
+        _voice("s/f", ["zh", "en"]),
+        _voice("s/m", ["zh"], gender="male"),
+        _voice("c/f1", ["zh"], "conversation"),
+        _voice("c/m", ["zh", "ja"], "conversation", "male"),
+        _voice("c/f2", ["zh"], "conversation"),
+    ]
+    (tmp_path / "voice_config_zh.json").write_text(
+        json.dumps({"voices": voices}), encoding="utf-8"
+    )
+    validator = VoiceConfigValidator("zh", tmp_path)
+    config = validator.config
+
+    for gender in ("male", "female", None):
+        expected = config.get_conversation_voices("zh", gender)
+        assert validator._conversation_voices(gender) == expected
+    assert validator.get_single_voice_for_language("male").voice_id == "s/m"
+    assert validator.get_single_voice_for_language().voice_id == "s/f"
+    assert validator.get_single_voice_for_language("any") is None
+    assert validator.validate_conversation_config(["female", "male"]) == (True, "")
+    assert validator.validate_voice_config("c/m") == (True, "")
+    assert validator.validate_voice_config("missing")[0] is False
+    assert validator.get_all_languages() == ["en", "ja", "zh"]
+    mapping = validator.get_conversation_voices_for_speakers(["female", "female"])
+    assert set(mapping.values()) == {"c/f1", "c/f2"}
+    VoiceConfigValidator.clear_cache()
+
+
+def test_speaker_voices_reuse_only_when_gender_runs_out(config_dir):
+    """Test speakers without a voice are skipped and a lone voice is reused."""
+    (config_dir / "voice_config_ja.json").write_text(
+        json.dumps({"voices": [_voice("c/f", ["ja"], "conversation")]}), encoding="utf-8"
+    )
+    validator = VoiceConfigValidator("ja", config_dir)
+
+    mapping = validator.get_conversation_voices_for_speakers(["female", "male", "female"])
+
+    assert mapping == {"A": "c/f", "C": "c/f"}
+
+
+def test_missing_config_raises(tmp_path):
+    """Test a missing config file is reported with FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        VoiceConfigValidator("ja", tmp_path)